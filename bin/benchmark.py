@@ -0,0 +1,572 @@
+#!/usr/bin/env python3
+"""Time the hot paths of edit-python-pe over a synthetic python.pe copy.
+
+Save a baseline, then compare later runs against it::
+
+    uv run ./bin/benchmark.py --save baseline.json
+    uv run ./bin/benchmark.py --compare baseline.json
+
+With ``--ui``, a headless MemberApp run through Textual's ``run_test``
+is timed instead, over copies of each of ``--sizes`` members: picking a
+member until its form is filled (``clear_form`` and
+``load_file_into_form``), adding ``--rows`` social rows, deleting them,
+and going back to the list. Every interaction is timed until the screen
+has been refreshed, each row added or deleted being one sample, over
+``--ui-repeat`` runs; the results give their percentiles.
+
+A benchmark whose median is slower than the baseline's by more than
+``--threshold`` is reported as a regression and the exit status is 1.
+Baselines only compare on the same machine and the same options.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+from contextlib import ExitStack, contextmanager
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from time import perf_counter
+from typing import Callable, Iterator
+from unittest.mock import patch
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src"))
+)
+import pygit2
+from textual.app import App
+
+from edit_python_pe.authors import author_line
+from edit_python_pe.constants import (BITBUCKET_OPTION, GITHUB_OPTION,
+                                      GITLAB_OPTION, LINKEDIN_OPTION, X_OPTION,
+                                      YOUTUBE_OPTION)
+from edit_python_pe.main import MemberApp
+from edit_python_pe.parser import parse_member, parse_member_files
+from edit_python_pe.utils import (ProfileChange, _add_authors, _commit_profile,
+                                  _compute_file_name, _member_path, _push,
+                                  build_md_content)
+
+BASELINE_VERSION = 1
+
+# Platforms cycled through for the synthetic social links
+PLATFORMS = [
+    option[1]
+    for option in (
+        GITHUB_OPTION,
+        GITLAB_OPTION,
+        BITBUCKET_OPTION,
+        LINKEDIN_OPTION,
+        X_OPTION,
+        YOUTUBE_OPTION,
+    )
+]
+
+# Repeated to fill each "about me" section up to --text-size characters
+FILLER = "Programo en Python y me gusta compartir lo que aprendo. "
+
+SIGNATURE = pygit2.Signature("Benchmark", "benchmark@example.com")
+
+
+@dataclass
+class Options:
+    members: int
+    socials: int
+    text_size: int
+    repeat: int
+    sizes: list[int]
+    rows: int
+    ui_repeat: int
+
+
+@dataclass
+class Member:
+    name: str
+    alias: str
+    email: str
+    file_name: str
+    socials: list[tuple[str, str]]
+    text: str
+
+    def content(self) -> str:
+        return build_md_content(
+            self.name,
+            self.email,
+            [self.alias],
+            self.socials,
+            "Lima",
+            f"https://{self.alias}.example.com",
+            self.text,
+            self.text,
+            self.text,
+            self.text,
+        )
+
+
+def _members(options: Options, count: int) -> list[Member]:
+    text = (FILLER * (options.text_size // len(FILLER) + 1))[
+        : options.text_size
+    ]
+    members = []
+    for number in range(count):
+        alias = f"miembro{number}"
+        email = f"{alias}@example.com"
+        members.append(
+            Member(
+                name=f"Miembro {number}",
+                alias=alias,
+                email=email,
+                file_name=_compute_file_name([alias], alias, email),
+                socials=[
+                    (
+                        PLATFORMS[i % len(PLATFORMS)],
+                        f"https://example.com/{alias}/{i}",
+                    )
+                    for i in range(options.socials)
+                ],
+                text=text,
+            )
+        )
+    return members
+
+
+def create_repository(path: str, members: list[Member]) -> str:
+    """Write a python.pe-shaped checkout with a bare ``origin`` next to it."""
+    repo_path = os.path.join(path, "python.pe")
+    members_path = os.path.join(repo_path, "blog", "members")
+    os.makedirs(members_path)
+    for member in members:
+        # python.pe opens the links block with {raw}, as parse_member expects
+        content = member.content().replace("{{raw}}", "{raw}")
+        with open(
+            os.path.join(members_path, member.file_name), "w", encoding="utf-8"
+        ) as fd:
+            fd.write(content)
+    with open(os.path.join(repo_path, "AUTHORS"), "w", encoding="utf-8") as fd:
+        fd.write(
+            "\n".join(
+                author_line(member.name, member.alias, member.email)
+                for member in members
+            )
+        )
+
+    repo = pygit2.init_repository(repo_path, initial_head="main")
+    repo.index.add_all()
+    repo.index.write()
+    tree = repo.index.write_tree()
+    repo.create_commit(
+        "HEAD", SIGNATURE, SIGNATURE, "Synthetic python.pe", tree, []
+    )
+    remote_path = os.path.join(path, "origin.git")
+    pygit2.init_repository(remote_path, bare=True, initial_head="main")
+    repo.remotes.create("origin", remote_path)
+    repo.remotes["origin"].push(["refs/heads/main"])
+    return repo_path
+
+
+def _timed(func: Callable[[int], object]) -> Callable[[int], float]:
+    def run(iteration: int) -> float:
+        started = perf_counter()
+        func(iteration)
+        return perf_counter() - started
+
+    return run
+
+
+def bench_build_md_content(
+    repo_path: str, members: list[Member]
+) -> Callable[[int], float]:
+    return _timed(lambda _: [member.content() for member in members])
+
+
+def bench_parse_member(
+    repo_path: str, members: list[Member]
+) -> Callable[[int], float]:
+    contents = []
+    for member in members:
+        path = os.path.join(repo_path, _member_path(member.file_name))
+        with open(path, encoding="utf-8") as fd:
+            contents.append(fd.read())
+    return _timed(lambda _: [parse_member(content) for content in contents])
+
+
+def bench_parse_member_files(
+    repo_path: str, members: list[Member]
+) -> Callable[[int], float]:
+    paths = [
+        os.path.join(repo_path, _member_path(member.file_name))
+        for member in members
+    ]
+    return _timed(lambda _: list(parse_member_files(paths)))
+
+
+async def _settle(app: App, done: Callable[[], bool]) -> None:
+    """Wait for ``done``, then for the screen to be refreshed.
+
+    Not ``Pilot.pause``: it waits for the process to look idle in 20 ms
+    steps, which would be most of what is measured.
+    """
+    while not done():
+        await asyncio.sleep(0)
+    refreshed = asyncio.get_running_loop().create_future()
+    app.call_after_refresh(refreshed.set_result, None)
+    await refreshed
+
+
+def _started(app: MemberApp, count: int) -> Callable[[], bool]:
+    """Whether the list is full and the widgets mounted after it are up.
+
+    Leaving the app while the language selector mounts fails inside
+    Textual, so no run ends before.
+    """
+    return lambda: (
+        app.member_list.member_count == count
+        and app.form_built
+        and app.language_select.is_mounted
+    )
+
+
+async def _populate_list(repo_path: str, count: int) -> float:
+    app = MemberApp(None, None, "", repo_path, offline=True)
+    started = perf_counter()
+    async with app.run_test():
+        await _settle(app, lambda: app.member_list.member_count == count)
+        elapsed = perf_counter() - started
+        await _settle(app, _started(app, count))
+        await app.workers.wait_for_complete()
+    return elapsed
+
+
+def bench_populate_list(
+    repo_path: str, members: list[Member]
+) -> Callable[[int], float]:
+    return lambda _: asyncio.run(_populate_list(repo_path, len(members)))
+
+
+def bench_add_authors(
+    repo_path: str, members: list[Member]
+) -> Callable[[int], float]:
+    with open(os.path.join(repo_path, "AUTHORS"), encoding="utf-8") as fd:
+        contents = fd.read()
+    # A new author each time, so every run adds a line
+    return _timed(
+        lambda i: _add_authors(
+            contents,
+            [([f"nuevo{i}"], f"Nuevo {i}", f"nuevo{i}@example.com")],
+        )
+    )
+
+
+def bench_commit_and_push_branch(
+    repo_path: str, members: list[Member]
+) -> Callable[[int], float]:
+    member = members[0]
+    content = member.content()
+
+    # What saving does short of GitHub: commit on the profile branch, then
+    # push that branch
+    def commit_and_push(iteration: int) -> None:
+        change = ProfileChange(
+            member.file_name,
+            f"{content}\nEdición {iteration}\n",
+            True,
+            [member.alias],
+            member.name,
+            member.email,
+        )
+        _commit_profile(repo_path, change)
+        ref_name = f"refs/heads/{change.branch}"
+        _push(repo_path, "", [f"+{ref_name}:{ref_name}"])
+
+    return _timed(commit_and_push)
+
+
+BENCHMARKS: dict[
+    str, Callable[[str, list[Member]], Callable[[int], float]]
+] = {
+    "build_md_content": bench_build_md_content,
+    "parse_member": bench_parse_member,
+    "parse_member_files": bench_parse_member_files,
+    "populate_list": bench_populate_list,
+    "add_authors": bench_add_authors,
+    "commit_and_push_branch": bench_commit_and_push_branch,
+}
+
+
+# Timed on every --ui run; the row ones once per row added or deleted
+UI_INTERACTIONS = (
+    "select_member",
+    "add_social_row",
+    "delete_social_row",
+    "back_to_list",
+)
+
+
+async def _ui_latencies(
+    repo_path: str, members: list[Member], options: Options
+) -> dict[str, list[float]]:
+    names = {member.file_name: member.name for member in members}
+    latencies: dict[str, list[float]] = {name: [] for name in UI_INTERACTIONS}
+    app = MemberApp(None, None, "", repo_path, offline=True)
+
+    async def timed(
+        name: str,
+        action: Callable[[], object],
+        done: Callable[[], bool],
+        counted: bool,
+    ) -> None:
+        started = perf_counter()
+        action()
+        await _settle(app, done)
+        if counted:
+            latencies[name].append(perf_counter() - started)
+
+    async with app.run_test():
+        await _settle(app, _started(app, len(members)))
+        # Labels from the index would otherwise arrive in the middle of a run
+        await app.workers.wait_for_complete()
+        filenames = app.member_list.filenames
+        for run in range(options.ui_repeat + 1):
+            # The first run mounts the rows the others reuse, and is not
+            # counted
+            counted = run > 0
+            # A different member each time, spread through the list
+            index = run * len(filenames) // (options.ui_repeat + 1)
+            filename = filenames[index]
+            app.member_list.highlighted = index
+            await _settle(app, lambda: True)
+
+            # Actions and presses are what keys and clicks end up calling,
+            # without Pilot's waits for the process to look idle
+            await timed(
+                "select_member",
+                app.member_list.action_select,
+                lambda: app.form_container.display
+                and app.name_input.value == names[filename],
+                counted,
+            )
+            first = len(app.social_entries)
+            for count in range(first + 1, first + options.rows + 1):
+                await timed(
+                    "add_social_row",
+                    app.add_social_button.press,
+                    lambda: len(app.social_entries) == count,
+                    counted,
+                )
+            for row in list(app.social_entries)[first:]:
+                await timed(
+                    "delete_social_row",
+                    row.delete_btn.press,
+                    lambda: app.social_entries.get(row.index) is None,
+                    counted,
+                )
+            await timed(
+                "back_to_list",
+                app.back_button.press,
+                lambda: app.list_container.display,
+                counted,
+            )
+    return latencies
+
+
+def summarize(runs: list[float]) -> dict:
+    # quantiles() needs two runs; a single one is every percentile
+    cuts = (
+        statistics.quantiles(runs, n=100, method="inclusive")
+        if len(runs) > 1
+        else runs * 99
+    )
+    return {
+        "runs": runs,
+        "min": min(runs),
+        "median": statistics.median(runs),
+        "p90": cuts[89],
+        "p99": cuts[98],
+        "max": max(runs),
+    }
+
+
+@contextmanager
+def _app_files_in(path: str) -> Iterator[None]:
+    """Keep the caches and the outbox of the app under ``path``."""
+    with ExitStack() as stack:
+        for target, file_name in (
+            ("get_index_path", "members-index.json"),
+            ("get_pull_cache_path", "pull-requests.json"),
+            ("get_session_path", "session.json"),
+            ("get_outbox_path", "outbox"),
+        ):
+            stack.enter_context(
+                patch(
+                    f"edit_python_pe.main.{target}",
+                    return_value=os.path.join(path, file_name),
+                )
+            )
+        yield
+
+
+def run_ui_benchmarks(options: Options) -> dict[str, dict]:
+    members = _members(options, max(options.sizes))
+    results = {}
+    with tempfile.TemporaryDirectory() as path:
+        for size in options.sizes:
+            print(f"running the UI over {size} members...", file=sys.stderr)
+            size_path = os.path.join(path, str(size))
+            with _app_files_in(size_path):
+                repo_path = create_repository(size_path, members[:size])
+                latencies = asyncio.run(
+                    _ui_latencies(repo_path, members[:size], options)
+                )
+            for name, runs in latencies.items():
+                results[f"{name}@{size}"] = summarize(runs)
+    return results
+
+
+def run_benchmarks(options: Options, names: list[str]) -> dict[str, dict]:
+    members = _members(options, options.members)
+    results = {}
+    with tempfile.TemporaryDirectory() as path, _app_files_in(path):
+        repo_path = create_repository(path, members)
+        for name in names:
+            print(f"running {name}...", file=sys.stderr)
+            run = BENCHMARKS[name](repo_path, members)
+            # The first run warms file and import caches, and is not counted
+            run(0)
+            runs = [run(i) for i in range(1, options.repeat + 1)]
+            results[name] = summarize(runs)
+    return results
+
+
+def print_results(results: dict[str, dict]) -> None:
+    columns = ("min", "median", "p90", "p99", "max")
+    print(f"{'benchmark':<26}" + "".join(f" {key:>12}" for key in columns))
+    for name, result in results.items():
+        print(
+            f"{name:<26}"
+            + "".join(f" {result[key] * 1000:9.1f} ms" for key in columns)
+        )
+
+
+def compare(
+    baseline: dict, results: dict[str, dict], threshold: float
+) -> list[str]:
+    """Print each benchmark next to its baseline; return the regressions."""
+    regressions = []
+    print(f"{'benchmark':<26} {'baseline':>12} {'current':>12} {'change':>8}")
+    for name, result in results.items():
+        before = baseline["results"].get(name)
+        if before is None:
+            print(f"{name:<26} {'-':>12} {result['median'] * 1000:9.1f} ms")
+            continue
+        change = result["median"] / before["median"] - 1
+        flag = ""
+        if change > threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(
+            f"{name:<26} {before['median'] * 1000:9.1f} ms"
+            f" {result['median'] * 1000:9.1f} ms {change:+8.1%}{flag}"
+        )
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--members", type=int, default=10000)
+    parser.add_argument(
+        "--socials", type=int, default=3, help="social links per member"
+    )
+    parser.add_argument(
+        "--text-size",
+        type=int,
+        default=500,
+        help='characters in each "about me" section',
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--only",
+        action="append",
+        choices=list(BENCHMARKS),
+        help="run this benchmark only, may be repeated",
+    )
+    parser.add_argument(
+        "--ui",
+        action="store_true",
+        help="time interactions with the app instead",
+    )
+    parser.add_argument(
+        "--sizes",
+        type=lambda value: [int(size) for size in value.split(",")],
+        default=[100, 1000, 10000],
+        help="comma-separated member counts for --ui",
+    )
+    parser.add_argument(
+        "--rows", type=int, default=20, help="social rows added with --ui"
+    )
+    parser.add_argument(
+        "--ui-repeat",
+        type=int,
+        default=10,
+        help="runs of each interaction with --ui",
+    )
+    parser.add_argument("--save", help="write the results as a baseline")
+    parser.add_argument("--compare", help="baseline to compare against")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="slowdown of the median counted as a regression (0.2 = 20%%)",
+    )
+    args = parser.parse_args(argv)
+    options = Options(
+        args.members,
+        args.socials,
+        args.text_size,
+        args.repeat,
+        args.sizes,
+        args.rows,
+        args.ui_repeat,
+    )
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as fd:
+            baseline = json.load(fd)
+        if baseline.get("version") != BASELINE_VERSION:
+            parser.error(f"{args.compare} is not a version 1 baseline")
+        if baseline["options"] != asdict(options):
+            print(
+                f"warning: {args.compare} was run with {baseline['options']}",
+                file=sys.stderr,
+            )
+
+    if args.ui:
+        results = run_ui_benchmarks(options)
+    else:
+        results = run_benchmarks(options, args.only or list(BENCHMARKS))
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as fd:
+            json.dump(
+                {
+                    "version": BASELINE_VERSION,
+                    "created": datetime.now(timezone.utc).isoformat(),
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "options": asdict(options),
+                    "results": results,
+                },
+                fd,
+                indent=2,
+            )
+    if baseline is not None:
+        return 1 if compare(baseline, results, args.threshold) else 0
+    print_results(results)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
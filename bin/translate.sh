@@ -1,15 +1,15 @@
 #!/bin/sh
 uv run pybabel extract -F babel.cfg -o messages.pot .
-uv run pybabel init -i messages.pot -d translations -l es
-uv run pybabel init -i messages.pot -d translations -l qu
-uv run pybabel init -i messages.pot -d translations -l pt
-uv run pybabel init -i messages.pot -d translations -l it
-uv run pybabel init -i messages.pot -d translations -l fr
+uv run pybabel init -i messages.pot -d src/edit_python_pe/locale -l es
+uv run pybabel init -i messages.pot -d src/edit_python_pe/locale -l qu
+uv run pybabel init -i messages.pot -d src/edit_python_pe/locale -l pt
+uv run pybabel init -i messages.pot -d src/edit_python_pe/locale -l it
+uv run pybabel init -i messages.pot -d src/edit_python_pe/locale -l fr
 echo "Translating..."
-uv run ./bin/translate.py translations/es/LC_MESSAGES/messages.po es
-uv run ./bin/translate.py translations/qu/LC_MESSAGES/messages.po qu
-uv run ./bin/translate.py translations/pt/LC_MESSAGES/messages.po pt
-uv run ./bin/translate.py translations/it/LC_MESSAGES/messages.po it
-uv run ./bin/translate.py translations/fr/LC_MESSAGES/messages.po fr
-uv run pybabel compile -d translations
+uv run ./bin/translate.py src/edit_python_pe/locale/es/LC_MESSAGES/messages.po es
+uv run ./bin/translate.py src/edit_python_pe/locale/qu/LC_MESSAGES/messages.po qu
+uv run ./bin/translate.py src/edit_python_pe/locale/pt/LC_MESSAGES/messages.po pt
+uv run ./bin/translate.py src/edit_python_pe/locale/it/LC_MESSAGES/messages.po it
+uv run ./bin/translate.py src/edit_python_pe/locale/fr/LC_MESSAGES/messages.po fr
+uv run pybabel compile -d src/edit_python_pe/locale
 echo "Done."
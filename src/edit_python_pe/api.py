@@ -0,0 +1,375 @@
+import contextvars
+import functools
+import json
+import os
+import re
+import threading
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Callable, ItemsView, TypeVar
+
+from platformdirs import user_cache_dir
+
+from .constants import LATENCY_BUCKETS_MS
+from .httpcache import ResponseCache
+from .strings import MESSAGE_API_STATUS, MESSAGE_API_STATUS_RATE
+
+if TYPE_CHECKING:
+    from github.Requester import RequestsResponse
+
+T = TypeVar("T")
+
+_ID_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+# Name of the operation (get_repo, fork_repo, create_pr...) on whose behalf
+# requests are being made in the current thread or task
+_operation: contextvars.ContextVar[str] = contextvars.ContextVar(
+    "operation", default="other"
+)
+
+
+def get_stats_path() -> str:
+    return os.path.join(
+        user_cache_dir(appname="edit-python-pe", appauthor="python.pe"),
+        "api-usage.json",
+    )
+
+
+def _endpoint(verb: str, url: str) -> str:
+    # "/repos/o/r/pulls/12?page=2" -> "GET /repos/o/r/pulls/{id}"
+    path = url.split("?", 1)[0]
+    return f"{verb} {_ID_SEGMENT.sub('/{id}', path)}"
+
+
+class _Timings:
+    """Count, total and histogram of latencies in milliseconds."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+
+    def add(self, ms: float) -> None:
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+        for i, bound in enumerate(LATENCY_BUCKETS_MS):
+            if ms <= bound:
+                self.buckets[i] += 1
+                break
+        else:
+            self.buckets[-1] += 1
+
+    def to_dict(self) -> dict:
+        labels = [f"<={bound}" for bound in LATENCY_BUCKETS_MS]
+        labels.append(f">{LATENCY_BUCKETS_MS[-1]}")
+        return {
+            "count": self.count,
+            "total_ms": round(self.total_ms, 1),
+            "max_ms": round(self.max_ms, 1),
+            "histogram_ms": dict(zip(labels, self.buckets)),
+        }
+
+
+class RequestStats:
+    """Thread-safe accounting of the GitHub REST requests of a session.
+
+    Requests are grouped by endpoint and by the operation that made them;
+    operations also record their own wall time. The rate-limit headers of
+    the latest response are kept as they are. Git transfers to and from
+    the fork are added up by kind.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.endpoints: dict[str, _Timings] = {}
+        self.statuses: dict[str, dict[str, int]] = {}
+        self.operations: dict[str, dict[str, Any]] = {}
+        self.transfers: dict[str, dict[str, Any]] = {}
+        self.requests = 0
+        self.total_ms = 0.0
+        self.rate_remaining: int | None = None
+        self.rate_limit: int | None = None
+        self.rate_reset: int | None = None
+
+    def record(
+        self,
+        verb: str,
+        url: str,
+        status: int | None,
+        seconds: float,
+        headers: dict[str, str],
+    ) -> None:
+        endpoint = _endpoint(verb, url)
+        ms = seconds * 1000
+        with self._lock:
+            self.requests += 1
+            self.total_ms += ms
+            self.endpoints.setdefault(endpoint, _Timings()).add(ms)
+            statuses = self.statuses.setdefault(endpoint, {})
+            key = str(status) if status is not None else "error"
+            statuses[key] = statuses.get(key, 0) + 1
+            operation = self._operation(_operation.get())
+            operation["requests"] += 1
+            # GitHub sends the three together; floats happen, see PyGithub
+            try:
+                rate = [
+                    int(float(headers[f"x-ratelimit-{name}"]))
+                    for name in ("remaining", "limit", "reset")
+                ]
+            except (KeyError, ValueError):
+                return
+            self.rate_remaining, self.rate_limit, self.rate_reset = rate
+
+    def _operation(self, name: str) -> dict[str, Any]:
+        operation = self.operations.get(name)
+        if operation is None:
+            operation = self.operations[name] = {
+                "requests": 0,
+                "timings": _Timings(),
+            }
+        return operation
+
+    def record_operation(self, name: str, seconds: float) -> None:
+        with self._lock:
+            self._operation(name)["timings"].add(seconds * 1000)
+
+    def record_transfer(
+        self, kind: str, objects: int, size: int, seconds: float
+    ) -> None:
+        """Account a git fetch or push, which PyGithub never sees."""
+        with self._lock:
+            transfer = self.transfers.get(kind)
+            if transfer is None:
+                transfer = self.transfers[kind] = {
+                    "objects": 0,
+                    "bytes": 0,
+                    "timings": _Timings(),
+                }
+            transfer["objects"] += objects
+            transfer["bytes"] += size
+            transfer["timings"].add(seconds * 1000)
+
+    def summary(self) -> dict:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "total_ms": round(self.total_ms, 1),
+                "rate_limit": {
+                    "remaining": self.rate_remaining,
+                    "limit": self.rate_limit,
+                    "reset": self.rate_reset,
+                },
+                "operations": {
+                    name: {
+                        "requests": operation["requests"],
+                        **operation["timings"].to_dict(),
+                    }
+                    for name, operation in self.operations.items()
+                },
+                "transfers": {
+                    kind: {
+                        "objects": transfer["objects"],
+                        "bytes": transfer["bytes"],
+                        **transfer["timings"].to_dict(),
+                    }
+                    for kind, transfer in self.transfers.items()
+                },
+                "endpoints": {
+                    endpoint: {
+                        **timings.to_dict(),
+                        "statuses": self.statuses[endpoint],
+                    }
+                    for endpoint, timings in self.endpoints.items()
+                },
+            }
+
+    def status_line(self) -> str:
+        with self._lock:
+            line = MESSAGE_API_STATUS.format(
+                requests=self.requests, seconds=self.total_ms / 1000
+            )
+            if self.rate_remaining is not None:
+                line += MESSAGE_API_STATUS_RATE.format(
+                    remaining=self.rate_remaining, limit=self.rate_limit
+                )
+            return line
+
+    def write(self, path: str) -> None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as fd:
+            json.dump(self.summary(), fd, indent=2)
+        os.replace(tmp_path, path)
+
+
+# One accounting object for the whole process, like the client it measures
+STATS = RequestStats()
+
+
+def write_stats() -> None:
+    """Leave the session's summary in the user cache directory, if any."""
+    if not STATS.requests and not STATS.transfers:
+        return
+    try:
+        STATS.write(get_stats_path())
+    except OSError:
+        pass
+
+
+def accounted(name: str) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """Attribute the GitHub requests made inside the call to ``name``."""
+
+    def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> T:
+            token = _operation.set(name)
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                STATS.record_operation(name, perf_counter() - start)
+                _operation.reset(token)
+
+        return wrapper
+
+    return decorator
+
+
+# Injected connection classes are not kept by the Requester between calls,
+# so they share one requests.Session per host to keep connections alive.
+_sessions: dict[tuple[str, str, int], Any] = {}
+_sessions_lock = threading.Lock()
+
+
+class _CachedResponse:
+    """A stored 200 answer standing in for a ``304 Not Modified``."""
+
+    def __init__(self, headers: dict[str, str], body: str) -> None:
+        self.status = 200
+        self.headers = headers
+        self._body = body
+
+    def getheaders(self) -> ItemsView[str, str]:
+        return self.headers.items()
+
+    def read(self) -> str:
+        return self._body
+
+
+# Conditional-request cache shared by every connection, None when disabled
+_response_cache: ResponseCache | None = None
+
+
+class _AccountingMixin:
+    protocol: str
+    host: str
+    port: int
+    verb: str
+    url: str
+    headers: dict[str, str]
+    stream: bool
+    session: Any
+
+    def _share_session(self) -> None:
+        key = (self.protocol, self.host, self.port)
+        with _sessions_lock:
+            shared = _sessions.setdefault(key, self.session)
+        if shared is not self.session:
+            self.session.close()
+            self.session = shared
+
+    def _timed_getresponse(self) -> "RequestsResponse":
+        start = perf_counter()
+        status = None
+        headers: dict[str, str] = {}
+        try:
+            response = super().getresponse()  # type: ignore[misc]
+            status = response.status
+            headers = {k.lower(): v for k, v in response.getheaders()}
+            return response
+        finally:
+            STATS.record(
+                self.verb, self.url, status, perf_counter() - start, headers
+            )
+
+    def getresponse(self) -> "RequestsResponse | _CachedResponse":
+        cache = _response_cache
+        if cache is None or self.verb != "GET" or self.stream:
+            return self._timed_getresponse()
+
+        key = cache.key(
+            self.host, self.url, self.headers.get("Authorization", "")
+        )
+        entry = cache.get(key)
+        if entry is not None:
+            self.headers = dict(self.headers)
+            if entry["etag"]:
+                self.headers["If-None-Match"] = entry["etag"]
+            if entry["last_modified"]:
+                self.headers["If-Modified-Since"] = entry["last_modified"]
+
+        response = self._timed_getresponse()
+        if response.status == 304 and entry is not None:
+            # Keep the fresh rate-limit headers of the 304
+            headers = {
+                **entry["headers"],
+                **{k.lower(): v for k, v in response.getheaders()},
+            }
+            return _CachedResponse(headers, entry["body"])
+        if response.status == 200:
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            if etag or last_modified:
+                try:
+                    cache.put(
+                        key,
+                        {
+                            "etag": etag,
+                            "last_modified": last_modified,
+                            "headers": {
+                                k.lower(): v for k, v in response.getheaders()
+                            },
+                            "body": response.read(),
+                        },
+                    )
+                except OSError:
+                    pass
+        return response
+
+    def close(self) -> None:
+        # The session outlives this connection, see _share_session
+        pass
+
+
+@functools.cache
+def _connection_classes() -> tuple[type, type]:
+    # PyGithub is only imported once a client is made, see lazy.py
+    from github.Requester import (HTTPRequestsConnectionClass,
+                                  HTTPSRequestsConnectionClass)
+
+    class _HTTPConnection(_AccountingMixin, HTTPRequestsConnectionClass):
+        def __init__(self, *args: Any, **kwargs: Any) -> None:
+            super().__init__(*args, **kwargs)
+            self._share_session()
+
+    class _HTTPSConnection(_AccountingMixin, HTTPSRequestsConnectionClass):
+        def __init__(self, *args: Any, **kwargs: Any) -> None:
+            super().__init__(*args, **kwargs)
+            self._share_session()
+
+    return _HTTPConnection, _HTTPSConnection
+
+
+def install_accounting(response_cache: ResponseCache | None = None) -> None:
+    """Route every PyGithub request through the accounting connections.
+
+    With ``response_cache``, GET requests are also made conditional on the
+    stored ``ETag``/``Last-Modified``; GitHub answers ``304 Not Modified``
+    without charging the rate limit, and the stored body is used.
+    """
+    from github.Requester import Requester
+
+    global _response_cache
+    _response_cache = response_cache
+    Requester.injectConnectionClasses(*_connection_classes())
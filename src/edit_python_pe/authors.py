@@ -0,0 +1,69 @@
+import re
+from typing import Iterable
+
+# "Name(alias) <email>", the only line format AUTHORS uses
+_AUTHOR_LINE = re.compile(
+    r"^(?P<name>.*)\((?P<alias>[^()]*)\)\s*<(?P<email>[^<>]*)>$"
+)
+
+
+def _normalize(value: str) -> str:
+    return " ".join(value.split()).casefold()
+
+
+def author_line(name: str, alias: str, email: str) -> str:
+    return f"{name}({alias}) <{email}>"
+
+
+class AuthorsIndex:
+    """Entries of an AUTHORS file, keyed by normalized alias and email.
+
+    The contents are parsed once; each lookup is then a set membership
+    test instead of a search through the whole file, and entries that
+    only differ in case or spacing count as the same author. New entries
+    are appended in the file's own line format, leaving the existing text
+    untouched, and ``contents`` gives the whole file back for a single
+    rewrite.
+    """
+
+    def __init__(self, contents: str = "") -> None:
+        self._contents = contents
+        self._new_lines: list[str] = []
+        self.keys: set[tuple[str, str]] = set()
+        for line in contents.splitlines():
+            match = _AUTHOR_LINE.match(line.strip())
+            if match:
+                self.keys.add(
+                    (_normalize(match["alias"]), _normalize(match["email"]))
+                )
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __contains__(self, entry: tuple[str, str]) -> bool:
+        alias, email = entry
+        return (_normalize(alias), _normalize(email)) in self.keys
+
+    def add(self, name: str, alias: str, email: str) -> bool:
+        """Add an author unless listed; return whether it was new."""
+        key = (_normalize(alias), _normalize(email))
+        if key in self.keys:
+            return False
+        self.keys.add(key)
+        self._new_lines.append(author_line(name, alias, email))
+        return True
+
+    def add_many(self, entries: Iterable[tuple[str, str, str]]) -> int:
+        """Add ``(name, alias, email)`` entries; return how many were new."""
+        return sum(
+            self.add(name, alias, email) for name, alias, email in entries
+        )
+
+    @property
+    def added(self) -> str:
+        """Text appended to the original contents so far."""
+        return "".join(f"\n{line}" for line in self._new_lines)
+
+    @property
+    def contents(self) -> str:
+        return self._contents + self.added
@@ -1,5 +1,7 @@
 # Locales
 EN_LOCALE = "en"
+# gettext domain of the catalogs under edit_python_pe/locale
+LOCALE_DOMAIN = "messages"
 
 # Social network options
 GITHUB_OPTION = ("GitHub", "github")
@@ -10,3 +12,48 @@ FACEBOOK_OPTION = ("Facebook", "facebook")
 INSTAGRAM_OPTION = ("Instagram", "instagram")
 X_OPTION = ("X", "x")
 YOUTUBE_OPTION = ("YouTube", "youtube")
+
+# Git references used to keep the cached fork checkout in sync
+MAIN_REF = "refs/heads/main"
+ORIGIN_MAIN_REF = "refs/remotes/origin/main"
+MAIN_REFSPEC = f"+{MAIN_REF}:{ORIGIN_MAIN_REF}"
+
+# Paths the editor reads and writes; sparse clones only check these out
+SPARSE_PATHS = ["blog/members", "AUTHORS"]
+CLONE_DEPTH = 1
+
+# Polling for a freshly created fork to be served by GitHub (seconds)
+FORK_READY_TIMEOUT = 60.0
+FORK_READY_INITIAL_DELAY = 0.5
+
+# Number of member file names sent to the list per os.scandir batch
+MEMBER_SCAN_BATCH_SIZE = 512
+
+# Member files handed to each process pool task when parsing in bulk
+PARSE_CHUNK_SIZE = 256
+
+# Profile branches pushed, and their PRs opened, at the same time
+PUSH_CONCURRENCY = 4
+
+# Upper bounds of the GitHub request latency histogram buckets (ms)
+LATENCY_BUCKETS_MS = (50, 100, 250, 500, 1000, 2500, 5000)
+# Seconds between refreshes of the API usage footer
+API_STATUS_INTERVAL = 1.0
+
+# Size bound of the on-disk cache of GitHub responses (bytes)
+HTTP_CACHE_MAX_BYTES = 8 * 1024 * 1024
+
+# Seconds a validated token's login and fork are reused without asking
+SESSION_MAX_AGE = 7 * 24 * 60 * 60
+
+# Retries of queued pushes and PRs: first delay and its cap (seconds)
+OUTBOX_RETRY_DELAY = 30.0
+OUTBOX_MAX_RETRY_DELAY = 30 * 60.0
+
+# Steps of saving a profile, reported to the UI as each one starts
+SAVE_STAGES = ("writing", "committing", "pushing", "opening_pr")
+
+# Seconds between progress reports of a clone, fetch or push, on screen
+# and in the log of the headless commands
+TRANSFER_REPORT_INTERVAL = 0.1
+TRANSFER_LOG_INTERVAL = 1.0
@@ -0,0 +1,117 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from platformdirs import user_cache_dir
+
+from .constants import HTTP_CACHE_MAX_BYTES
+
+
+def _touch(path: str) -> None:
+    # Explicit nanoseconds: the kernel's own file timestamps are too coarse
+    # to order accesses made within the same few milliseconds
+    now = time.time_ns()
+    os.utime(path, ns=(now, now))
+
+
+def get_http_cache_path() -> str:
+    return os.path.join(
+        user_cache_dir(appname="edit-python-pe", appauthor="python.pe"),
+        "http",
+    )
+
+
+class ResponseCache:
+    """GitHub GET responses on disk, kept for conditional requests.
+
+    Each entry is one JSON file holding the validators (``ETag`` and
+    ``Last-Modified``), the headers and the body of a 200 response. The
+    directory is bounded to ``max_bytes``, evicting least recently used
+    entries first; use is tracked with the files' modification times so
+    the order survives restarts.
+    """
+
+    def __init__(self, path: str, max_bytes: int = HTTP_CACHE_MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._sizes: OrderedDict[str, int] | None = None
+        self._total = 0
+
+    @staticmethod
+    def key(host: str, url: str, authorization: str) -> str:
+        # Responses depend on who asks, but the token must not be stored
+        return hashlib.sha256(
+            f"{authorization}\n{host}\n{url}".encode("utf-8")
+        ).hexdigest()
+
+    def _file(self, key: str) -> str:
+        return os.path.join(self.path, f"{key}.json")
+
+    def _load_sizes(self) -> OrderedDict[str, int]:
+        if self._sizes is None:
+            entries = []
+            try:
+                with os.scandir(self.path) as it:
+                    for entry in it:
+                        if entry.name.endswith(".json") and entry.is_file():
+                            stat = entry.stat()
+                            entries.append(
+                                (
+                                    stat.st_mtime_ns,
+                                    entry.name[:-5],
+                                    stat.st_size,
+                                )
+                            )
+            except FileNotFoundError:
+                pass
+            entries.sort()
+            self._sizes = OrderedDict((key, size) for _, key, size in entries)
+            self._total = sum(self._sizes.values())
+        return self._sizes
+
+    def get(self, key: str) -> dict | None:
+        with self._lock:
+            sizes = self._load_sizes()
+            if key not in sizes:
+                return None
+            try:
+                with open(self._file(key), "r", encoding="utf-8") as fd:
+                    entry = json.load(fd)
+                _touch(self._file(key))
+            except (OSError, ValueError):
+                self._total -= sizes.pop(key)
+                return None
+            sizes.move_to_end(key)
+            return entry
+
+    def put(self, key: str, entry: dict) -> None:
+        data = json.dumps(entry, ensure_ascii=False).encode("utf-8")
+        if len(data) > self.max_bytes:
+            return
+        with self._lock:
+            sizes = self._load_sizes()
+            os.makedirs(self.path, exist_ok=True)
+            tmp_path = f"{self._file(key)}.tmp"
+            with open(tmp_path, "wb") as fd:
+                fd.write(data)
+            os.replace(tmp_path, self._file(key))
+            _touch(self._file(key))
+            self._total += len(data) - sizes.pop(key, 0)
+            sizes[key] = len(data)
+            while self._total > self.max_bytes:
+                old_key, size = sizes.popitem(last=False)
+                self._total -= size
+                try:
+                    os.remove(self._file(old_key))
+                except FileNotFoundError:
+                    pass
+
+    @property
+    def total_bytes(self) -> int:
+        with self._lock:
+            self._load_sizes()
+            return self._total
@@ -0,0 +1,295 @@
+from __future__ import annotations
+
+import csv
+import json
+import os
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from .constants import (BITBUCKET_OPTION, FACEBOOK_OPTION, GITHUB_OPTION,
+                        GITLAB_OPTION, INSTAGRAM_OPTION, LINKEDIN_OPTION,
+                        X_OPTION, YOUTUBE_OPTION)
+from .lazy import LazyModule
+from .strings import (MESSAGE_IMPORT_DONE, MESSAGE_IMPORT_EMPTY,
+                      MESSAGE_IMPORT_ERROR, MESSAGE_IMPORT_INVALID_ROW,
+                      MESSAGE_IMPORT_INVALID_SOCIAL,
+                      MESSAGE_IMPORT_MISSING_FIELD, MESSAGE_IMPORT_ROW_ERROR,
+                      MESSAGE_IMPORT_UNKNOWN_FORMAT,
+                      MESSAGE_IMPORT_UNKNOWN_PLATFORM)
+from .utils import (ProfileChange, _commit_files, _member_file_name,
+                    _member_path, _push, build_md_content, create_prs,
+                    fork_repo, get_repo)
+
+if TYPE_CHECKING:
+    import github
+    import pygit2
+    from github.Repository import Repository
+else:
+    github = LazyModule("github")
+    pygit2 = LazyModule("pygit2")
+
+SOCIAL_PLATFORMS = {
+    option[1]
+    for option in (
+        GITHUB_OPTION,
+        GITLAB_OPTION,
+        BITBUCKET_OPTION,
+        LINKEDIN_OPTION,
+        FACEBOOK_OPTION,
+        INSTAGRAM_OPTION,
+        X_OPTION,
+        YOUTUBE_OPTION,
+    )
+}
+
+TEXT_FIELDS = (
+    "city",
+    "homepage",
+    "who",
+    "python",
+    "contributions",
+    "availability",
+)
+
+
+@dataclass(slots=True)
+class ImportRow:
+    """One member to import, with the arguments of ``build_md_content``."""
+
+    name: str
+    email: str
+    aliases: list[str] = field(default_factory=list)
+    socials: list[tuple[str, str]] = field(default_factory=list)
+    city: str = ""
+    homepage: str = ""
+    who: str = ""
+    python: str = ""
+    contributions: str = ""
+    availability: str = ""
+
+    def to_markdown(self) -> str:
+        return build_md_content(
+            self.name,
+            self.email,
+            self.aliases,
+            self.socials,
+            self.city,
+            self.homepage,
+            self.who,
+            self.python,
+            self.contributions,
+            self.availability,
+        )
+
+
+def load_rows(path: str) -> list[dict[str, Any]]:
+    """Read raw rows from a ``.csv``, ``.json`` or ``.ndjson`` file.
+
+    A JSON file holds a list of objects; NDJSON (also ``.jsonl``) holds one
+    object per line, blank lines ignored.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    with open(path, "r", encoding="utf-8-sig", newline="") as fd:
+        if extension == ".csv":
+            return list(csv.DictReader(fd))
+        if extension == ".json":
+            rows = json.load(fd)
+            return rows if isinstance(rows, list) else [rows]
+        if extension in (".ndjson", ".jsonl"):
+            return [json.loads(line) for line in fd if line.strip()]
+    raise ValueError(MESSAGE_IMPORT_UNKNOWN_FORMAT.format(path=path))
+
+
+def _text(value: Any) -> str:
+    return "" if value is None else str(value).strip()
+
+
+def _parse_aliases(value: Any) -> list[str]:
+    if isinstance(value, list):
+        aliases = [_text(alias) for alias in value]
+    else:
+        aliases = _text(value).split(",")
+    return [alias.strip() for alias in aliases if alias.strip()]
+
+
+def _parse_socials(value: Any) -> list[tuple[str, str]]:
+    # Lists of pairs or objects, a {platform: url} object, or a
+    # "github=https://...;x=https://..." string as written in CSV cells
+    if isinstance(value, dict):
+        pairs = list(value.items())
+    elif isinstance(value, list):
+        pairs = [
+            (
+                (item.get("platform"), item.get("url"))
+                if isinstance(item, dict)
+                else tuple(item)
+            )
+            for item in value
+        ]
+    else:
+        pairs = [
+            tuple(entry.split("=", 1))
+            for entry in _text(value).split(";")
+            if entry.strip()
+        ]
+    socials = []
+    for pair in pairs:
+        if len(pair) != 2:
+            raise ValueError(MESSAGE_IMPORT_INVALID_SOCIAL.format(entry=pair))
+        socials.append((_text(pair[0]).lower(), _text(pair[1])))
+    return socials
+
+
+def parse_row(raw: dict[str, Any]) -> ImportRow:
+    """Turn a raw CSV/JSON row into an ``ImportRow``.
+
+    Keys are case-insensitive. Besides a ``socials`` field, each platform
+    can have its own column (``github``, ``x``, ...) holding the URL.
+    """
+    row = {_text(key).lower(): value for key, value in raw.items() if key}
+    for required in ("name", "email"):
+        if not _text(row.get(required)):
+            raise ValueError(
+                MESSAGE_IMPORT_MISSING_FIELD.format(field=required)
+            )
+
+    socials = _parse_socials(row.get("socials"))
+    for platform in sorted(SOCIAL_PLATFORMS & row.keys()):
+        if _text(row[platform]):
+            socials.append((platform, _text(row[platform])))
+    for platform, url in socials:
+        if platform not in SOCIAL_PLATFORMS:
+            raise ValueError(
+                MESSAGE_IMPORT_UNKNOWN_PLATFORM.format(platform=platform)
+            )
+        if not url:
+            raise ValueError(
+                MESSAGE_IMPORT_INVALID_SOCIAL.format(entry=(platform, url))
+            )
+
+    return ImportRow(
+        name=_text(row["name"]),
+        email=_text(row["email"]),
+        aliases=_parse_aliases(row.get("aliases")),
+        socials=socials,
+        **{key: _text(row.get(key)) for key in TEXT_FIELDS},
+    )
+
+
+def parse_rows(raw_rows: list[dict[str, Any]]) -> list[ImportRow]:
+    """Validate every row before anything is written.
+
+    All problems are reported together in one ``ValueError``, numbered
+    from 1 in file order.
+    """
+    rows, errors = [], []
+    for number, raw in enumerate(raw_rows, start=1):
+        try:
+            if not isinstance(raw, dict):
+                raise ValueError(MESSAGE_IMPORT_INVALID_ROW.format(row=raw))
+            rows.append(parse_row(raw))
+        except ValueError as e:
+            errors.append(MESSAGE_IMPORT_ROW_ERROR.format(row=number, error=e))
+    if errors:
+        raise ValueError("\n".join(errors))
+    return rows
+
+
+def import_members(
+    rows: list[ImportRow],
+    repo_path: str,
+    original_repo: Repository,
+    forked_repo: Repository,
+    token: str,
+    per_profile: bool = False,
+) -> list[str]:
+    """Commit every member file and the AUTHORS update at once on an
+    ``import/...`` branch, then push it and open a single pull request.
+    Returns the new file names.
+
+    With ``per_profile`` each member gets its own branch and pull request
+    instead, pushed concurrently by ``create_prs``.
+    """
+    name_files = [
+        _member_file_name(None, row.aliases, row.name, row.email)
+        for row in rows
+    ]
+    if per_profile:
+        changes = [
+            ProfileChange(
+                name_file,
+                row.to_markdown(),
+                False,
+                row.aliases,
+                row.name,
+                row.email,
+            )
+            for name_file, row in zip(name_files, rows)
+        ]
+        create_prs(changes, repo_path, original_repo, forked_repo, token)
+        return name_files
+
+    fork_owner = forked_repo.owner.login
+    commit_msg = f"Added {len(rows)} members"
+    # Off main, like profile branches, so later PRs don't carry the import
+    branch = f"import/{datetime.now():%Y%m%d-%H%M%S}"
+    ref_name = _commit_files(
+        repo_path,
+        {
+            _member_path(name_file): row.to_markdown()
+            for name_file, row in zip(name_files, rows)
+        },
+        fork_owner,
+        f"{fork_owner}@users.noreply.github.com",
+        commit_msg,
+        authors=[(row.aliases, row.name, row.email) for row in rows],
+        branch=branch,
+    )
+    _push(repo_path, token, [f"+{ref_name}:{ref_name}"])
+
+    pr_body = "\n".join(
+        [
+            "Creating new entries to `blog/members`:",
+            "",
+            *(
+                f"- `{name_file}` for {row.name}"
+                for name_file, row in zip(name_files, rows)
+            ),
+        ]
+    )
+    original_repo.create_pull(
+        title=commit_msg,
+        body=pr_body,
+        head=f"{fork_owner}:{branch}",
+        base="main",
+    )
+    return name_files
+
+
+def run_import(path: str, per_profile: bool = False) -> None:
+    """Entry point of ``edit-python-pe import FILE``."""
+    try:
+        rows = parse_rows(load_rows(path))
+    except (OSError, ValueError) as e:
+        print(e)
+        exit(1)
+    if not rows:
+        print(MESSAGE_IMPORT_EMPTY.format(path=path))
+        exit(1)
+
+    token, original_repo = get_repo()
+    try:
+        repo_path, forked_repo = fork_repo(token, original_repo)
+        import_members(
+            rows,
+            repo_path,
+            original_repo,
+            forked_repo,
+            token,
+            per_profile=per_profile,
+        )
+    except (TimeoutError, pygit2.GitError, github.GithubException) as e:
+        print(MESSAGE_IMPORT_ERROR.format(error=e))
+        exit(1)
+    print(MESSAGE_IMPORT_DONE.format(count=len(rows)))
@@ -0,0 +1,134 @@
+import hashlib
+import json
+import os
+from typing import TYPE_CHECKING
+
+from platformdirs import user_cache_dir
+
+from .lazy import LazyModule
+from .parser import MemberProfile, parse_email, parse_member
+
+if TYPE_CHECKING:
+    import pygit2
+else:
+    pygit2 = LazyModule("pygit2")
+
+INDEX_VERSION = 3
+
+
+def get_index_path() -> str:
+    return os.path.join(
+        user_cache_dir(appname="edit-python-pe", appauthor="python.pe"),
+        "members-index.json",
+    )
+
+
+class MemberIndex:
+    """Parsed ``blog/members`` profiles cached on disk by git blob OID.
+
+    Only blobs that are new since the last update are parsed, so after a
+    fetch the cost is proportional to the files that actually changed.
+    Emails are kept only as a hash; ``lookup`` reads the address back from
+    the file it is given.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.tree_id: str | None = None
+        self.blobs: dict[str, dict] = {}
+        self.files: dict[str, str] = {}
+
+    @classmethod
+    def load(cls, path: str) -> "MemberIndex":
+        index = cls(path)
+        try:
+            with open(path, "r", encoding="utf-8") as fd:
+                data = json.load(fd)
+        except (OSError, ValueError):
+            return index
+        if data.get("version") != INDEX_VERSION:
+            return index
+        index.tree_id = data["tree"]
+        index.blobs = data["blobs"]
+        index.files = data["files"]
+        return index
+
+    def save(self) -> None:
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as fd:
+            json.dump(
+                {
+                    "version": INDEX_VERSION,
+                    "tree": self.tree_id,
+                    "blobs": self.blobs,
+                    "files": self.files,
+                },
+                fd,
+                ensure_ascii=False,
+            )
+        os.replace(tmp_path, self.path)
+
+    def update(self, repo_path: str) -> bool:
+        """Sync with ``blog/members`` at HEAD, returning whether it changed."""
+        repo = pygit2.repository.Repository(
+            repo_path, pygit2.enums.RepositoryOpenFlag.NO_SEARCH
+        )
+        tree = repo.head.peel(pygit2.Commit).tree
+        members_tree = tree / "blog" / "members"
+        if str(members_tree.id) == self.tree_id:
+            return False
+
+        blobs = {}
+        files = {}
+        for entry in members_tree:
+            if entry.type_str != "blob" or not entry.name.endswith(".md"):
+                continue
+            oid = str(entry.id)
+            member = self.blobs.get(oid)
+            if member is None:
+                content = repo[entry.id].data.decode("utf-8", "replace")
+                member = _index_entry(content.replace("\r\n", "\n"))
+            blobs[oid] = member
+            files[entry.name] = oid
+
+        self.tree_id = str(members_tree.id)
+        self.blobs = blobs
+        self.files = files
+        return True
+
+    def get(self, filename: str) -> dict | None:
+        oid = self.files.get(filename)
+        if oid is None:
+            return None
+        return {**self.blobs[oid], "filename": filename}
+
+    def lookup(self, filename: str, content: str) -> MemberProfile | None:
+        """Return the profile for ``filename`` if ``content`` is its blob."""
+        oid = self.files.get(filename)
+        if oid is None or str(pygit2.hash(content)) != oid:
+            return None
+        return MemberProfile.from_dict(
+            {**self.blobs[oid], "email": parse_email(content)}
+        )
+
+    def labels(self) -> dict[str, str]:
+        labels = {}
+        for filename, oid in self.files.items():
+            member = self.blobs[oid]
+            label = f"{filename}  {member['name']}"
+            if member["city"]:
+                label += f" ({member['city']})"
+            labels[filename] = label
+        return labels
+
+
+def _index_entry(content: str) -> dict:
+    profile = parse_member(content)
+    member = profile.to_dict()
+    # No raw addresses in the cache, the hash is enough to match on
+    email = member.pop("email")
+    member["email_hash"] = hashlib.sha256(
+        email.strip().lower().encode("utf-8")
+    ).hexdigest()
+    return member
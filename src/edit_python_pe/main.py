@@ -1,27 +1,93 @@
-import glob
+import argparse
+import logging
 import os
+import threading
+from bisect import bisect_left
+from time import perf_counter
+from typing import (TYPE_CHECKING, Any, Callable, Generic, Iterable, Iterator,
+                    TypeVar)
 
-from github.Repository import Repository
+from rich.segment import Segment
+from textual import events, work
 from textual.app import App, ComposeResult
+from textual.binding import Binding
 from textual.containers import Horizontal, Vertical
-from textual.events import Event
+from textual.geometry import Size
+from textual.message import Message
+from textual.notifications import SeverityLevel
+from textual.reactive import reactive
+from textual.scroll_view import ScrollView
+from textual.strip import Strip
 from textual.types import NoSelection
-from textual.widgets import (Button, Input, ListItem, ListView, Select, Static,
-                             TextArea)
+from textual.widget import Widget
+from textual.widgets import Button, Input, ProgressBar, Select, Static
+from textual.worker import Worker, get_current_worker
 
-from .constants import (BITBUCKET_OPTION, FACEBOOK_OPTION, GITHUB_OPTION,
-                        GITLAB_OPTION, INSTAGRAM_OPTION, LINKEDIN_OPTION,
-                        X_OPTION, YOUTUBE_OPTION)
+from .api import STATS, write_stats
+from .constants import (API_STATUS_INTERVAL, BITBUCKET_OPTION, EN_LOCALE,
+                        FACEBOOK_OPTION, GITHUB_OPTION, GITLAB_OPTION,
+                        INSTAGRAM_OPTION, LINKEDIN_OPTION,
+                        MEMBER_SCAN_BATCH_SIZE, OUTBOX_RETRY_DELAY,
+                        SAVE_STAGES, X_OPTION, YOUTUBE_OPTION)
+from .index import MemberIndex, get_index_path
+from .lazy import LazyModule
+from .outbox import Outbox, get_outbox_path
+from .progress import TransferProgress, reporting_to
+from .pulls import PullRequestCache, get_pull_cache_path
+from .session import SessionCache, get_session_path, is_auth_error
 from .strings import (BUTTON_ADD, BUTTON_ADD_ALIAS, BUTTON_ADD_SOCIAL,
                       BUTTON_BACK, BUTTON_DELETE, BUTTON_QUIT, BUTTON_SAVE,
-                      FORM_HEADER, LIST_TITLE, MESSAGE_EXIT, PLACEHOLDER_ALIAS,
+                      FORM_HEADER, LIST_TITLE, MESSAGE_CONNECT_ERROR,
+                      MESSAGE_CONNECTING, MESSAGE_EXIT,
+                      MESSAGE_IMPORT_FILE_HELP, MESSAGE_IMPORT_HELP,
+                      MESSAGE_IMPORT_PER_PROFILE_HELP, MESSAGE_OFFLINE_HELP,
+                      MESSAGE_OFFLINE_NO_COPY, MESSAGE_REPO_NOT_FOUND,
+                      MESSAGE_SAVE_ERROR, MESSAGE_SAVE_STAGES,
+                      MESSAGE_SYNC_ERROR, MESSAGE_SYNC_HELP, MESSAGE_SYNCING,
+                      MESSAGE_UNAUTHORIZED, PLACEHOLDER_ALIAS,
                       PLACEHOLDER_CITY, PLACEHOLDER_EMAIL,
                       PLACEHOLDER_HOMEPAGE, PLACEHOLDER_NAME,
                       PLACEHOLDER_SOCIAL_URL, PROMPT_SOCIAL_NETWORK,
                       SECTION_ALIASES, SECTION_AVAIL, SECTION_CONTRIB,
-                      SECTION_PYTHON, SECTION_SOCIAL, SECTION_WHO)
-from .utils import (build_md_content, create_pr, fork_repo, get_repo,
-                    load_file_into_form)
+                      SECTION_PYTHON, SECTION_SOCIAL, SECTION_WHO, LazyString,
+                      available_languages, get_language, language_candidates,
+                      language_name, set_language)
+from .utils import (build_md_content, create_pr, drain_outbox, get_repo_path,
+                    get_token, load_file_into_form, open_fork,
+                    pending_member_files, queue_pr, run_sync, save_session,
+                    scan_member_files)
+
+if TYPE_CHECKING:
+    import github
+    import pygit2
+    from github.Repository import Repository
+else:
+    github = LazyModule("github")
+    pygit2 = LazyModule("pygit2")
+
+
+W = TypeVar("W", bound=Widget)
+
+
+def _translated(
+    widget_class: Callable[..., W], *args: Any, **kwargs: Any
+) -> W:
+    """Build a widget whose ``LazyString`` arguments follow the language.
+
+    Each one is passed as plain text, and set again on the attribute of
+    the same name by ``MemberApp.switch_language``.
+    """
+    texts = {
+        name: value
+        for name, value in kwargs.items()
+        if isinstance(value, LazyString)
+    }
+    widget = widget_class(
+        *args,
+        **{**kwargs, **{name: str(text) for name, text in texts.items()}},
+    )
+    widget.translations = texts  # type: ignore[attr-defined]
+    return widget
 
 
 class SocialEntry(Horizontal):
@@ -37,10 +103,13 @@ class SocialEntry(Horizontal):
         }
     """
 
-    def __init__(self, index: int, value: str) -> None:
+    def __init__(
+        self, index: int, value: str | NoSelection = Select.BLANK
+    ) -> None:
         super().__init__()
         self.index = index
-        self.select = Select(
+        self.select = _translated(
+            Select,
             options=[
                 GITHUB_OPTION,
                 GITLAB_OPTION,
@@ -54,14 +123,22 @@ class SocialEntry(Horizontal):
             prompt=PROMPT_SOCIAL_NETWORK,
             value=value,
         )
-        self.url_input = Input(placeholder=PLACEHOLDER_SOCIAL_URL)
-        self.delete_btn = Button(BUTTON_DELETE, id=f"delete_social_{index}")
+        self.url_input = _translated(Input, placeholder=PLACEHOLDER_SOCIAL_URL)
+        self.delete_btn = _translated(
+            Button, label=BUTTON_DELETE, id=f"delete_social_{index}"
+        )
 
     def compose(self) -> ComposeResult:
         yield self.select
         yield self.url_input
         yield self.delete_btn
 
+    def reset(
+        self, value: str | NoSelection = Select.BLANK, url: str = ""
+    ) -> None:
+        self.select.value = value
+        self.url_input.value = url
+
 
 class AliasEntry(Horizontal):
     DEFAULT_CSS = """
@@ -76,29 +153,295 @@ class AliasEntry(Horizontal):
     def __init__(self, index: int) -> None:
         super().__init__()
         self.index = index
-        self.alias_input = Input(placeholder=PLACEHOLDER_ALIAS)
-        self.delete_btn = Button(BUTTON_DELETE, id=f"delete_alias_{index}")
+        self.alias_input = _translated(Input, placeholder=PLACEHOLDER_ALIAS)
+        self.delete_btn = _translated(
+            Button, label=BUTTON_DELETE, id=f"delete_alias_{index}"
+        )
 
     def compose(self) -> ComposeResult:
         yield self.alias_input
         yield self.delete_btn
 
+    def reset(self, alias: str = "") -> None:
+        self.alias_input.value = alias
+
+
+R = TypeVar("R", SocialEntry, AliasEntry)
+
+
+class RowPool(Generic[R]):
+    """The rows of one form section, recycled between members.
+
+    Active rows are kept by their id, the number in their delete button,
+    in display order. Released rows are only hidden and wait after the
+    active ones in the container, so the next member reuses them instead
+    of mounting new widgets; rows that do have to be created are mounted
+    together.
+    """
+
+    def __init__(self, container: Widget, factory: Callable[[int], R]) -> None:
+        self.container = container
+        self.factory = factory
+        self.rows: dict[int, R] = {}
+        self._free: list[R] = []
+        self._next_id = 0
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __iter__(self) -> Iterator[R]:
+        return iter(list(self.rows.values()))
+
+    def get(self, row_id: int) -> R | None:
+        return self.rows.get(row_id)
+
+    def acquire(self) -> R:
+        return self.acquire_many(1)[0]
+
+    def acquire_many(self, count: int) -> list[R]:
+        """Show ``count`` more rows, reusing hidden ones first."""
+        rows = []
+        new_rows = []
+        for _ in range(count):
+            if self._free:
+                row = self._free.pop(0)
+                row.display = True
+            else:
+                row = self.factory(self._next_id)
+                self._next_id += 1
+                new_rows.append(row)
+            self.rows[row.index] = row
+            rows.append(row)
+        if new_rows:
+            self.container.mount(*new_rows)
+        return rows
+
+    def release(self, row_id: int) -> R | None:
+        row = self.rows.pop(row_id, None)
+        if row is None:
+            return None
+        row.display = False
+        if self.rows:
+            # Keep the hidden rows behind the active ones, so reusing
+            # them never puts a row in the middle of the section
+            last = next(reversed(self.rows.values()))
+            self.container.move_child(row, after=last)
+        self._free.insert(0, row)
+        return row
+
+    def release_all(self) -> None:
+        for row in self.rows.values():
+            row.display = False
+        self._free[:0] = self.rows.values()
+        self.rows.clear()
+
+
+class MemberList(ScrollView, can_focus=True):
+    """Sorted list of member files that only renders the visible rows.
+
+    Rows are plain strings drawn through the line API, so no widget is
+    created per member and mounting cost does not depend on the count.
+    """
+
+    BINDINGS = [
+        Binding("up", "cursor_up", show=False),
+        Binding("down", "cursor_down", show=False),
+        Binding("pageup", "page_up", show=False),
+        Binding("pagedown", "page_down", show=False),
+        Binding("home", "first", show=False),
+        Binding("end", "last", show=False),
+        Binding("enter", "select", show=False),
+    ]
+
+    COMPONENT_CLASSES = {"member-list--highlight"}
+
+    DEFAULT_CSS = """
+        MemberList {
+            height: 1fr;
+        }
+        MemberList > .member-list--highlight {
+            background: $block-cursor-background;
+            color: $block-cursor-foreground;
+        }
+    """
+
+    highlighted: reactive[int | None] = reactive(None)
+
+    class Selected(Message):
+        def __init__(self, member_list: "MemberList", filename: str) -> None:
+            super().__init__()
+            self.member_list = member_list
+            self.filename = filename
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._filenames: list[str] = []
+        self._labels: dict[str, str] = {}
+        self._max_width = 0
+
+    @property
+    def member_count(self) -> int:
+        return len(self._filenames)
+
+    @property
+    def filenames(self) -> list[str]:
+        return self._filenames
+
+    def clear(self) -> None:
+        self._filenames = []
+        self._max_width = 0
+        self.highlighted = None
+        self._update_size()
+
+    def add_members(self, filenames: Iterable[str]) -> None:
+        """Merge a batch of names, keeping the list sorted and the cursor."""
+        batch = list(filenames)
+        if not batch:
+            return
+        current = (
+            self._filenames[self.highlighted]
+            if self.highlighted is not None
+            else None
+        )
+        self._filenames = sorted(self._filenames + batch)
+        self._max_width = max(
+            self._max_width,
+            *(len(self._labels.get(name, name)) for name in batch),
+        )
+        if current is not None:
+            self.highlighted = bisect_left(self._filenames, current)
+        self._update_size()
+
+    def set_labels(self, labels: dict[str, str]) -> None:
+        """Show ``labels`` instead of the bare file name where available."""
+        self._labels = labels
+        self._max_width = max(
+            (len(labels.get(name, name)) for name in self._filenames),
+            default=0,
+        )
+        self._update_size()
+
+    def _update_size(self) -> None:
+        self.virtual_size = Size(self._max_width, len(self._filenames))
+        self.refresh()
+
+    def render_line(self, y: int) -> Strip:
+        scroll_x, scroll_y = self.scroll_offset
+        index = scroll_y + y
+        width = self.size.width
+        base_style = self.rich_style
+        if index >= len(self._filenames):
+            return Strip.blank(width, base_style)
+        style = (
+            self.get_component_rich_style("member-list--highlight")
+            if index == self.highlighted
+            else base_style
+        )
+        filename = self._filenames[index]
+        strip = Strip([Segment(self._labels.get(filename, filename), style)])
+        return strip.crop_extend(scroll_x, scroll_x + width, style)
+
+    def watch_highlighted(self, old: int | None, new: int | None) -> None:
+        if new is not None:
+            self._scroll_to_row(new)
+        self.refresh()
+
+    def _scroll_to_row(self, index: int) -> None:
+        top = self.scroll_offset.y
+        height = self.scrollable_content_region.height
+        if index < top:
+            self.scroll_to(y=index, animate=False)
+        elif height and index >= top + height:
+            self.scroll_to(y=index - height + 1, animate=False)
+
+    def _move(self, delta: int) -> None:
+        if not self._filenames:
+            return
+        current = -1 if self.highlighted is None else self.highlighted
+        self.highlighted = max(
+            0, min(len(self._filenames) - 1, current + delta)
+        )
+
+    def action_cursor_up(self) -> None:
+        self._move(-1)
+
+    def action_cursor_down(self) -> None:
+        self._move(1)
+
+    def action_page_up(self) -> None:
+        self._move(-max(1, self.scrollable_content_region.height))
+
+    def action_page_down(self) -> None:
+        self._move(max(1, self.scrollable_content_region.height))
+
+    def action_first(self) -> None:
+        self._move(-len(self._filenames))
+
+    def action_last(self) -> None:
+        self._move(len(self._filenames))
+
+    def action_select(self) -> None:
+        if self.highlighted is not None:
+            self.post_message(
+                self.Selected(self, self._filenames[self.highlighted])
+            )
+
+    def on_click(self, event: events.Click) -> None:
+        offset = event.get_content_offset(self)
+        if offset is None:
+            return
+        index = self.scroll_offset.y + offset.y
+        if index < len(self._filenames):
+            self.highlighted = index
+            self.action_select()
+
 
 class MemberApp(App):
     """Single app that toggles between a file list and a form while connected to a GitHub fork+push flow."""
 
+    CSS = """
+        #status_bar {
+            dock: bottom;
+            height: 1;
+        }
+        #status_bar Static {
+            width: auto;
+            margin-right: 1;
+        }
+        #status_transfer {
+            color: $text-muted;
+        }
+        #api_status {
+            dock: bottom;
+            height: 1;
+            color: $text-muted;
+        }
+    """
+
     def __init__(
         self,
-        original_repo: Repository,
-        forked_repo: Repository,
+        original_repo: "Repository | None",
+        forked_repo: "Repository | None",
         token: str,
         repo_path: str,
+        offline: bool = False,
     ) -> None:
         super().__init__()
         self.original_repo = original_repo
         self.forked_repo = forked_repo
         self.token = token
         self.repo_path = repo_path
+        self.member_index: MemberIndex | None = None
+        self.pull_cache: PullRequestCache | None = None
+        self.session: SessionCache | None = None
+        self.outbox: Outbox | None = None
+        self.save_lock = threading.Lock()
+        self.pending_saves = 0
+        # Profiles are only committed locally and queued in the outbox
+        self.offline = offline
+        self.current_file: str | None = None
+        # The form is built after the list is on screen, see build_form
+        self.form_built = False
 
     def compose(self) -> ComposeResult:
         # Two main containers: self.list_container for the file list, self.form_container for the form.
@@ -108,31 +451,122 @@ class MemberApp(App):
         self.form_container = Vertical()
         yield self.form_container
 
+        # Progress of the GitHub and git work running in the background
+        self.status_label = Static(str(MESSAGE_CONNECTING))
+        self.status_progress = ProgressBar(
+            show_percentage=False, show_eta=False
+        )
+        self.status_transfer = Static("", id="status_transfer")
+        self.status_bar = Horizontal(
+            self.status_label,
+            self.status_progress,
+            self.status_transfer,
+            id="status_bar",
+        )
+        yield self.status_bar
+
+        # Running count of GitHub requests and the rate limit left
+        self.api_status = Static(STATS.status_line(), id="api_status")
+        yield self.api_status
+
     def on_mount(self) -> None:
-        # 1) Build the list portion
-        self.list_title = Static(LIST_TITLE)
-        self.list_view = ListView()
-        self.quit_list_button = Button(BUTTON_QUIT, id="quit_list")
-
-        self.list_container.mount(self.list_title)
-        self.add_list_button = Button(BUTTON_ADD, id="add_list")
-        self.list_container.mount(self.list_view)
-        self.list_container.mount(self.add_list_button)
-        self.list_container.mount(self.quit_list_button)
-
-        md_files = glob.glob(
-            os.path.join(self.repo_path, "blog", "members", "*.md")
+        started = perf_counter()
+        self.list_title = _translated(Static, content=LIST_TITLE)
+        self.member_list = MemberList()
+        self.add_list_button = _translated(
+            Button, label=BUTTON_ADD, id="add_list"
+        )
+        self.quit_list_button = _translated(
+            Button, label=BUTTON_QUIT, id="quit_list"
+        )
+        self.list_container.mount(
+            self.list_title,
+            self.member_list,
+            self.add_list_button,
+            self.quit_list_button,
         )
-        for f in md_files:
-            basename = os.path.basename(f)
-            self.list_view.append(ListItem(Static(basename)))
 
-        # 2) Build the form portion, hidden at first
-        self.form_header = Static(FORM_HEADER, classes="header")
-        self.name_input = Input(placeholder=PLACEHOLDER_NAME)
-        self.email_input = Input(placeholder=PLACEHOLDER_EMAIL)
-        self.city_input = Input(placeholder=PLACEHOLDER_CITY)
-        self.homepage_input = Input(placeholder=PLACEHOLDER_HOMEPAGE)
+        # A copy left by a previous session is listed right away
+        self.load_member_list()
+        self.pull_cache = PullRequestCache.load(get_pull_cache_path())
+        self.session = SessionCache.load(get_session_path())
+        self.outbox = Outbox(get_outbox_path())
+        self.set_interval(API_STATUS_INTERVAL, self.refresh_api_status)
+
+        # Show the list at startup
+        self.show_list()
+
+        if self.offline:
+            if not os.path.exists(os.path.join(self.repo_path, ".git")):
+                self.exit(message=str(MESSAGE_OFFLINE_NO_COPY))
+            self.status_bar.display = False
+        elif self.forked_repo is None:
+            self.connect()
+        else:
+            self.status_bar.display = False
+
+        # The form is hidden until a member is picked: build it once the
+        # list has painted instead of delaying that first frame
+        self.call_after_refresh(self.list_painted, started)
+
+    def list_painted(self, started: float) -> None:
+        STATS.record_operation("mount_list", perf_counter() - started)
+        self.build_form()
+        # Naming the languages loads Babel's locale data, also not needed
+        # for the first frame
+        current = next(
+            (
+                language
+                for language in language_candidates(get_language())
+                if language in available_languages()
+            ),
+            EN_LOCALE,
+        )
+        self.language_select = Select(
+            [
+                (language_name(language), language)
+                for language in available_languages()
+            ],
+            value=current,
+            allow_blank=False,
+            id="language",
+        )
+        self.list_container.mount(self.language_select)
+
+    def switch_language(self, language: str) -> None:
+        """Show every label in ``language``, without restarting."""
+        if language == get_language():
+            return
+        set_language(language)
+        for widget in self.query("*"):
+            texts = getattr(widget, "translations", {})
+            for attribute, text in texts.items():
+                setattr(widget, attribute, str(text))
+        self.refresh_api_status()
+
+    def on_select_changed(self, event: Select.Changed) -> None:
+        if event.select.id == "language" and isinstance(event.value, str):
+            self.switch_language(event.value)
+
+    def build_form(self) -> None:
+        """Create and mount the member form, once."""
+        if self.form_built:
+            return
+        self.form_built = True
+        started = perf_counter()
+        self.form_header = _translated(
+            Static, content=FORM_HEADER, classes="header"
+        )
+        self.name_input = _translated(Input, placeholder=PLACEHOLDER_NAME)
+        self.email_input = _translated(Input, placeholder=PLACEHOLDER_EMAIL)
+        self.city_input = _translated(Input, placeholder=PLACEHOLDER_CITY)
+        self.homepage_input = _translated(
+            Input, placeholder=PLACEHOLDER_HOMEPAGE
+        )
+
+        # Only the form edits multi-line text; TextArea pulls in Textual's
+        # document and syntax machinery, so it is imported with the form
+        from textual.widgets import TextArea
 
         self.who_area = TextArea()
         self.python_area = TextArea()
@@ -141,74 +575,241 @@ class MemberApp(App):
 
         self.social_container = Vertical()
         self.alias_container = Vertical()
-        self.add_social_button = Button(BUTTON_ADD_SOCIAL, id="add_social")
-        self.add_alias_button = Button(BUTTON_ADD_ALIAS, id="add_alias")
-
-        self.save_button = Button(BUTTON_SAVE, id="save")
-        self.back_button = Button(BUTTON_BACK, id="back")
-        self.quit_button = Button(BUTTON_QUIT, id="quit")
-
-        # 3) Mount them in the form container
-        self.form_container.mount(self.form_header)
-        self.form_container.mount(self.name_input)
-        self.form_container.mount(self.email_input)
-
-        self.form_container.mount(Static(SECTION_SOCIAL, classes="subheader"))
-        self.form_container.mount(self.social_container)
-        self.form_container.mount(self.add_social_button)
-
-        self.form_container.mount(Static(SECTION_ALIASES, classes="subheader"))
-        self.form_container.mount(self.alias_container)
-        self.form_container.mount(self.add_alias_button)
-
-        self.form_container.mount(self.city_input)
-        self.form_container.mount(self.homepage_input)
-        self.form_container.mount(Static(SECTION_WHO, classes="subheader"))
-        self.form_container.mount(self.who_area)
-        self.form_container.mount(Static(SECTION_PYTHON, classes="subheader"))
-        self.form_container.mount(self.python_area)
-        self.form_container.mount(
-            Static(
-                SECTION_CONTRIB,
-                classes="subheader",
-            )
+        self.add_social_button = _translated(
+            Button, label=BUTTON_ADD_SOCIAL, id="add_social"
         )
-        self.form_container.mount(self.contributions_area)
-        self.form_container.mount(
-            Static(
-                SECTION_AVAIL,
-                classes="subheader",
-            )
+        self.add_alias_button = _translated(
+            Button, label=BUTTON_ADD_ALIAS, id="add_alias"
+        )
+
+        self.save_button = _translated(Button, label=BUTTON_SAVE, id="save")
+        self.back_button = _translated(Button, label=BUTTON_BACK, id="back")
+        self.quit_button = _translated(Button, label=BUTTON_QUIT, id="quit")
+        # Saving waits for the fork, unless profiles only go to the outbox
+        self.save_button.disabled = (
+            self.forked_repo is None and not self.offline
         )
-        self.form_container.mount(self.availability_area)
 
         self.form_button_bar = Horizontal(
             self.save_button, self.back_button, self.quit_button
         )
-        self.form_container.mount(self.form_button_bar)
 
-        self.form_container.display = False
+        # One mount for the whole form
+        self.form_container.mount(
+            self.form_header,
+            self.name_input,
+            self.email_input,
+            _translated(Static, content=SECTION_SOCIAL, classes="subheader"),
+            self.social_container,
+            self.add_social_button,
+            _translated(Static, content=SECTION_ALIASES, classes="subheader"),
+            self.alias_container,
+            self.add_alias_button,
+            self.city_input,
+            self.homepage_input,
+            _translated(Static, content=SECTION_WHO, classes="subheader"),
+            self.who_area,
+            _translated(Static, content=SECTION_PYTHON, classes="subheader"),
+            self.python_area,
+            _translated(Static, content=SECTION_CONTRIB, classes="subheader"),
+            self.contributions_area,
+            _translated(Static, content=SECTION_AVAIL, classes="subheader"),
+            self.availability_area,
+            self.form_button_bar,
+        )
 
-        # Some data structures
-        self.social_entries: list[SocialEntry] = []
-        self.alias_entries: list[AliasEntry] = []
-        self.social_index = 0
-        self.alias_index = 0
-        self.current_file = None
+        self.social_entries = RowPool(self.social_container, SocialEntry)
+        self.alias_entries = RowPool(self.alias_container, AliasEntry)
+        self.call_after_refresh(
+            STATS.record_operation,
+            "mount_form",
+            perf_counter() - started,
+        )
 
-        # Show the list at startup
-        self.show_list()
+    @work(thread=True, exclusive=True, group="connect")
+    def connect(self) -> None:
+        """Validate the token, fork and sync the local copy off the UI thread."""
+        try:
+            with reporting_to(self.report_transfer):
+                original_repo, repo_path, forked_repo = open_fork(
+                    self.token,
+                    self.session,
+                    on_sync=lambda: self.call_from_thread(
+                        self.set_status, str(MESSAGE_SYNCING)
+                    ),
+                )
+        except github.BadCredentialsException:
+            self.call_from_thread(self.exit, message=str(MESSAGE_UNAUTHORIZED))
+        except github.GithubException:
+            self.call_from_thread(
+                self.exit, message=str(MESSAGE_REPO_NOT_FOUND)
+            )
+        except TimeoutError as e:
+            self.call_from_thread(self.exit, message=str(e))
+        except pygit2.GitError as e:
+            self.call_from_thread(
+                self.exit, message=MESSAGE_SYNC_ERROR.format(error=e)
+            )
+        except OSError as e:
+            # No network: the list already shows the local copy
+            self.call_from_thread(
+                self.show_connect_error, MESSAGE_CONNECT_ERROR.format(error=e)
+            )
+        else:
+            self.call_from_thread(
+                self.set_repos, original_repo, forked_repo, repo_path
+            )
+
+    def report_transfer(self, progress: TransferProgress) -> None:
+        # Called on the git thread: copy the numbers before they move on
+        self.call_from_thread(
+            self.show_transfer,
+            progress.describe(),
+            progress.objects,
+            progress.total_objects,
+        )
+
+    def show_transfer(self, text: str, objects: int, total: int) -> None:
+        self.status_transfer.update(text)
+        # While saving, the bar counts stages instead
+        if not self.pending_saves:
+            self.status_progress.update(total=total, progress=objects)
+
+    def hide_status(self) -> None:
+        self.status_bar.display = False
+        self.status_transfer.update("")
+
+    def refresh_api_status(self) -> None:
+        self.api_status.update(STATS.status_line())
+
+    def set_status(self, message: str) -> None:
+        self.status_label.update(message)
+
+    def show_connect_error(self, message: str) -> None:
+        self.set_status(message)
+        self.status_progress.display = False
+        self.status_transfer.update("")
+
+    def set_repos(
+        self,
+        original_repo: "Repository",
+        forked_repo: "Repository",
+        repo_path: str,
+    ) -> None:
+        self.original_repo = original_repo
+        self.forked_repo = forked_repo
+        self.repo_path = repo_path
+        self.load_member_list()
+        if self.form_built:
+            self.save_button.disabled = False
+        self.hide_status()
+        # Send what was saved offline, then keep retrying what fails
+        self.send_outbox()
+        self.set_interval(OUTBOX_RETRY_DELAY, self.send_outbox)
+
+    def send_outbox(self) -> None:
+        if self.outbox is None or not self.outbox.due():
+            return
+        # One drain at a time, the interval may fire while one runs
+        if any(
+            worker.group == "outbox" and not worker.is_finished
+            for worker in self.workers
+        ):
+            return
+        self.send_queued_profiles()
+
+    @work(thread=True, group="outbox")
+    def send_queued_profiles(self) -> None:
+        """Push and open the PRs of queued profiles off the UI thread."""
+        try:
+            with reporting_to(self.report_transfer):
+                messages = drain_outbox(
+                    self.outbox,
+                    self.repo_path,
+                    self.original_repo,
+                    self.forked_repo,
+                    self.token,
+                    self.pull_cache,
+                )
+        except (github.GithubException, pygit2.GitError):
+            # Only authentication errors get here, see drain_outbox
+            self.call_from_thread(self.drop_session)
+            self.call_from_thread(
+                self.notify, str(MESSAGE_UNAUTHORIZED), severity="error"
+            )
+            return
+        for message in messages:
+            self.call_from_thread(self.notify, message)
+
+    def drop_session(self) -> None:
+        if self.session is not None:
+            self.session.discard(self.token)
+            save_session(self.session)
+
+    def load_member_list(self) -> None:
+        self.member_list.clear()
+        self.scan_members()
+        self.index_members()
+
+    @work(thread=True, exclusive=True, group="members")
+    def scan_members(self) -> None:
+        """Feed the member list in ``os.scandir`` batches off the UI thread."""
+        worker = get_current_worker()
+        listed = set()
+        for batch in scan_member_files(self.repo_path, MEMBER_SCAN_BATCH_SIZE):
+            if worker.is_cancelled:
+                return
+            listed.update(batch)
+            self.call_from_thread(self._add_member_batch, worker, batch)
+        # Saved profiles whose pull request is not merged yet
+        pending = [
+            name
+            for name in pending_member_files(self.repo_path)
+            if name not in listed
+        ]
+        if pending and not worker.is_cancelled:
+            self.call_from_thread(self._add_member_batch, worker, pending)
+
+    def _add_member_batch(self, worker: Worker, batch: list[str]) -> None:
+        # A newer scan may have replaced this one since the batch was sent
+        if not worker.is_cancelled:
+            self.member_list.add_members(batch)
+
+    @work(thread=True, exclusive=True, group="index")
+    def index_members(self) -> None:
+        """Bring the member metadata index up to date with the local copy."""
+        worker = get_current_worker()
+        member_index = MemberIndex.load(get_index_path())
+        try:
+            if member_index.update(self.repo_path):
+                member_index.save()
+        except (pygit2.GitError, KeyError, OSError):
+            # No usable local copy yet; the next sync indexes it
+            return
+        self.call_from_thread(self._set_member_index, worker, member_index)
+
+    def _set_member_index(
+        self, worker: Worker, member_index: MemberIndex
+    ) -> None:
+        if not worker.is_cancelled:
+            self.member_index = member_index
+            self.member_list.set_labels(member_index.labels())
 
     def show_list(self) -> None:
         self.list_container.display = True
         self.form_container.display = False
 
     def show_form(self) -> None:
+        self.build_form()
         self.list_container.display = False
         self.form_container.display = True
 
     def clear_form(self) -> None:
         """Clear out text fields / dynamic containers."""
+        if not self.form_built:
+            # A new form is already empty
+            self.build_form()
+            return
         self.name_input.value = ""
         self.email_input.value = ""
         self.city_input.value = ""
@@ -218,32 +819,25 @@ class MemberApp(App):
         self.contributions_area.text = ""
         self.availability_area.text = ""
 
-        for soc in self.social_entries:
-            soc.remove()
-        self.social_entries.clear()
-        self.social_index = 0
-        self.social_container.remove_children()
-
-        for ali in self.alias_entries:
-            ali.remove()
-        self.alias_entries.clear()
-        self.alias_index = 0
-        self.alias_container.remove_children()
+        # Hidden, not removed: the next member reuses the rows
+        self.social_entries.release_all()
+        self.alias_entries.release_all()
 
-    def on_list_view_selected(self, event: ListView.Selected) -> None:
+    def on_member_list_selected(self, event: MemberList.Selected) -> None:
         """User clicked on a file in the list. Parse it into the form fields."""
-        item_text_widget = event.item.children[0]
-        filename = item_text_widget.content
+        filename = event.filename
         self.current_file = filename
 
-        self.clear_form()
-        load_file_into_form(self, filename)
-        self.show_form()
+        # One refresh for the whole swap of rows and values
+        with self.batch_update():
+            self.clear_form()
+            load_file_into_form(self, filename)
+            self.show_form()
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         bid = event.button.id
         if bid == "quit_list":
-            self.exit(message=MESSAGE_EXIT)
+            self.exit(message=str(MESSAGE_EXIT))
         elif bid == "add_social":
             self.add_social_entry()
         elif bid == "add_alias":
@@ -259,7 +853,7 @@ class MemberApp(App):
             self.clear_form()
             self.show_list()
         elif bid == "quit":
-            self.exit(message=MESSAGE_EXIT)
+            self.exit(message=str(MESSAGE_EXIT))
         elif bid and bid.startswith("delete_social_"):
             index = int(bid.replace("delete_social_", ""))
             self.remove_social_entry(index)
@@ -270,36 +864,16 @@ class MemberApp(App):
     def add_social_entry(
         self, value: str | NoSelection = Select.BLANK
     ) -> None:
-        new_entry = SocialEntry(self.social_index, value)
-        self.social_index += 1
-        self.social_entries.append(new_entry)
-        self.social_container.mount(new_entry)
+        self.social_entries.acquire().reset(value)
 
     def remove_social_entry(self, index: int) -> None:
-        found = None
-        for e in self.social_entries:
-            if e.index == index:
-                found = e
-                break
-        if found:
-            self.social_entries.remove(found)
-            found.remove()
+        self.social_entries.release(index)
 
     def add_alias_entry(self) -> None:
-        row = AliasEntry(self.alias_index)
-        self.alias_index += 1
-        self.alias_entries.append(row)
-        self.alias_container.mount(row)
+        self.alias_entries.acquire().reset()
 
     def remove_alias_entry(self, index: int) -> None:
-        found = None
-        for a in self.alias_entries:
-            if a.index == index:
-                found = a
-                break
-        if found:
-            self.alias_entries.remove(found)
-            found.remove()
+        self.alias_entries.release(index)
 
     def save_member(self) -> None:
         name = self.name_input.value.strip()
@@ -340,32 +914,146 @@ class MemberApp(App):
             availability,
         )
 
-        message = create_pr(
-            md_content,
-            self.current_file,
-            self.repo_path,
-            self.original_repo,
-            self.forked_repo,
-            self.token,
-            aliases,
-            name,
-            email,
-        )
-        self.exit(message=message)
+        # Back to the list at once; the save goes on in the background
+        self.show_list()
+        self.pending_saves += 1
+        self.status_progress.update(total=len(SAVE_STAGES), progress=0)
+        self.set_status(MESSAGE_SAVE_STAGES[SAVE_STAGES[0]].format(name=name))
+        self.status_bar.display = True
+        self.save_profile(md_content, self.current_file, aliases, name, email)
+
+    @work(thread=True, group="save")
+    def save_profile(
+        self,
+        md_content: str,
+        current_file: str | None,
+        aliases: list[str],
+        name: str,
+        email: str,
+    ) -> None:
+        """Write, commit, push and open the PR of a profile off the UI thread.
+
+        Whatever the save raises is reported instead of ending the app, and
+        ``finish_save`` runs either way.
+        """
+        severity: SeverityLevel = "information"
+        try:
+            with reporting_to(self.report_transfer):
+                message = self.run_save(
+                    md_content,
+                    current_file,
+                    aliases,
+                    name,
+                    email,
+                    on_stage=lambda stage: self.call_from_thread(
+                        self.set_save_stage, stage, name
+                    ),
+                )
+        except Exception as e:
+            message = MESSAGE_SAVE_ERROR.format(name=name, error=e)
+            severity = "error"
+        self.call_from_thread(self.finish_save, message, severity)
+
+    def run_save(
+        self,
+        md_content: str,
+        current_file: str | None,
+        aliases: list[str],
+        name: str,
+        email: str,
+        on_stage: Callable[[str], None] | None = None,
+    ) -> str:
+        # Saves share the checkout and AUTHORS, so they run one at a time
+        with self.save_lock:
+            if self.offline:
+                return queue_pr(
+                    md_content,
+                    current_file,
+                    self.repo_path,
+                    aliases,
+                    name,
+                    email,
+                    self.outbox,
+                    on_stage=on_stage,
+                )
+            try:
+                return create_pr(
+                    md_content,
+                    current_file,
+                    self.repo_path,
+                    self.original_repo,
+                    self.forked_repo,
+                    self.token,
+                    aliases,
+                    name,
+                    email,
+                    pull_cache=self.pull_cache,
+                    outbox=self.outbox,
+                    on_stage=on_stage,
+                )
+            except (github.GithubException, pygit2.GitError) as e:
+                # The session was trusted without asking GitHub; this is
+                # where a revoked or expired token shows up
+                if not is_auth_error(e):
+                    raise
+                self.drop_session()
+                return str(MESSAGE_UNAUTHORIZED)
+
+    def set_save_stage(self, stage: str, name: str) -> None:
+        self.set_status(MESSAGE_SAVE_STAGES[stage].format(name=name))
+        self.status_progress.update(progress=SAVE_STAGES.index(stage) + 1)
+
+    def finish_save(
+        self, message: str, severity: SeverityLevel = "information"
+    ) -> None:
+        self.pending_saves -= 1
+        if not self.pending_saves:
+            self.hide_status()
+        self.notify(message, severity=severity)
+        # A new member file shows up in the list
+        self.load_member_list()
 
-    async def on_event(self, event: Event) -> None:
-        # catch listview selection
-        if isinstance(event, ListView.Selected):
-            self.on_list_view_selected(event)
 
-        await super().on_event(event)
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="edit-python-pe")
+    parser.add_argument(
+        "--offline", action="store_true", help=MESSAGE_OFFLINE_HELP
+    )
+    commands = parser.add_subparsers(dest="command")
+    commands.add_parser("sync", help=MESSAGE_SYNC_HELP)
+    import_parser = commands.add_parser("import", help=MESSAGE_IMPORT_HELP)
+    import_parser.add_argument("file", help=MESSAGE_IMPORT_FILE_HELP)
+    import_parser.add_argument(
+        "--per-profile",
+        action="store_true",
+        help=MESSAGE_IMPORT_PER_PROFILE_HELP,
+    )
+    args = parser.parse_args(argv)
+    if args.command in ("import", "sync"):
+        # Long clones and pushes report their progress on the terminal
+        logging.basicConfig(level=logging.INFO, format="%(message)s")
+    if args.command == "import":
+        from .importer import run_import
 
+        try:
+            run_import(args.file, per_profile=args.per_profile)
+        finally:
+            write_stats()
+        return
+    if args.command == "sync":
+        try:
+            run_sync()
+        finally:
+            write_stats()
+        return
 
-def main() -> None:
-    token, original_repo = get_repo()
-    repo_path, forked_repo = fork_repo(token, original_repo)
-    app = MemberApp(original_repo, forked_repo, token, repo_path)
-    app.run()
+    # Offline, nothing needs the token until `sync`
+    token = "" if args.offline else get_token()
+    app = MemberApp(None, None, token, get_repo_path(), offline=args.offline)
+    try:
+        app.run()
+    finally:
+        write_stats()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,118 @@
+import json
+import os
+from dataclasses import asdict, dataclass
+from time import time
+
+from platformdirs import user_data_dir
+
+from .constants import OUTBOX_MAX_RETRY_DELAY, OUTBOX_RETRY_DELAY
+
+OUTBOX_VERSION = 1
+
+
+def get_outbox_path() -> str:
+    # Not under get_repo_path(): the checkout owns the whole data directory
+    # and syncing it removes every untracked file
+    return user_data_dir(
+        appname="edit-python-pe-outbox", appauthor="python.pe"
+    )
+
+
+@dataclass(slots=True)
+class OutboxJob:
+    """A profile committed locally whose push and PR are still pending.
+
+    ``change`` holds the fields of the ``ProfileChange``, file content
+    included, so the commit can be made again if the checkout is lost.
+    """
+
+    id: str
+    change: dict
+    queued_at: float
+    attempts: int = 0
+    next_attempt_at: float = 0.0
+    error: str | None = None
+
+
+class Outbox:
+    """Durable queue of pending pushes and pull requests.
+
+    Each job is one JSON file in ``path``, written atomically, so a crash
+    or a closed terminal loses at most the job being written. Jobs are
+    keyed by member file: saving a profile again replaces its job.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+    def _file(self, job_id: str) -> str:
+        return os.path.join(self.path, f"{job_id}.json")
+
+    def _write(self, job: OutboxJob) -> None:
+        os.makedirs(self.path, exist_ok=True)
+        tmp_path = f"{self._file(job.id)}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as fd:
+            json.dump(
+                {"version": OUTBOX_VERSION, **asdict(job)},
+                fd,
+                ensure_ascii=False,
+            )
+        os.replace(tmp_path, self._file(job.id))
+
+    def _read(self, file_path: str) -> OutboxJob | None:
+        try:
+            with open(file_path, "r", encoding="utf-8") as fd:
+                data = json.load(fd)
+        except (OSError, ValueError):
+            return None
+        if data.pop("version", None) != OUTBOX_VERSION:
+            return None
+        return OutboxJob(**data)
+
+    def put(self, job_id: str, change: dict) -> OutboxJob:
+        job = OutboxJob(job_id, change, time())
+        self._write(job)
+        return job
+
+    def get(self, job_id: str) -> OutboxJob | None:
+        return self._read(self._file(job_id))
+
+    def jobs(self) -> list[OutboxJob]:
+        """Every pending job, oldest first."""
+        jobs = []
+        try:
+            with os.scandir(self.path) as it:
+                for entry in it:
+                    if entry.name.endswith(".json"):
+                        job = self._read(entry.path)
+                        if job is not None:
+                            jobs.append(job)
+        except FileNotFoundError:
+            pass
+        jobs.sort(key=lambda job: job.queued_at)
+        return jobs
+
+    def due(self) -> list[OutboxJob]:
+        now = time()
+        return [job for job in self.jobs() if job.next_attempt_at <= now]
+
+    def _is_current(self, job: OutboxJob) -> bool:
+        # False once the profile was saved again while ``job`` was sent
+        stored = self.get(job.id)
+        return stored is not None and stored.queued_at == job.queued_at
+
+    def remove(self, job: OutboxJob) -> None:
+        if self._is_current(job):
+            os.remove(self._file(job.id))
+
+    def retry_later(self, job: OutboxJob, error: str) -> None:
+        if not self._is_current(job):
+            return
+        # Exponential backoff, so a long outage is not hammered
+        job.attempts += 1
+        job.error = error
+        job.next_attempt_at = time() + min(
+            OUTBOX_RETRY_DELAY * 2 ** (job.attempts - 1),
+            OUTBOX_MAX_RETRY_DELAY,
+        )
+        self._write(job)
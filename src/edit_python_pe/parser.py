@@ -0,0 +1,232 @@
+import functools
+import multiprocessing
+import re
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING, Any, Iterable, Iterator
+
+from .constants import PARSE_CHUNK_SIZE
+from .lazy import LazyModule
+from .strings import MD_CONTENT
+
+if TYPE_CHECKING:
+    import yaml
+else:
+    yaml = LazyModule("yaml")
+
+SOCIAL_LINK_PATTERN = re.compile(
+    r'<a[^>]*href="([^"]+)"[^>]*>\s*<iconify-icon[^>]*icon="simple-icons:([^"]+)"',
+    re.DOTALL,
+)
+FIELD_PATTERN = re.compile(r":(Aliases|Ciudad|Homepage):[ \t]*([^\n]+)")
+GRAVATAR_PATTERN = re.compile(r"^```\{gravatar\} (.*)$", re.MULTILINE)
+
+SECTION_FIELDS = {
+    MD_CONTENT["section_who"]: "who",
+    MD_CONTENT["section_python"]: "python",
+    MD_CONTENT["section_contrib"]: "contributions",
+    MD_CONTENT["section_avail"]: "availability",
+}
+
+_START, _FRONTMATTER, _BODY, _RAW = range(4)
+
+
+@dataclass(slots=True)
+class MemberProfile:
+    name: str = ""
+    email: str = ""
+    city: str = ""
+    homepage: str = ""
+    aliases: list[str] = field(default_factory=list)
+    socials: list[tuple[str, str]] = field(default_factory=list)
+    who: str = ""
+    python: str = ""
+    contributions: str = ""
+    availability: str = ""
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "MemberProfile":
+        return cls(
+            name=data["name"],
+            email=data["email"],
+            city=data["city"],
+            homepage=data["homepage"],
+            aliases=list(data["aliases"]),
+            socials=[(plat, url) for plat, url in data["socials"]],
+            who=data["who"],
+            python=data["python"],
+            contributions=data["contributions"],
+            availability=data["availability"],
+        )
+
+
+def parse_email(content: str) -> str:
+    """Return the gravatar email of a member file without a full parse."""
+    match = GRAVATAR_PATTERN.search(content)
+    return match.group(1).strip() if match is not None else ""
+
+
+@functools.cache
+def _yaml_loader() -> Any:
+    # libyaml's loader when available, it is several times faster
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _parse_frontmatter(lines: list[str]) -> dict:
+    try:
+        data = yaml.load("\n".join(lines), Loader=_yaml_loader())
+    except yaml.YAMLError:
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _yaml_str(data: dict, key: str) -> str:
+    value = data.get(key)
+    return "" if value is None else str(value)
+
+
+def parse_member(content: str) -> MemberProfile:
+    """Parse a ``blog/members`` markdown file in a single pass over its lines.
+
+    The YAML frontmatter gives the defaults for the name and city, the
+    ``# `` header and ``:Ciudad:`` field override them. For every other
+    field the first occurrence in the file wins.
+    """
+    profile = MemberProfile()
+    frontmatter: list[str] = []
+    raw_lines: list[str] = []
+    fields: dict[str, str] = {}
+    sections: dict[str, list[str]] = {}
+    section_lines: list[str] | None = None
+    name = None
+    seen_raw = False
+    state = _START
+
+    lines = content.split("\n")
+    for number, line in enumerate(lines):
+        if state == _START:
+            if not line.strip():
+                continue
+            state = _BODY
+            # Only a closed block counts as frontmatter
+            if line.rstrip() == "---" and any(
+                rest.rstrip() == "---" for rest in lines[number + 1 :]
+            ):
+                state = _FRONTMATTER
+                continue
+        elif state == _FRONTMATTER:
+            if line.rstrip() == "---":
+                state = _BODY
+            else:
+                frontmatter.append(line)
+            continue
+
+        if line.startswith("### "):
+            key = SECTION_FIELDS.get(line.rstrip())
+            if key is not None and key not in sections:
+                section_lines = sections[key] = []
+            else:
+                section_lines = None
+            continue
+        if section_lines is not None:
+            section_lines.append(line)
+
+        if state == _RAW:
+            end = line.find("```")
+            if end == -1:
+                raw_lines.append(line)
+                continue
+            raw_lines.append(line[:end])
+            profile.socials = [
+                (match.group(2), match.group(1))
+                for match in SOCIAL_LINK_PATTERN.finditer("\n".join(raw_lines))
+            ]
+            state = _BODY
+        elif line.startswith("# "):
+            if name is None and line[2:].strip():
+                name = line[2:].strip()
+        elif line.startswith("```{gravatar} "):
+            if not profile.email:
+                profile.email = line[14:].strip()
+        elif line.startswith("```{raw} html"):
+            if not seen_raw:
+                seen_raw = True
+                state = _RAW
+        elif ":" in line:
+            match = FIELD_PATTERN.search(line)
+            if match is not None and match.group(1) not in fields:
+                fields[match.group(1)] = match.group(2).strip()
+
+    yaml_data = _parse_frontmatter(frontmatter) if frontmatter else {}
+    profile.name = name if name is not None else _yaml_str(yaml_data, "author")
+    profile.city = fields.get("Ciudad", _yaml_str(yaml_data, "location"))
+    profile.homepage = fields.get("Homepage", "")
+    if "Aliases" in fields:
+        profile.aliases = [a.strip() for a in fields["Aliases"].split(",")]
+    for key, body in sections.items():
+        setattr(profile, key, "\n".join(body).strip())
+    return profile
+
+
+@dataclass(slots=True)
+class ParseResult:
+    """Outcome of parsing one file: a profile, or the error it raised."""
+
+    path: str
+    profile: MemberProfile | None = None
+    error: str | None = None
+
+
+def _parse_file(path: str) -> ParseResult:
+    try:
+        with open(path, "r", encoding="utf-8") as fd:
+            return ParseResult(path, profile=parse_member(fd.read()))
+    except Exception as e:
+        return ParseResult(path, error=f"{type(e).__name__}: {e}")
+
+
+def _parse_chunk(paths: list[str]) -> list[ParseResult]:
+    return [_parse_file(path) for path in paths]
+
+
+def parse_member_files(
+    paths: Iterable[str],
+    max_workers: int | None = None,
+    chunk_size: int = PARSE_CHUNK_SIZE,
+) -> Iterator[ParseResult]:
+    """Parse many member files on a process pool, yielding as chunks finish.
+
+    Results arrive in completion order, not input order. A file that cannot
+    be read or parsed yields a ``ParseResult`` with ``error`` set instead of
+    stopping the batch. Inputs that fit in one chunk are parsed in-process,
+    where starting the pool would cost more than it saves.
+    """
+    paths = list(paths)
+    if len(paths) <= chunk_size:
+        yield from _parse_chunk(paths)
+        return
+
+    # Workers are spawned rather than forked: callers such as the TUI run
+    # this from a thread, and forking a threaded process is unsafe.
+    executor = ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+    try:
+        chunks: dict[Future, list[str]] = {}
+        for start in range(0, len(paths), chunk_size):
+            chunk = paths[start : start + chunk_size]
+            chunks[executor.submit(_parse_chunk, chunk)] = chunk
+        for future in as_completed(chunks):
+            try:
+                yield from future.result()
+            except Exception as e:
+                # The worker itself died; report every file it held
+                error = f"{type(e).__name__}: {e}"
+                for path in chunks[future]:
+                    yield ParseResult(path, error=error)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,178 @@
+import contextvars
+import logging
+from contextlib import contextmanager
+from time import monotonic
+from typing import TYPE_CHECKING, Any, Callable, Iterator
+
+from .api import STATS
+from .constants import TRANSFER_LOG_INTERVAL, TRANSFER_REPORT_INTERVAL
+from .lazy import LazyModule
+from .strings import (MESSAGE_TRANSFER_DONE, MESSAGE_TRANSFER_ETA,
+                      MESSAGE_TRANSFER_PROGRESS, MESSAGE_TRANSFER_RECEIVING,
+                      MESSAGE_TRANSFER_SENDING)
+
+if TYPE_CHECKING:
+    import pygit2
+else:
+    pygit2 = LazyModule("pygit2")
+
+logger = logging.getLogger(__name__)
+
+# Who wants to hear about transfers started in the current thread or task,
+# like the operation name in api.py
+_listener: contextvars.ContextVar[
+    Callable[["TransferProgress"], None] | None
+] = contextvars.ContextVar("transfer_listener", default=None)
+
+
+@contextmanager
+def reporting_to(
+    listener: Callable[["TransferProgress"], None],
+) -> Iterator[None]:
+    """Send the progress of the transfers made inside to ``listener``."""
+    token = _listener.set(listener)
+    try:
+        yield
+    finally:
+        _listener.reset(token)
+
+
+def _format_bytes(size: float) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if size < 1024:
+            return (
+                f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+            )
+        size /= 1024
+    return f"{size:.1f} GiB"
+
+
+class TransferProgress:
+    """Objects and bytes moved by one fetch, clone or push so far."""
+
+    def __init__(self, kind: str) -> None:
+        # "fetch" (clones included) or "push"
+        self.kind = kind
+        self.started = monotonic()
+        self.elapsed = 0.0
+        self.objects = 0
+        self.total_objects = 0
+        self.bytes = 0
+
+    def update(self, objects: int, total_objects: int, size: int) -> None:
+        self.objects = objects
+        self.total_objects = total_objects
+        self.bytes = size
+        self.elapsed = monotonic() - self.started
+
+    @property
+    def done(self) -> bool:
+        return self.objects >= self.total_objects
+
+    @property
+    def throughput(self) -> float:
+        """Bytes per second."""
+        return self.bytes / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def eta(self) -> float | None:
+        """Seconds left at the current object rate, if it can be told."""
+        if not self.objects or not self.elapsed or self.done:
+            return None
+        rate = self.objects / self.elapsed
+        return (self.total_objects - self.objects) / rate
+
+    def describe(self) -> str:
+        if self.done:
+            return MESSAGE_TRANSFER_DONE.format(
+                objects=self.total_objects,
+                size=_format_bytes(self.bytes),
+                seconds=self.elapsed,
+            )
+        line = MESSAGE_TRANSFER_PROGRESS.format(
+            action=(
+                MESSAGE_TRANSFER_SENDING
+                if self.kind == "push"
+                else MESSAGE_TRANSFER_RECEIVING
+            ),
+            objects=self.objects,
+            total=self.total_objects,
+            size=_format_bytes(self.bytes),
+            rate=_format_bytes(self.throughput),
+        )
+        if self.eta is not None:
+            line += MESSAGE_TRANSFER_ETA.format(seconds=self.eta)
+        return line
+
+
+def _define_callbacks() -> type:
+    # Subclassing needs pygit2 itself, so the class is only made when
+    # first asked for (see __getattr__ below)
+    class ProgressCallbacks(pygit2.callbacks.RemoteCallbacks):
+        """Remote callbacks that also report how the transfer is going.
+
+        Updates go to the listener set with ``reporting_to`` every
+        ``TRANSFER_REPORT_INTERVAL`` seconds and to the module's logger every
+        ``TRANSFER_LOG_INTERVAL``, and to both when the last object is
+        through; ``finish`` hands the totals to the request accounting.
+        """
+
+        def __init__(
+            self, credentials: "pygit2.UserPass | None", kind: str = "fetch"
+        ) -> None:
+            super().__init__(credentials=credentials)
+            self.progress = TransferProgress(kind)
+            self._listener = _listener.get()
+            self._reported_at = 0.0
+            self._logged_at = 0.0
+            self._reported_done = False
+
+        def _report(self) -> None:
+            # libgit2 keeps calling while it indexes what was received
+            if self._reported_done:
+                return
+            now = monotonic()
+            done = self._reported_done = self.progress.done
+            if done or now - self._logged_at >= TRANSFER_LOG_INTERVAL:
+                self._logged_at = now
+                logger.info(self.progress.describe())
+            if self._listener is not None and (
+                done or now - self._reported_at >= TRANSFER_REPORT_INTERVAL
+            ):
+                self._reported_at = now
+                self._listener(self.progress)
+
+        def transfer_progress(
+            self, stats: "pygit2.remotes.TransferProgress"
+        ) -> None:
+            self.progress.update(
+                stats.received_objects,
+                stats.total_objects,
+                stats.received_bytes,
+            )
+            self._report()
+
+        def push_transfer_progress(
+            self, objects_pushed: int, total_objects: int, bytes_pushed: int
+        ) -> None:
+            self.progress.update(objects_pushed, total_objects, bytes_pushed)
+            self._report()
+
+        def finish(self) -> None:
+            # Up-to-date fetches move nothing and report nothing
+            if self.progress.total_objects:
+                STATS.record_transfer(
+                    self.progress.kind,
+                    self.progress.objects,
+                    self.progress.bytes,
+                    self.progress.elapsed,
+                )
+
+    return ProgressCallbacks
+
+
+def __getattr__(name: str) -> Any:
+    if name == "ProgressCallbacks":
+        cls = globals()["ProgressCallbacks"] = _define_callbacks()
+        return cls
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import json
+import os
+from typing import TYPE_CHECKING
+
+from platformdirs import user_cache_dir
+
+from .lazy import LazyModule
+
+if TYPE_CHECKING:
+    import github
+    from github.PullRequest import PullRequest
+    from github.Repository import Repository
+else:
+    github = LazyModule("github")
+
+PULL_CACHE_VERSION = 1
+
+
+def get_pull_cache_path() -> str:
+    return os.path.join(
+        user_cache_dir(appname="edit-python-pe", appauthor="python.pe"),
+        "pull-requests.json",
+    )
+
+
+class PullRequestCache:
+    """Member file name to the number and head of its open pull request.
+
+    Entries are only hints: they are revalidated with a single
+    ``get_pull`` before use, and dropped once that PR is closed.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.pulls: dict[str, dict] = {}
+
+    @classmethod
+    def load(cls, path: str) -> "PullRequestCache":
+        cache = cls(path)
+        try:
+            with open(path, "r", encoding="utf-8") as fd:
+                data = json.load(fd)
+        except (OSError, ValueError):
+            return cache
+        if data.get("version") != PULL_CACHE_VERSION:
+            return cache
+        cache.pulls = data["pulls"]
+        return cache
+
+    def save(self) -> None:
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as fd:
+            json.dump(
+                {"version": PULL_CACHE_VERSION, "pulls": self.pulls},
+                fd,
+                ensure_ascii=False,
+            )
+        os.replace(tmp_path, self.path)
+
+    def get(self, filename: str, head: str) -> int | None:
+        entry = self.pulls.get(filename)
+        if entry is None or entry["head"] != head:
+            return None
+        return entry["number"]
+
+    def set(self, filename: str, head: str, number: int) -> None:
+        self.pulls[filename] = {"head": head, "number": number}
+
+    def discard(self, filename: str) -> None:
+        self.pulls.pop(filename, None)
+
+
+def _is_open_from(pr: PullRequest, head: str) -> bool:
+    return pr.state == "open" and pr.head.label == head
+
+
+def find_open_pull(
+    original_repo: Repository,
+    filename: str,
+    head: str,
+    base: str,
+    cache: PullRequestCache | None = None,
+) -> PullRequest | None:
+    """Find the open pull request from ``head`` that edits ``filename``.
+
+    A cached number costs one request to revalidate. Otherwise a single
+    ``head``-filtered listing is made, which GitHub answers with the one
+    open PR a head/base pair can have, instead of paging through every
+    open pull request of the repository.
+    """
+    if cache is not None:
+        number = cache.get(filename, head)
+        if number is not None:
+            try:
+                pr = original_repo.get_pull(number)
+            except github.UnknownObjectException:
+                pr = None
+            if pr is not None and _is_open_from(pr, head):
+                return pr
+            cache.discard(filename)
+
+    for pr in original_repo.get_pulls(state="open", head=head, base=base):
+        if filename in pr.title:
+            if cache is not None:
+                cache.set(filename, head, pr.number)
+            return pr
+    return None
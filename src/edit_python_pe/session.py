@@ -0,0 +1,102 @@
+import hashlib
+import json
+import os
+from time import time
+from typing import TYPE_CHECKING
+
+from platformdirs import user_cache_dir
+
+from .constants import SESSION_MAX_AGE
+from .lazy import LazyModule
+
+if TYPE_CHECKING:
+    import github
+    import pygit2
+else:
+    github = LazyModule("github")
+    pygit2 = LazyModule("pygit2")
+
+SESSION_VERSION = 1
+
+# Fragments of the libgit2 messages for rejected or missing credentials
+_GIT_AUTH_ERRORS = ("authentication", "401", "403")
+
+
+def get_session_path() -> str:
+    return os.path.join(
+        user_cache_dir(appname="edit-python-pe", appauthor="python.pe"),
+        "session.json",
+    )
+
+
+def _token_key(token: str) -> str:
+    # Sessions are found by token, but the token itself is never written
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+def is_auth_error(error: Exception) -> bool:
+    """Whether ``error`` means GitHub no longer accepts the token."""
+    if isinstance(error, github.BadCredentialsException):
+        return True
+    if isinstance(error, pygit2.GitError):
+        message = str(error).lower()
+        return any(fragment in message for fragment in _GIT_AUTH_ERRORS)
+    return False
+
+
+class SessionCache:
+    """What a validated token resolved to: its login and fork.
+
+    With an entry, a later launch builds the repositories from it instead
+    of asking GitHub again; the token is only checked again when a git or
+    API call fails, and entries older than ``SESSION_MAX_AGE`` are ignored.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.sessions: dict[str, dict] = {}
+
+    @classmethod
+    def load(cls, path: str) -> "SessionCache":
+        cache = cls(path)
+        try:
+            with open(path, "r", encoding="utf-8") as fd:
+                data = json.load(fd)
+        except (OSError, ValueError):
+            return cache
+        if data.get("version") != SESSION_VERSION:
+            return cache
+        cache.sessions = data["sessions"]
+        return cache
+
+    def save(self) -> None:
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as fd:
+            json.dump(
+                {"version": SESSION_VERSION, "sessions": self.sessions},
+                fd,
+                ensure_ascii=False,
+            )
+        # Only the hash of the token is inside, but keep it to the user
+        os.chmod(tmp_path, 0o600)
+        os.replace(tmp_path, self.path)
+
+    def get(self, token: str) -> dict | None:
+        entry = self.sessions.get(_token_key(token))
+        if entry is None or time() - entry["validated_at"] > SESSION_MAX_AGE:
+            return None
+        return entry
+
+    def remember(
+        self, token: str, login: str, fork_full_name: str, clone_url: str
+    ) -> None:
+        self.sessions[_token_key(token)] = {
+            "login": login,
+            "fork": fork_full_name,
+            "clone_url": clone_url,
+            "validated_at": time(),
+        }
+
+    def discard(self, token: str) -> None:
+        self.sessions.pop(_token_key(token), None)
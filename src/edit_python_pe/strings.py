@@ -1,17 +1,142 @@
 import gettext
 import locale
-from pathlib import Path
+import threading
+from importlib import resources
+from typing import Any
 
-from .constants import EN_LOCALE
+from .constants import EN_LOCALE, LOCALE_DOMAIN
+
+# Catalogs are read once per process and language, from the package itself
+# so they are found the same way from a checkout and from a wheel
+_catalogs: dict[str, gettext.NullTranslations] = {}
+_catalogs_lock = threading.Lock()
 
 default_locale = locale.getlocale()[0] or EN_LOCALE
-localedir = Path(__file__).parent.parent.parent / "translations"
-_ = gettext.translation(
-    domain="messages",
-    localedir=localedir,
-    languages=[default_locale],
-    fallback=True,
-).gettext
+_language = default_locale
+
+
+def language_candidates(language: str) -> list[str]:
+    # "es_PE.UTF-8" -> ["es_PE", "es"], as gettext expands them
+    language = language.split(".", 1)[0].split("@", 1)[0]
+    base = language.split("_", 1)[0]
+    return [language] if base == language else [language, base]
+
+
+def _catalog_resource(language: str) -> Any:
+    return resources.files(__package__).joinpath(
+        "locale", language, "LC_MESSAGES", f"{LOCALE_DOMAIN}.mo"
+    )
+
+
+def get_catalog(language: str) -> gettext.NullTranslations:
+    catalog = _catalogs.get(language)
+    if catalog is not None:
+        return catalog
+    with _catalogs_lock:
+        catalog = _catalogs.get(language)
+        if catalog is None:
+            catalog = gettext.NullTranslations()
+            for candidate in language_candidates(language):
+                resource = _catalog_resource(candidate)
+                if resource.is_file():
+                    with resource.open("rb") as fd:
+                        catalog = gettext.GNUTranslations(fd)
+                    break
+            _catalogs[language] = catalog
+    return catalog
+
+
+def available_languages() -> list[str]:
+    """English plus every language with a catalog in the package."""
+    languages = [
+        entry.name
+        for entry in resources.files(__package__).joinpath("locale").iterdir()
+        if _catalog_resource(entry.name).is_file()
+    ]
+    return [EN_LOCALE, *sorted(languages)]
+
+
+def language_name(language: str) -> str:
+    """Name of ``language`` in that language, "español" for "es"."""
+    from babel import Locale, UnknownLocaleError
+
+    try:
+        return Locale.parse(language).get_display_name(language) or language
+    except (UnknownLocaleError, ValueError):
+        return language
+
+
+def get_language() -> str:
+    return _language
+
+
+def set_language(language: str) -> None:
+    """Switch every translatable string to ``language`` from now on."""
+    global _language
+    get_catalog(language)
+    _language = language
+
+
+class LazyString:
+    """Translatable text, looked up in the current language when used.
+
+    The translation is kept until the language changes, so using a label
+    costs a comparison. Formatting and concatenation give plain strings;
+    anything that needs a real ``str``, like a widget, gets ``str(text)``.
+    """
+
+    __slots__ = ("message", "_cached")
+
+    def __init__(self, message: str) -> None:
+        self.message = message
+        self._cached: tuple[str, str] | None = None
+
+    def __str__(self) -> str:
+        cached = self._cached
+        language = _language
+        if cached is None or cached[0] != language:
+            cached = (language, get_catalog(language).gettext(self.message))
+            self._cached = cached
+        return cached[1]
+
+    def __repr__(self) -> str:
+        return f"_({self.message!r})"
+
+    # Equality and hashing use the untranslated message, so a text keeps
+    # its place in a dict or set when the language changes
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, LazyString):
+            return self.message == other.message
+        if isinstance(other, str):
+            return self.message == other
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.message)
+
+    def __len__(self) -> int:
+        return len(str(self))
+
+    def __contains__(self, part: str) -> bool:
+        return part in str(self)
+
+    def __add__(self, other: str) -> str:
+        return str(self) + other
+
+    def __radd__(self, other: str) -> str:
+        return other + str(self)
+
+    def __mod__(self, values: Any) -> str:
+        return str(self) % values
+
+    def __getattr__(self, name: str) -> Any:
+        # format, strip, startswith... act on the current translation
+        return getattr(str(self), name)
+
+
+def _(message: str) -> LazyString:
+    return LazyString(message)
+
 
 # Field, control, and message labels for edit_python_pe
 
@@ -63,6 +188,9 @@ MESSAGE_FILE_EDITED_PR = _(
     "File {name_file} edited, commit and changes sent to existing PR."
 )
 MESSAGE_FILE_SAVED_PR = _("File {name_file} saved, commit and PR ready.")
+MESSAGE_FORK_NOT_READY = _(
+    "Your fork is not available on GitHub yet. Please try again later."
+)
 MESSAGE_CREATE_ENTRY = _(
     "Creating a new entry to `blog/members` for {name} (alias: {first_alias})."
 )
@@ -70,6 +198,68 @@ MESSAGE_CHANGE_ENTRY = _(
     "Changing an entry to `blog/members` for {name} (alias: {first_alias})."
 )
 MESSAGE_LOAD_FILE_ERROR = _("Error reading file {filename}: {error}")
+MESSAGE_CONNECTING = _("Connecting to GitHub...")
+MESSAGE_SYNCING = _("Updating your copy of python.pe...")
+MESSAGE_SYNC_ERROR = _("Could not update your copy of python.pe: {error}")
+MESSAGE_CONNECT_ERROR = _(
+    "Could not reach GitHub ({error}). Showing your local copy; run with "
+    "--offline to save profiles without connecting."
+)
+MESSAGE_API_STATUS = _("GitHub API: {requests} requests, {seconds:.1f}s")
+MESSAGE_API_STATUS_RATE = _(", {remaining}/{limit} left")
+MESSAGE_IMPORT_DONE = _("{count} members imported, commit and PR ready.")
+MESSAGE_IMPORT_EMPTY = _("No members found in {path}.")
+MESSAGE_IMPORT_ROW_ERROR = _("Row {row}: {error}")
+MESSAGE_IMPORT_MISSING_FIELD = _("missing required field '{field}'")
+MESSAGE_IMPORT_INVALID_ROW = _("expected an object, got {row!r}")
+MESSAGE_IMPORT_INVALID_SOCIAL = _("invalid social entry {entry!r}")
+MESSAGE_IMPORT_UNKNOWN_PLATFORM = _("unknown social platform '{platform}'")
+MESSAGE_IMPORT_ERROR = _("Import failed: {error}")
+MESSAGE_IMPORT_HELP = _(
+    "create many member profiles in a single commit and pull request"
+)
+MESSAGE_IMPORT_FILE_HELP = _(
+    "CSV, JSON or NDJSON file with one member per row"
+)
+MESSAGE_IMPORT_PER_PROFILE_HELP = _(
+    "open one pull request per member, each from its own branch"
+)
+MESSAGE_IMPORT_UNKNOWN_FORMAT = _(
+    "Unknown file format for {path}, use CSV, JSON or NDJSON."
+)
+MESSAGE_FILE_QUEUED = _(
+    "File {name_file} saved locally, it will be sent the next time you "
+    "connect or run `edit-python-pe sync`."
+)
+MESSAGE_FILE_QUEUED_ERROR = _(
+    "Could not send {name_file} ({error}). It was saved locally and will "
+    "be sent the next time you connect or run `edit-python-pe sync`."
+)
+MESSAGE_OFFLINE_NO_COPY = _(
+    "There is no local copy of python.pe yet, connect once before "
+    "working offline."
+)
+MESSAGE_OUTBOX_EMPTY = _("Nothing to send.")
+MESSAGE_OUTBOX_LEFT = _(
+    "{count} profiles could not be sent yet, run `edit-python-pe sync` "
+    "again later."
+)
+MESSAGE_OFFLINE_HELP = _("save profiles locally without connecting to GitHub")
+MESSAGE_SYNC_HELP = _("send the profiles saved while offline")
+MESSAGE_SAVE_ERROR = _("Could not save the profile of {name}: {error}")
+MESSAGE_SAVE_STAGES = {
+    "writing": _("Writing the profile of {name}..."),
+    "committing": _("Committing the profile of {name}..."),
+    "pushing": _("Pushing the profile of {name}..."),
+    "opening_pr": _("Opening the pull request for {name}..."),
+}
+MESSAGE_TRANSFER_RECEIVING = _("Receiving objects")
+MESSAGE_TRANSFER_SENDING = _("Sending objects")
+MESSAGE_TRANSFER_PROGRESS = _(
+    "{action}: {objects}/{total}, {size} at {rate}/s"
+)
+MESSAGE_TRANSFER_ETA = _(", {seconds:.0f}s left")
+MESSAGE_TRANSFER_DONE = _("{objects} objects, {size} in {seconds:.1f}s")
 
 # build_md_content markdown dictionary (English keys, Spanish values for now)
 MD_CONTENT = {
@@ -1,25 +1,47 @@
+from __future__ import annotations
+
+import contextvars
 import getpass
 import hashlib
 import os
 import re
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
 from datetime import date, datetime
-from time import sleep
-from typing import TYPE_CHECKING
+from time import monotonic, sleep
+from typing import TYPE_CHECKING, Callable, Iterator
 
-import pygit2
-from github import Github
-from github.GithubException import BadCredentialsException, GithubException
-from github.Repository import Repository
 from platformdirs import user_data_dir
 
+from .api import accounted, install_accounting
+from .authors import AuthorsIndex
+from .constants import (CLONE_DEPTH, FORK_READY_INITIAL_DELAY,
+                        FORK_READY_TIMEOUT, MAIN_REF, MAIN_REFSPEC,
+                        ORIGIN_MAIN_REF, PUSH_CONCURRENCY, SPARSE_PATHS)
+from .httpcache import ResponseCache, get_http_cache_path
+from .lazy import LazyModule
+from .outbox import Outbox, get_outbox_path
+from .parser import parse_member
+from .pulls import PullRequestCache, find_open_pull, get_pull_cache_path
+from .session import SessionCache, get_session_path, is_auth_error
+from .strings import (MD_CONTENT, MESSAGE_FILE_EDITED_PR, MESSAGE_FILE_QUEUED,
+                      MESSAGE_FILE_QUEUED_ERROR, MESSAGE_FILE_SAVED_PR,
+                      MESSAGE_FORK_NOT_READY, MESSAGE_LOAD_FILE_ERROR,
+                      MESSAGE_OUTBOX_EMPTY, MESSAGE_OUTBOX_LEFT,
+                      MESSAGE_PROMPT_FOR_GITHUB_TOKEN, MESSAGE_REPO_NOT_FOUND,
+                      MESSAGE_SYNC_ERROR, MESSAGE_UNAUTHORIZED)
+
 if TYPE_CHECKING:
-    from .main import MemberApp
+    import github
+    import pygit2
+    from github.Repository import Repository
 
-from .strings import (MD_CONTENT, MESSAGE_FILE_EDITED_PR,
-                      MESSAGE_FILE_SAVED_PR, MESSAGE_LOAD_FILE_ERROR,
-                      MESSAGE_PROMPT_FOR_GITHUB_TOKEN, MESSAGE_REPO_NOT_FOUND,
-                      MESSAGE_UNAUTHORIZED)
+    from .main import MemberApp
+    from .progress import ProgressCallbacks
+else:
+    github = LazyModule("github")
+    pygit2 = LazyModule("pygit2")
 
 
 def _compute_file_name(aliases: list[str], name: str, email: str) -> str:
@@ -40,81 +62,315 @@ def _read_file(file_path: str) -> str:
         return fd.read()
 
 
-def _append_file(file_content: str, file_path: str) -> None:
-    os.makedirs(os.path.dirname(file_path), exist_ok=True)
-    with open(file_path, "a", encoding="utf-8") as fd:
-        fd.write(file_content)
-
-
 def _write_file(file_content: str, file_path: str) -> None:
     os.makedirs(os.path.dirname(file_path), exist_ok=True)
     with open(file_path, "w", encoding="utf-8") as fd:
         fd.write(file_content)
 
 
-def _commit_and_push(
+def _member_path(name_file: str) -> str:
+    # Repository path, always "/"-separated as git trees are
+    return f"blog/members/{name_file}"
+
+
+# Characters kept as they are in a branch name, anything else is replaced
+_BRANCH_UNSAFE = re.compile(r"[^\w-]+")
+
+
+def _profile_branch(name_file: str) -> str:
+    """The ``profile/...`` branch a member file is saved on.
+
+    File stems can hold characters git refuses in a ref (a space, ``:``,
+    ``..``...); those are replaced, and a short hash of the file name keeps
+    the branch apart from other stems that map to the same text.
+    """
+    stem = os.path.splitext(name_file)[0]
+    safe = _BRANCH_UNSAFE.sub("-", stem).strip("-")
+    digest = hashlib.sha1(name_file.encode("utf-8")).hexdigest()[:8]
+    if safe != stem:
+        safe = f"{safe}-{digest}" if safe else digest
+    branch = f"profile/{safe}"
+    if not pygit2.reference_is_valid_name(f"refs/heads/{branch}"):
+        branch = f"profile/{digest}"
+    return branch
+
+
+def _read_tree_file(tree: pygit2.Tree | None, path: str) -> str:
+    if tree is None:
+        return ""
+    try:
+        blob = tree[path]
+    except KeyError:
+        return ""
+    return blob.data.decode("utf-8")
+
+
+def _build_tree(
+    repo: pygit2.repository.Repository,
+    tree: pygit2.Tree | None,
+    blobs: dict[str, pygit2.Oid],
+) -> pygit2.Oid:
+    """Write a copy of ``tree`` with the ``blobs`` entries swapped in.
+
+    Only the subtrees on the way to a changed path are rebuilt; every other
+    entry keeps pointing at the object HEAD already has.
+    """
+    builder = (
+        repo.TreeBuilder(tree) if tree is not None else repo.TreeBuilder()
+    )
+    subdirs: dict[str, dict[str, pygit2.Oid]] = {}
+    for path, oid in blobs.items():
+        name, _, rest = path.partition("/")
+        if rest:
+            subdirs.setdefault(name, {})[rest] = oid
+        else:
+            builder.insert(name, oid, pygit2.GIT_FILEMODE_BLOB)
+    for name, sub_blobs in subdirs.items():
+        subtree = None
+        if tree is not None and name in tree:
+            subtree = tree[name]
+            if not isinstance(subtree, pygit2.Tree):
+                subtree = None
+        builder.insert(
+            name,
+            _build_tree(repo, subtree, sub_blobs),
+            pygit2.GIT_FILEMODE_TREE,
+        )
+    return builder.write()
+
+
+@dataclass(slots=True)
+class ProfileChange:
+    """A member file to commit on its own ``profile/...`` branch."""
+
+    name_file: str
+    file_content: str
+    was_changed: bool
+    aliases: list[str]
+    name: str
+    email: str
+
+    @property
+    def branch(self) -> str:
+        return _profile_branch(self.name_file)
+
+    @property
+    def commit_msg(self) -> str:
+        verb = "Changed" if self.was_changed else "Added"
+        return f"{verb} {self.name_file}"
+
+
+def _commit_files(
     repo_path: str,
-    token: str,
-    was_changed: bool,
-    name_file: str,
+    files: dict[str, str],
     name: str,
     email: str,
-) -> tuple[
-    str,
-    pygit2.repository.Repository,
-    pygit2.remotes.Remote,
-    pygit2.callbacks.RemoteCallbacks,
-]:
+    commit_msg: str,
+    authors: list[tuple[list[str], str, str]] | None = None,
+    branch: str | None = None,
+    on_stage: Callable[[str], None] | None = None,
+) -> str:
+    """Commit ``files`` (repository path to content) without a checkout.
+
+    The blobs go straight into the object database and the tree is built
+    from the parent's, so the cost depends on the files changed and nothing
+    else in the checkout can leak into the commit. ``authors`` entries are
+    added to the parent's AUTHORS blob.
+
+    The commit goes to HEAD, or to ``branch`` when given: on top of it if
+    it exists, else branched off HEAD. Only HEAD commits write the files
+    to the checkout and update the index; a branch commit stays in git,
+    since syncing resets the checkout to main and would delete them. See
+    ``pending_member_files`` for reading those back. Returns the name of
+    the updated reference. ``on_stage`` is told when writing and
+    committing start, see ``SAVE_STAGES``.
+    """
     repo = pygit2.repository.Repository(repo_path)
-    repo.index.add_all()
-    repo.index.write()
+    head = None if repo.head_is_unborn else repo.head.peel(pygit2.Commit)
+    if branch is None:
+        ref_name, parent = "HEAD", head
+    else:
+        ref_name = f"refs/heads/{branch}"
+        ref = repo.references.get(ref_name)
+        parent = ref.peel(pygit2.Commit) if ref is not None else head
+    base_tree = parent.tree if parent is not None else None
+
+    files = dict(files)
+    if authors:
+        contents = _read_tree_file(base_tree, "AUTHORS")
+        new_contents = _add_authors(contents, authors)
+        if new_contents != contents:
+            files["AUTHORS"] = new_contents
+
+    if on_stage is not None:
+        on_stage("writing")
+    blobs = {
+        path: repo.create_blob(content.encode("utf-8"))
+        for path, content in files.items()
+    }
+    if branch is None:
+        for path, content in files.items():
+            _write_file(content, os.path.join(repo_path, *path.split("/")))
+
+    if on_stage is not None:
+        on_stage("committing")
     author_sig = pygit2.Signature(name or "Unknown", email or "unknown@email")
-    tree_id = repo.index.write_tree()
-    parents = [] if repo.head_is_unborn else [repo.head.target]
-    commit_msg = (
-        f"Changed {name_file}" if was_changed else f"Added {name_file}"
-    )
+    tree_id = _build_tree(repo, base_tree, blobs)
+    parents = [parent.id] if parent is not None else []
     repo.create_commit(
-        "HEAD", author_sig, author_sig, commit_msg, tree_id, parents
+        ref_name, author_sig, author_sig, commit_msg, tree_id, parents
     )
 
-    callbacks = pygit2.callbacks.RemoteCallbacks(
-        credentials=pygit2.UserPass(token, "x-oauth-basic")
-    )
+    if branch is None:
+        for path in files:
+            repo.index.add(path)
+        repo.index.write()
+        return repo.head.name
+    return ref_name
+
+
+def _push(repo_path: str, token: str, refspecs: list[str]) -> tuple[
+    pygit2.repository.Repository,
+    pygit2.remotes.Remote,
+    pygit2.callbacks.RemoteCallbacks,
+]:
+    # A Repository of its own, so pushes can run on several threads
+    repo = pygit2.repository.Repository(repo_path)
+    callbacks = _callbacks(token, "push")
     remote = repo.remotes["origin"]
-    remote.push([repo.head.name], callbacks=callbacks)
-    return commit_msg, repo, remote, callbacks
+    remote.push(refspecs, callbacks=callbacks)
+    callbacks.finish()
+    return repo, remote, callbacks
 
 
-def _create_member_file(
-    file_content: str,
-    current_file: str | None,
-    repo_path: str,
-    aliases: list[str],
-    name: str,
-    email: str,
-) -> tuple[str, str]:
-    # Name the file
-    name_file = (
-        current_file
-        if current_file is not None
-        else _compute_file_name(aliases, name, email)
-    )
+def _callbacks(token: str, kind: str) -> ProgressCallbacks:
+    from .progress import ProgressCallbacks
+
+    return ProgressCallbacks(pygit2.UserPass(token, "x-oauth-basic"), kind)
+
+
+def scan_member_files(repo_path: str, batch_size: int) -> Iterator[list[str]]:
+    """Yield the ``*.md`` names in ``blog/members`` in batches, unsorted.
+
+    The first batch holds ``batch_size`` names so something can be shown
+    quickly; each following batch doubles to keep the number of hand-offs
+    to the UI logarithmic in the member count.
+    """
+    members_path = os.path.join(repo_path, "blog", "members")
+    batch = []
+    try:
+        with os.scandir(members_path) as entries:
+            for entry in entries:
+                name = entry.name
+                if (
+                    name.endswith(".md")
+                    and not name.startswith(".")
+                    and entry.is_file()
+                ):
+                    batch.append(name)
+                    if len(batch) >= batch_size:
+                        yield batch
+                        batch = []
+                        batch_size *= 2
+    except FileNotFoundError:
+        return
+    if batch:
+        yield batch
+
+
+def _open_checkout(repo_path: str) -> pygit2.repository.Repository | None:
+    try:
+        return pygit2.repository.Repository(
+            repo_path, pygit2.enums.RepositoryOpenFlag.NO_SEARCH
+        )
+    except pygit2.GitError:
+        return None
+
 
-    # Write file
+def _branch_member_file(
+    repo: pygit2.repository.Repository, branch: str
+) -> str | None:
+    # Every commit on a profile branch changes that one member file (and
+    # maybe AUTHORS), so the tip's own diff tells which file it holds
+    commit = repo.branches.local[branch].peel(pygit2.Commit)
+    if not commit.parents:
+        return None
+    diff = commit.parents[0].tree.diff_to_tree(commit.tree)
+    prefix = _member_path("")
+    for delta in diff.deltas:
+        path = delta.new_file.path
+        if path.startswith(prefix) and path.endswith(".md"):
+            return path.removeprefix(prefix)
+    return None
+
+
+def _pending_content(
+    repo: pygit2.repository.Repository, name_file: str
+) -> str | None:
+    ref = repo.references.get(f"refs/heads/{_profile_branch(name_file)}")
+    if ref is None:
+        return None
+    tree = ref.peel(pygit2.Commit).tree
+    content = _read_tree_file(tree, _member_path(name_file))
+    return content or None
+
+
+def pending_member_files(repo_path: str) -> list[str]:
+    """Member files saved on a local ``profile/...`` branch.
+
+    These are not in the checkout until their pull request is merged and
+    main is synced, so the list adds them to what ``scan_member_files``
+    finds.
+    """
+    repo = _open_checkout(repo_path)
+    if repo is None:
+        return []
+    names = []
+    for branch in repo.branches.local:
+        if not branch.startswith("profile/"):
+            continue
+        name_file = _branch_member_file(repo, branch)
+        if (
+            name_file is not None
+            and _profile_branch(name_file) == branch
+            and _pending_content(repo, name_file) is not None
+        ):
+            names.append(name_file)
+    return names
+
+
+def read_member_file(repo_path: str, name_file: str) -> str | None:
+    """Content of a member file, the saved and unmerged version first."""
+    repo = _open_checkout(repo_path)
+    if repo is not None:
+        content = _pending_content(repo, name_file)
+        if content is not None:
+            return content
     file_path = os.path.join(repo_path, "blog", "members", name_file)
-    _write_file(file_content, file_path)
-    return name_file, file_path
+    if not os.path.exists(file_path):
+        return None
+    return _read_file(file_path)
 
 
-def _write_authors_file(
-    repo_path: str, aliases: list[str], name: str, email: str
-):
-    file_path = os.path.join(repo_path, "AUTHORS")
-    contents = _read_file(file_path)
-    file_content = f"\n{name}({_get_alias(aliases, name)}) <{email}>"
-    if file_content.strip() not in contents:
-        _append_file(file_content, file_path)
+def _member_file_name(
+    current_file: str | None, aliases: list[str], name: str, email: str
+) -> str:
+    if current_file is not None:
+        return current_file
+    return _compute_file_name(aliases, name, email)
+
+
+def _add_authors(
+    contents: str, entries: list[tuple[list[str], str, str]]
+) -> str:
+    # One parse of the file, then a set lookup per author however many
+    # are added, and the new contents in one piece
+    index = AuthorsIndex(contents)
+    index.add_many(
+        (name, _get_alias(aliases, name), email)
+        for aliases, name, email in entries
+    )
+    return index.contents
 
 
 def _get_alias(aliases: list[str], name: str) -> str:
@@ -123,36 +379,328 @@ def _get_alias(aliases: list[str], name: str) -> str:
     return name
 
 
+def get_repo_path() -> str:
+    return user_data_dir(appname="edit-python-pe", appauthor="python.pe")
+
+
+def get_token() -> str:
+    return getpass.getpass(str(MESSAGE_PROMPT_FOR_GITHUB_TOKEN))
+
+
+def _github_client(token: str) -> github.Github:
+    # Every client shares the accounting and caching connection layer
+    install_accounting(ResponseCache(get_http_cache_path()))
+    return github.Github(token)
+
+
+@accounted("get_repo")
+def connect_repo(token: str) -> Repository:
+    """Validate ``token`` by fetching the upstream python.pe repository.
+
+    Raises ``BadCredentialsException``/``GithubException`` so callers that
+    cannot print and exit (the TUI workers) can report them their own way.
+    """
+    return _github_client(token).get_repo("pythonpe/python.pe")
+
+
 def get_repo() -> tuple[str, Repository]:
-    token = getpass.getpass(MESSAGE_PROMPT_FOR_GITHUB_TOKEN)
-    g = Github(token)
+    token = get_token()
 
     try:
-        return token, g.get_repo("pythonpe/python.pe")
-    except BadCredentialsException:
+        return token, connect_repo(token)
+    except github.BadCredentialsException:
         print(MESSAGE_UNAUTHORIZED)
         exit(1)
-    except GithubException:
+    except github.GithubException:
         print(MESSAGE_REPO_NOT_FOUND)
         exit(1)
 
 
-def fork_repo(token: str, original_repo: Repository) -> tuple[str, Repository]:
+def _wait_for_fork(
+    forked_repo: Repository, timeout: float = FORK_READY_TIMEOUT
+) -> bool:
+    """Poll until GitHub serves the fork's ``main`` branch.
+
+    An existing fork answers the first probe, so this returns at once;
+    a new one is retried with exponential backoff until ``timeout``.
+    Only a 404 means the fork is not ready yet, any other error (a revoked
+    token, a rate limit...) is raised at once.
+    """
+    deadline = monotonic() + timeout
+    delay = FORK_READY_INITIAL_DELAY
+    while True:
+        try:
+            forked_repo.get_branch("main")
+            return True
+        except github.UnknownObjectException:
+            pass
+        remaining = deadline - monotonic()
+        if remaining <= 0:
+            return False
+        sleep(min(delay, remaining))
+        delay *= 2
+
+
+def _open_cached_repo(
+    repo_path: str, clone_url: str
+) -> pygit2.repository.Repository | None:
+    """Return the checkout left by a previous run, if it can be reused.
+
+    The cache is discarded when it is not a readable repository or when its
+    ``origin`` remote points at a different fork.
+    """
+    if not os.path.exists(os.path.join(repo_path, ".git")):
+        return None
+    try:
+        repo = pygit2.repository.Repository(
+            repo_path, pygit2.enums.RepositoryOpenFlag.NO_SEARCH
+        )
+        origin_url = repo.remotes["origin"].url
+    except (pygit2.GitError, KeyError):
+        return None
+    if origin_url != clone_url:
+        return None
+    return repo
+
+
+def _checkout_main(
+    repo: pygit2.repository.Repository,
+    target: pygit2.Oid,
+    paths: list[str] | None = None,
+) -> None:
+    # Make the working tree match ``target`` exactly, dropping local edits
+    # and stray files as the former rmtree + clone did, then point ``main``
+    # at it. With ``paths`` only those are written to disk, but the index
+    # still gets the full tree so commits keep every other file.
+    commit = repo[target].peel(pygit2.Commit)
+    repo.checkout_tree(
+        commit.tree,
+        paths=paths,
+        strategy=pygit2.enums.CheckoutStrategy.FORCE
+        | pygit2.enums.CheckoutStrategy.REMOVE_UNTRACKED,
+    )
+    if paths:
+        repo.index.read_tree(commit.tree)
+        repo.index.write()
+    repo.references.create(MAIN_REF, commit.id, force=True)
+    repo.set_head(MAIN_REF)
+
+
+def _fetch_main(
+    repo: pygit2.repository.Repository,
+    callbacks: pygit2.callbacks.RemoteCallbacks,
+    sparse: bool,
+) -> None:
+    repo.remotes["origin"].fetch(
+        [MAIN_REFSPEC],
+        callbacks=callbacks,
+        depth=CLONE_DEPTH if sparse else 0,
+    )
+
+
+def _checkout_origin_main(
+    repo: pygit2.repository.Repository, sparse: bool
+) -> None:
+    _checkout_main(
+        repo,
+        repo.references[ORIGIN_MAIN_REF].target,
+        SPARSE_PATHS if sparse else None,
+    )
+
+
+def _sparse_clone(
+    url: str, repo_path: str, callbacks: pygit2.callbacks.RemoteCallbacks
+) -> pygit2.repository.Repository:
+    """Shallow clone of ``main`` with only ``SPARSE_PATHS`` checked out.
+
+    libgit2 has no partial clone (blob filter) support, so the shallow
+    fetch is what bounds the transferred objects.
+    """
+    repo = pygit2.init_repository(repo_path)
+    repo.remotes.create("origin", url)
+    _fetch_main(repo, callbacks, sparse=True)
+    _checkout_origin_main(repo, sparse=True)
+    return repo
+
+
+@accounted("fork_repo")
+def fork_repo(
+    token: str, original_repo: Repository, sparse: bool = True
+) -> tuple[str, Repository]:
     forked_repo = original_repo.create_fork()
+    return _checkout_fork(token, forked_repo, sparse), forked_repo
+
+
+def _checkout_fork(token: str, forked_repo: Repository, sparse: bool) -> str:
     forked_repo_url = forked_repo.clone_url
-    repo_path = user_data_dir(appname="edit-python-pe", appauthor="python.pe")
+    repo_path = get_repo_path()
+
+    # Reuse the previous checkout with an incremental fetch when possible
+    cached_repo = _open_cached_repo(repo_path, forked_repo_url)
+    if cached_repo is not None:
+        # A failed fetch (network, token) is raised: the checkout is fine
+        # and may hold profile branches that were never pushed
+        callbacks = _callbacks(token, "fetch")
+        _fetch_main(cached_repo, callbacks, sparse)
+        callbacks.finish()
+        try:
+            _checkout_origin_main(cached_repo, sparse)
+            return repo_path
+        except (pygit2.GitError, KeyError):
+            pass
 
+    # The old checkout is only removed once there is a fork to clone
+    if not _wait_for_fork(forked_repo):
+        raise TimeoutError(MESSAGE_FORK_NOT_READY)
     if os.path.exists(repo_path):
         shutil.rmtree(repo_path)
 
-    callbacks = pygit2.callbacks.RemoteCallbacks(
-        credentials=pygit2.UserPass(token, "x-oauth-basic")
+    callbacks = _callbacks(token, "fetch")
+    if sparse:
+        _sparse_clone(forked_repo_url, repo_path, callbacks)
+    else:
+        pygit2.clone_repository(
+            forked_repo_url, repo_path, callbacks=callbacks
+        )
+    callbacks.finish()
+    return repo_path
+
+
+def _resume_session(token: str, entry: dict) -> tuple[Repository, Repository]:
+    # Lazy objects: nothing is requested until an attribute missing from
+    # the session is read, or a method calls the API
+    g = _github_client(token)
+    original_repo = g.get_repo("pythonpe/python.pe", lazy=True)
+    forked_repo = github.Repository.Repository(
+        g.requester,
+        {},
+        {
+            "url": f"/repos/{entry['fork']}",
+            "full_name": entry["fork"],
+            "clone_url": entry["clone_url"],
+            "owner": {"login": entry["login"]},
+        },
+        completed=False,
+    )
+    return original_repo, forked_repo
+
+
+def open_fork(
+    token: str,
+    session: SessionCache | None = None,
+    on_sync: Callable[[], None] | None = None,
+    sparse: bool = True,
+) -> tuple[Repository, str, Repository]:
+    """Connect, fork and sync, reusing what ``session`` knows of ``token``.
+
+    A remembered session skips validating the token and asking for the
+    fork: only the git fetch is made. If that fails (fork deleted, token
+    revoked...) the session is dropped and the full round is done again.
+    ``on_sync`` is called once the token is accepted, before git runs.
+    Returns the upstream repository, the checkout path and the fork.
+    """
+    entry = session.get(token) if session is not None else None
+    if entry is not None:
+        original_repo, forked_repo = _resume_session(token, entry)
+        if on_sync is not None:
+            on_sync()
+        try:
+            repo_path = _checkout_fork(token, forked_repo, sparse)
+            return original_repo, repo_path, forked_repo
+        except (pygit2.GitError, github.GithubException, TimeoutError):
+            # Saved now, the full round below may fail too
+            session.discard(token)
+            save_session(session)
+
+    original_repo = connect_repo(token)
+    if on_sync is not None:
+        on_sync()
+    repo_path, forked_repo = fork_repo(token, original_repo, sparse)
+    if session is not None:
+        session.remember(
+            token,
+            forked_repo.owner.login,
+            forked_repo.full_name,
+            forked_repo.clone_url,
+        )
+        save_session(session)
+    return original_repo, repo_path, forked_repo
+
+
+def save_session(session: SessionCache) -> None:
+    # Like the pull request cache, the session only saves requests
+    try:
+        session.save()
+    except OSError:
+        pass
+
+
+def _commit_profile(
+    repo_path: str,
+    change: ProfileChange,
+    on_stage: Callable[[str], None] | None = None,
+) -> None:
+    _commit_files(
+        repo_path,
+        {_member_path(change.name_file): change.file_content},
+        change.name,
+        change.email,
+        change.commit_msg,
+        authors=[(change.aliases, change.name, change.email)],
+        branch=change.branch,
+        on_stage=on_stage,
+    )
+
+
+def _publish_profile(
+    repo_path: str,
+    token: str,
+    original_repo: Repository,
+    fork_owner: str,
+    change: ProfileChange,
+    pull_cache: PullRequestCache | None,
+    on_stage: Callable[[str], None] | None = None,
+) -> str:
+    """Push the profile branch and open its PR unless one is open."""
+    if on_stage is not None:
+        on_stage("pushing")
+    ref_name = f"refs/heads/{change.branch}"
+    _push(repo_path, token, [f"+{ref_name}:{ref_name}"])
+    if on_stage is not None:
+        on_stage("opening_pr")
+
+    head_branch = f"{fork_owner}:{change.branch}"
+    base_branch = "main"
+    # If editing, an open PR for the branch already carries the new commit
+    if change.was_changed:
+        pr_found = find_open_pull(
+            original_repo,
+            change.name_file,
+            head_branch,
+            base_branch,
+            pull_cache,
+        )
+        if pr_found:
+            return MESSAGE_FILE_EDITED_PR.format(name_file=change.name_file)
+
+    first_alias = change.aliases[0] if change.aliases else ""
+    pr_body = (
+        f"Changing an entry to `blog/members` for {change.name} (alias: {first_alias})."
+        if change.was_changed
+        else f"Creating a new entry to `blog/members` for {change.name} (alias: {first_alias})."
+    )
+    pr = original_repo.create_pull(
+        title=change.commit_msg,
+        body=pr_body,
+        head=head_branch,
+        base=base_branch,
     )
-    sleep(3)
-    pygit2.clone_repository(forked_repo_url, repo_path, callbacks=callbacks)
-    return repo_path, forked_repo
+    if pull_cache is not None:
+        pull_cache.set(change.name_file, head_branch, pr.number)
+    return MESSAGE_FILE_SAVED_PR.format(name_file=change.name_file)
 
 
+@accounted("create_pr")
 def create_pr(
     file_content: str,
     current_file: str | None,
@@ -163,162 +711,269 @@ def create_pr(
     aliases: list[str],
     name: str,
     email: str,
+    pull_cache: PullRequestCache | None = None,
+    outbox: Outbox | None = None,
+    on_stage: Callable[[str], None] | None = None,
 ) -> str:
-    name_file, file_path = _create_member_file(
-        file_content, current_file, repo_path, aliases, name, email
-    )
-    _write_authors_file(repo_path, aliases, name, email)
+    """Commit the profile, push it and open its PR.
 
-    # commit & push
-    commit_msg, repo, remote, callbacks = _commit_and_push(
-        repo_path,
-        token,
+    With ``outbox``, a failure after the local commit queues the push and
+    PR instead of losing the edit; authentication errors are still raised.
+    ``on_stage`` is called as each of ``SAVE_STAGES`` starts.
+    """
+    change = _profile_change(file_content, current_file, aliases, name, email)
+    _commit_profile(repo_path, change, on_stage)
+    try:
+        return _publish_profile(
+            repo_path,
+            token,
+            original_repo,
+            forked_repo.owner.login,
+            change,
+            pull_cache,
+            on_stage,
+        )
+    # requests' network errors are OSErrors, not GithubExceptions
+    except (pygit2.GitError, github.GithubException, OSError) as e:
+        if outbox is None or is_auth_error(e):
+            raise
+        _queue_change(outbox, change)
+        return MESSAGE_FILE_QUEUED_ERROR.format(
+            name_file=change.name_file, error=e
+        )
+    finally:
+        _save_pull_cache(pull_cache)
+
+
+def queue_pr(
+    file_content: str,
+    current_file: str | None,
+    repo_path: str,
+    aliases: list[str],
+    name: str,
+    email: str,
+    outbox: Outbox,
+    on_stage: Callable[[str], None] | None = None,
+) -> str:
+    """Commit the profile locally and leave its push and PR in ``outbox``.
+
+    Nothing goes over the network; ``drain_outbox`` sends it later.
+    """
+    change = _profile_change(file_content, current_file, aliases, name, email)
+    _keep_new(outbox, change)
+    _commit_profile(repo_path, change, on_stage)
+    _queue_change(outbox, change)
+    return MESSAGE_FILE_QUEUED.format(name_file=change.name_file)
+
+
+def _profile_change(
+    file_content: str,
+    current_file: str | None,
+    aliases: list[str],
+    name: str,
+    email: str,
+) -> ProfileChange:
+    return ProfileChange(
+        _member_file_name(current_file, aliases, name, email),
+        file_content,
         current_file is not None,
-        name_file,
+        aliases,
         name,
         email,
     )
 
-    # PR logic
-    pr_title = commit_msg
-    first_alias = aliases[0] if aliases else ""
-    pr_body = (
-        f"Changing an entry to `blog/members` for {name} (alias: {first_alias})."
-        if current_file
-        else f"Creating a new entry to `blog/members` for {name} (alias: {first_alias})."
-    )
+
+def _keep_new(outbox: Outbox, change: ProfileChange) -> None:
+    # A profile created offline and edited again is still new to GitHub
+    previous = outbox.get(change.name_file)
+    if previous is not None and not previous.change["was_changed"]:
+        change.was_changed = False
+
+
+def _queue_change(outbox: Outbox, change: ProfileChange) -> None:
+    _keep_new(outbox, change)
+    outbox.put(change.name_file, asdict(change))
+
+
+def _has_branch(repo_path: str, branch: str) -> bool:
+    repo = pygit2.repository.Repository(repo_path)
+    return repo.references.get(f"refs/heads/{branch}") is not None
+
+
+@accounted("drain_outbox")
+def drain_outbox(
+    outbox: Outbox,
+    repo_path: str,
+    original_repo: Repository,
+    forked_repo: Repository,
+    token: str,
+    pull_cache: PullRequestCache | None = None,
+    force: bool = False,
+) -> list[str]:
+    """Push and open the PRs of the queued profiles, oldest first.
+
+    Only jobs whose retry time has come are tried, or all of them with
+    ``force``. A job that fails is rescheduled with backoff and the rest
+    are still tried; an authentication error stops the drain and is
+    raised, since every other job would fail the same way. Returns the
+    messages of the profiles sent.
+    """
+    messages = []
     fork_owner = forked_repo.owner.login
-    head_branch = f"{fork_owner}:main"
-    base_branch = "main"
+    try:
+        for job in outbox.jobs() if force else outbox.due():
+            change = ProfileChange(**job.change)
+            try:
+                # A fresh clone of the fork lost the local branch
+                if not _has_branch(repo_path, change.branch):
+                    _commit_profile(repo_path, change)
+                message = _publish_profile(
+                    repo_path,
+                    token,
+                    original_repo,
+                    fork_owner,
+                    change,
+                    pull_cache,
+                )
+            except (pygit2.GitError, github.GithubException, OSError) as e:
+                if is_auth_error(e):
+                    raise
+                outbox.retry_later(job, str(e))
+                continue
+            outbox.remove(job)
+            messages.append(message)
+    finally:
+        _save_pull_cache(pull_cache)
+    return messages
+
 
-    # If editing, retrieve PR by title and push to its branch
-    if current_file:
-        # Try to find an open PR with matching title
-        prs = original_repo.get_pulls(
-            state="open", sort="created", base=base_branch
+def run_sync() -> None:
+    """Entry point of ``edit-python-pe sync``."""
+    outbox = Outbox(get_outbox_path())
+    if not outbox.jobs():
+        print(MESSAGE_OUTBOX_EMPTY)
+        return
+
+    token = get_token()
+    session = SessionCache.load(get_session_path())
+    try:
+        original_repo, repo_path, forked_repo = open_fork(token, session)
+        messages = drain_outbox(
+            outbox,
+            repo_path,
+            original_repo,
+            forked_repo,
+            token,
+            PullRequestCache.load(get_pull_cache_path()),
+            force=True,
         )
-        pr_found = None
-        for pr in prs:
-            if current_file in pr.title:
-                pr_found = pr
-                break
-        if pr_found:
-            # Push to the PR branch (simulate, as actual branch logic may differ)
-            remote.push([repo.head.name], callbacks=callbacks)
-            return MESSAGE_FILE_EDITED_PR.format(name_file=name_file)
-        else:
-            original_repo.create_pull(
-                title=pr_title,
-                body=pr_body,
-                head=head_branch,
-                base=base_branch,
+    except (pygit2.GitError, github.GithubException) as e:
+        if not is_auth_error(e):
+            print(MESSAGE_SYNC_ERROR.format(error=e))
+            exit(1)
+        session.discard(token)
+        save_session(session)
+        print(MESSAGE_UNAUTHORIZED)
+        exit(1)
+    except TimeoutError as e:
+        print(e)
+        exit(1)
+    for message in messages:
+        print(message)
+    left = len(outbox.jobs())
+    if left:
+        print(MESSAGE_OUTBOX_LEFT.format(count=left))
+        exit(1)
+
+
+@accounted("create_prs")
+def create_prs(
+    changes: list[ProfileChange],
+    repo_path: str,
+    original_repo: Repository,
+    forked_repo: Repository,
+    token: str,
+    pull_cache: PullRequestCache | None = None,
+    max_workers: int = PUSH_CONCURRENCY,
+) -> list[str]:
+    """Open one pull request per profile, each from its own branch.
+
+    Commits only write objects and refs, so they are made in turn; the
+    pushes and GitHub calls, which wait on the network, run on up to
+    ``max_workers`` threads. Messages come back in the order of
+    ``changes``.
+    """
+    for change in changes:
+        _commit_profile(repo_path, change)
+    fork_owner = forked_repo.owner.login
+    # Each task runs in a copy of this context, so its requests are still
+    # accounted to create_prs
+    contexts = [contextvars.copy_context() for _ in changes]
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(
+                executor.map(
+                    lambda context, change: context.run(
+                        _publish_profile,
+                        repo_path,
+                        token,
+                        original_repo,
+                        fork_owner,
+                        change,
+                        pull_cache,
+                    ),
+                    contexts,
+                    changes,
+                )
             )
-            return MESSAGE_FILE_SAVED_PR.format(name_file=name_file)
-    else:
-        original_repo.create_pull(
-            title=pr_title,
-            body=pr_body,
-            head=head_branch,
-            base=base_branch,
-        )
-        return MESSAGE_FILE_SAVED_PR.format(name_file=name_file)
+    finally:
+        _save_pull_cache(pull_cache)
 
 
-def load_file_into_form(app: "MemberApp", filename: str) -> None:
-    path_md = os.path.join(app.repo_path, "blog", "members", filename)
-    if not os.path.exists(path_md):
+def _save_pull_cache(pull_cache: PullRequestCache | None) -> None:
+    # The cache only saves requests; failing to write it is not an error
+    if pull_cache is None:
         return
     try:
-        content = _read_file(path_md)
+        pull_cache.save()
+    except OSError:
+        pass
+
+
+def load_file_into_form(app: "MemberApp", filename: str) -> None:
+    try:
+        content = read_member_file(app.repo_path, filename)
     except Exception as e:
         app.exit(
             message=MESSAGE_LOAD_FILE_ERROR.format(filename=filename, error=e)
         )
         return
+    if content is None:
+        return
 
-    app.clear_form()
+    # The index answers for files still matching their committed blob
+    profile = None
+    if app.member_index is not None:
+        profile = app.member_index.lookup(filename, content)
+    if profile is None:
+        profile = parse_member(content)
 
-    # Extract YAML frontmatter
-    yaml_match = re.search(r"---\n(.*?)---\n", content, re.DOTALL)
-    yaml_data = {}
-    if yaml_match:
-        try:
-            import yaml
-
-            yaml_data = yaml.safe_load(yaml_match.group(1))
-        except Exception:
-            yaml_data = {}
-    app.name_input.value = yaml_data.get("author", "")
-    app.city_input.value = yaml_data.get("location", "")
-
-    # Extract member name from first markdown header
-    name_match = re.search(r"^# (.+)", content, re.MULTILINE)
-    if name_match:
-        app.name_input.value = name_match.group(1).strip()
-
-    # Extract gravatar email
-    gravatar_match = re.search(r"```\{gravatar\} ([^\n]+)", content)
-    if gravatar_match:
-        app.email_input.value = gravatar_match.group(1).strip()
-
-    # Extract social links from raw HTML block
-    social_block = re.search(r"```\{raw\} html\n(.*?)```", content, re.DOTALL)
-    if social_block:
-        social_html = social_block.group(1)
-        social_link_pattern = re.compile(
-            r'<a[^>]*href="([^"]+)"[^>]*>\s*<iconify-icon[^>]*icon="simple-icons:([^"]+)"',
-            re.DOTALL,
-        )
-        for match in social_link_pattern.finditer(social_html):
-            url = match.group(1)
-            platform = match.group(2)
-            app.add_social_entry(platform)
-            last_entry = app.social_entries[-1]
-            last_entry.url_input.value = url
-
-    # Extract aliases, city, homepage from colon-prefixed lines
-    alias_match = re.search(r":Aliases:\s*([^\n]+)", content)
-    if alias_match:
-        aliases = [a.strip() for a in alias_match.group(1).split(",")]
-        for alias_val in aliases:
-            app.add_alias_entry()
-            app.alias_entries[-1].alias_input.value = alias_val
-    city_match = re.search(r":Ciudad:\s*([^\n]+)", content)
-    if city_match:
-        app.city_input.value = city_match.group(1).strip()
-    homepage_match = re.search(r":Homepage:\s*([^\n]+)", content)
-    if homepage_match:
-        app.homepage_input.value = homepage_match.group(1).strip()
-
-    # Extract markdown sections under headers
-    who_match = re.search(
-        r"### ¿Quién eres y a qué te dedicas\?\n(.*?)(?=^### |\Z)",
-        content,
-        re.DOTALL | re.MULTILINE,
-    )
-    if who_match:
-        app.who_area.text = who_match.group(1).strip()
-    python_match = re.search(
-        r"### ¿Cómo programas en Python\?\n(.*?)(?=^### |\Z)",
-        content,
-        re.DOTALL | re.MULTILINE,
-    )
-    if python_match:
-        app.python_area.text = python_match.group(1).strip()
-    contrib_match = re.search(
-        r"### ¿Tienes algún aporte a la comunidad de Python\?\n(.*?)(?=^### |\Z)",
-        content,
-        re.DOTALL | re.MULTILINE,
-    )
-    if contrib_match:
-        app.contributions_area.text = contrib_match.group(1).strip()
-    avail_match = re.search(
-        r"### ¿Estás disponible para hacer mentoring, consultorías, charlas\?\n(.*?)(?=^### |\Z)",
-        content,
-        re.DOTALL | re.MULTILINE,
-    )
-    if avail_match:
-        app.availability_area.text = avail_match.group(1).strip()
+    app.clear_form()
+    app.name_input.value = profile.name
+    app.email_input.value = profile.email
+    # Rows come from the pools in one go, new ones mounted together
+    socials = app.social_entries.acquire_many(len(profile.socials))
+    for row, (platform, url) in zip(socials, profile.socials):
+        row.reset(platform, url)
+    aliases = app.alias_entries.acquire_many(len(profile.aliases))
+    for row, alias_val in zip(aliases, profile.aliases):
+        row.reset(alias_val)
+    app.city_input.value = profile.city
+    app.homepage_input.value = profile.homepage
+    app.who_area.text = profile.who
+    app.python_area.text = profile.python
+    app.contributions_area.text = profile.contributions
+    app.availability_area.text = profile.availability
 
 
 def build_md_content(
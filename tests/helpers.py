@@ -0,0 +1,49 @@
+"""Helpers shared by several test modules."""
+
+import threading
+from http.server import ThreadingHTTPServer
+
+import pygit2
+
+
+def start_stub_server(handler) -> tuple[ThreadingHTTPServer, str]:
+    """Serve ``handler`` on a free local port until the test ends."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def make_remote(path: str, files: dict[str, str]) -> str:
+    """Create a bare repository at ``path`` whose ``main`` holds ``files``."""
+    repo = pygit2.init_repository(path, bare=True)
+    commit_files(repo, files)
+    return path
+
+
+def commit_files(repo, files: dict[str, str]) -> None:
+    """Commit ``files`` (path to content) on ``main`` of ``repo``."""
+
+    def build(entries: dict) -> pygit2.Oid:
+        builder = repo.TreeBuilder()
+        for name, value in entries.items():
+            if isinstance(value, dict):
+                builder.insert(name, build(value), pygit2.GIT_FILEMODE_TREE)
+            else:
+                blob = repo.create_blob(value.encode("utf-8"))
+                builder.insert(name, blob, pygit2.GIT_FILEMODE_BLOB)
+        return builder.write()
+
+    nested: dict = {}
+    for file_path, content in files.items():
+        *dirs, name = file_path.split("/")
+        node = nested
+        for d in dirs:
+            node = node.setdefault(d, {})
+        node[name] = content
+    sig = pygit2.Signature("Test", "test@email.com")
+    parents = [] if repo.head_is_unborn else [repo.head.target]
+    repo.create_commit(
+        "refs/heads/main", sig, sig, "commit", build(nested), parents
+    )
+    repo.set_head("refs/heads/main")
@@ -0,0 +1,115 @@
+import json
+import os
+import sys
+import tempfile
+import unittest
+from http.server import BaseHTTPRequestHandler
+from unittest.mock import patch
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src"))
+)
+from github import Auth, Github
+from github.Requester import Requester
+from helpers import start_stub_server
+
+from edit_python_pe.api import RequestStats, accounted, install_accounting
+
+REPO_JSON = {
+    "name": "python.pe",
+    "full_name": "pythonpe/python.pe",
+    "owner": {"login": "pythonpe"},
+}
+
+
+class _GitHubStub(BaseHTTPRequestHandler):
+    remaining = 5000
+
+    def do_GET(self):
+        _GitHubStub.remaining -= 1
+        if self.path.startswith("/repos/pythonpe/python.pe"):
+            body = json.dumps(REPO_JSON).encode()
+            self.send_response(200)
+        else:
+            body = b'{"message": "Not Found"}'
+            self.send_response(404)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("X-RateLimit-Limit", "5000")
+        self.send_header("X-RateLimit-Remaining", str(self.remaining))
+        self.send_header("X-RateLimit-Reset", "1700000000")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestRequestAccounting(unittest.TestCase):
+    def setUp(self):
+        self.server, self.base_url = start_stub_server(_GitHubStub)
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.addCleanup(Requester.resetConnectionClasses)
+        self.stats = RequestStats()
+        patcher = patch("edit_python_pe.api.STATS", self.stats)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        install_accounting()
+        self.github = Github(
+            auth=Auth.Token("token"),
+            base_url=self.base_url,
+            retry=None,
+            seconds_between_requests=None,
+        )
+
+    def test_requests_are_counted_per_endpoint_and_operation(self):
+        @accounted("get_repo")
+        def get_repo():
+            return self.github.get_repo("pythonpe/python.pe")
+
+        self.assertEqual(get_repo().full_name, "pythonpe/python.pe")
+        get_repo()
+        with self.assertRaises(Exception):
+            self.github.get_user("nobody").login
+
+        summary = self.stats.summary()
+        self.assertEqual(summary["requests"], 3)
+        endpoint = summary["endpoints"]["GET /repos/pythonpe/python.pe"]
+        self.assertEqual(endpoint["count"], 2)
+        self.assertEqual(endpoint["statuses"], {"200": 2})
+        self.assertEqual(sum(endpoint["histogram_ms"].values()), 2)
+        self.assertEqual(
+            summary["endpoints"]["GET /users/nobody"]["statuses"],
+            {"404": 1},
+        )
+        self.assertEqual(summary["operations"]["get_repo"]["requests"], 2)
+        self.assertEqual(summary["operations"]["get_repo"]["count"], 2)
+        self.assertEqual(summary["operations"]["other"]["requests"], 1)
+        self.assertEqual(summary["rate_limit"]["limit"], 5000)
+        self.assertEqual(
+            summary["rate_limit"]["remaining"], _GitHubStub.remaining
+        )
+        self.assertIn("3", self.stats.status_line())
+
+    def test_summary_is_written_as_json(self):
+        self.github.get_repo("pythonpe/python.pe")
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "stats", "api-usage.json")
+            self.stats.write(path)
+            with open(path, encoding="utf-8") as fd:
+                self.assertEqual(json.load(fd)["requests"], 1)
+
+
+class TestEndpointNames(unittest.TestCase):
+    def test_ids_and_queries_are_folded(self):
+        from edit_python_pe.api import _endpoint
+
+        self.assertEqual(
+            _endpoint("GET", "/repos/o/r/pulls/12?page=2"),
+            "GET /repos/o/r/pulls/{id}",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
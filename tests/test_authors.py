@@ -0,0 +1,48 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src"))
+)
+from edit_python_pe.authors import AuthorsIndex
+
+AUTHORS = """Ana Diaz(ana) <ana@example.com>
+Beto  Ruiz (beto)  <Beto@Example.com>
+# not an author line
+"""
+
+
+class TestAuthorsIndex(unittest.TestCase):
+    def test_entries_are_parsed_once_and_normalized(self):
+        index = AuthorsIndex(AUTHORS)
+        self.assertEqual(len(index), 2)
+        self.assertIn(("ANA", "ana@example.com"), index)
+        self.assertIn(("beto", " beto@example.COM"), index)
+        self.assertNotIn(("ana", "other@example.com"), index)
+
+    def test_near_duplicates_are_not_added(self):
+        index = AuthorsIndex(AUTHORS)
+        self.assertFalse(index.add("Ana  Díaz", "Ana", "ANA@example.com "))
+        self.assertFalse(index.add("Beto Ruiz", "beto", "beto@example.com"))
+        self.assertEqual(index.contents, AUTHORS)
+        self.assertEqual(index.added, "")
+
+    def test_bulk_insert_keeps_text_and_line_format(self):
+        index = AuthorsIndex("Ana Diaz(ana) <ana@example.com>")
+        entries = [
+            (f"Member {i}", f"m{i % 500}", f"m{i % 500}@example.com")
+            for i in range(2000)
+        ]
+        entries.append(("Ana", "ana", "ana@example.com"))
+        self.assertEqual(index.add_many(entries), 500)
+        lines = index.contents.split("\n")
+        self.assertEqual(lines[0], "Ana Diaz(ana) <ana@example.com>")
+        self.assertEqual(lines[1], "Member 0(m0) <m0@example.com>")
+        self.assertEqual(len(lines), 501)
+        # A fresh parse of the result knows every entry
+        self.assertEqual(len(AuthorsIndex(index.contents)), 501)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,149 @@
+import json
+import os
+import sys
+import tempfile
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler
+from unittest.mock import patch
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src"))
+)
+from github import Auth, Github
+from github.Requester import Requester
+from helpers import start_stub_server
+
+from edit_python_pe.api import RequestStats, install_accounting
+from edit_python_pe.httpcache import ResponseCache
+
+ETAG = '"v1"'
+
+
+class _ConditionalStub(BaseHTTPRequestHandler):
+    seen: list = []
+
+    def do_GET(self):
+        _ConditionalStub.seen.append(self.headers.get("If-None-Match"))
+        if self.headers.get("If-None-Match") == ETAG:
+            self.send_response(304)
+            self.send_header("ETag", ETAG)
+            self.send_header("X-RateLimit-Limit", "5000")
+            self.send_header("X-RateLimit-Remaining", "4999")
+            self.send_header("X-RateLimit-Reset", "1700000000")
+            self.end_headers()
+            return
+        body = json.dumps(
+            {"name": "python.pe", "full_name": "pythonpe/python.pe"}
+        ).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", ETAG)
+        self.send_header("X-RateLimit-Limit", "5000")
+        self.send_header("X-RateLimit-Remaining", "4998")
+        self.send_header("X-RateLimit-Reset", "1700000000")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestConditionalRequests(unittest.TestCase):
+    def setUp(self):
+        _ConditionalStub.seen = []
+        self.server, base_url = start_stub_server(_ConditionalStub)
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.stats = RequestStats()
+        patcher = patch("edit_python_pe.api.STATS", self.stats)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(Requester.resetConnectionClasses)
+        self.addCleanup(install_accounting)
+        self.cache_path = os.path.join(self.tmp.name, "http")
+        install_accounting()
+        self.github = Github(
+            auth=Auth.Token("secret-token"),
+            base_url=base_url,
+            retry=None,
+            seconds_between_requests=None,
+        )
+
+    def _get_repo(self):
+        # A fresh cache object each time, as in a new session
+        install_accounting(ResponseCache(self.cache_path))
+        return self.github.get_repo("pythonpe/python.pe")
+
+    def test_not_modified_is_served_from_disk(self):
+        self.assertEqual(self._get_repo().full_name, "pythonpe/python.pe")
+        self.assertEqual(self._get_repo().full_name, "pythonpe/python.pe")
+        self.assertEqual(_ConditionalStub.seen, [None, ETAG])
+        statuses = self.stats.summary()["endpoints"][
+            "GET /repos/pythonpe/python.pe"
+        ]["statuses"]
+        self.assertEqual(statuses, {"200": 1, "304": 1})
+        # The rate limit is read from the 304, not the stored headers
+        self.assertEqual(self.stats.rate_remaining, 4999)
+        for name in os.listdir(self.cache_path):
+            with open(os.path.join(self.cache_path, name)) as fd:
+                self.assertNotIn("secret-token", fd.read())
+
+    def test_other_tokens_do_not_share_entries(self):
+        self._get_repo()
+        self.github = Github(
+            auth=Auth.Token("other-token"),
+            base_url=self.github.requester.base_url,
+            retry=None,
+            seconds_between_requests=None,
+        )
+        self._get_repo()
+        self.assertEqual(_ConditionalStub.seen, [None, None])
+
+
+class TestResponseCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def _entry(self, size: int) -> dict:
+        return {
+            "etag": "x",
+            "last_modified": None,
+            "headers": {},
+            "body": "x" * size,
+        }
+
+    def test_least_recently_used_entries_are_evicted(self):
+        cache = ResponseCache(self.tmp.name, max_bytes=400)
+        for key in ("a", "b", "c"):
+            cache.put(key, self._entry(60))
+            time.sleep(0.01)
+        cache.get("a")
+        cache.put("d", self._entry(60))
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("a"))
+        self.assertLessEqual(cache.total_bytes, 400)
+
+        # The order is kept on disk for the next session
+        time.sleep(0.01)
+        cache = ResponseCache(self.tmp.name, max_bytes=400)
+        cache.get("c")
+        cache.put("e", self._entry(60))
+        self.assertEqual(
+            sorted(name[:-5] for name in os.listdir(self.tmp.name)),
+            ["a", "c", "e"],
+        )
+
+    def test_entries_larger_than_the_cache_are_skipped(self):
+        cache = ResponseCache(self.tmp.name, max_bytes=50)
+        cache.put("big", self._entry(100))
+        self.assertIsNone(cache.get("big"))
+        self.assertEqual(os.listdir(self.tmp.name), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,227 @@
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src"))
+)
+import pygit2
+
+from edit_python_pe.importer import (ImportRow, import_members, load_rows,
+                                     parse_row, parse_rows)
+from edit_python_pe.parser import parse_member
+
+CSV_ROWS = """name,email,aliases,city,github,socials
+Ana Diaz,ana@example.com,"ana, anita",Lima,https://github.com/ana,x=https://x.com/ana
+Beto,beto@example.com,,,,
+"""
+
+
+class TestLoadRows(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def _write(self, name: str, content: str) -> str:
+        path = os.path.join(self.tmp.name, name)
+        with open(path, "w", encoding="utf-8") as fd:
+            fd.write(content)
+        return path
+
+    def test_csv_json_and_ndjson_give_the_same_rows(self):
+        rows = [
+            {"name": "Ana", "email": "ana@example.com"},
+            {"name": "Beto", "email": "beto@example.com"},
+        ]
+        csv_path = self._write(
+            "m.csv", "name,email\nAna,ana@example.com\nBeto,beto@example.com\n"
+        )
+        json_path = self._write("m.json", json.dumps(rows))
+        ndjson_path = self._write(
+            "m.ndjson", "\n".join(json.dumps(row) for row in rows) + "\n\n"
+        )
+        for path in (csv_path, json_path, ndjson_path):
+            self.assertEqual(load_rows(path), rows)
+
+    def test_unknown_format(self):
+        path = self._write("members.txt", "")
+        with self.assertRaises(ValueError):
+            load_rows(path)
+
+    def test_csv_row_with_social_columns(self):
+        path = self._write("m.csv", CSV_ROWS)
+        ana, beto = parse_rows(load_rows(path))
+        self.assertEqual(ana.aliases, ["ana", "anita"])
+        self.assertEqual(ana.city, "Lima")
+        self.assertEqual(
+            ana.socials,
+            [("x", "https://x.com/ana"), ("github", "https://github.com/ana")],
+        )
+        self.assertEqual(beto, ImportRow("Beto", "beto@example.com"))
+
+
+class TestParseRow(unittest.TestCase):
+    def test_json_values(self):
+        row = parse_row(
+            {
+                "Name": "Ana",
+                "Email": "ana@example.com",
+                "aliases": ["ana", ""],
+                "socials": [
+                    {"platform": "GitHub", "url": "https://github.com/ana"},
+                    ["x", "https://x.com/ana"],
+                ],
+                "who": "Dev",
+            }
+        )
+        self.assertEqual(row.aliases, ["ana"])
+        self.assertEqual(
+            row.socials,
+            [
+                ("github", "https://github.com/ana"),
+                ("x", "https://x.com/ana"),
+            ],
+        )
+        self.assertEqual(row.who, "Dev")
+        row = parse_row(
+            {
+                "name": "Ana",
+                "email": "ana@example.com",
+                "socials": {"gitlab": "https://gitlab.com/ana"},
+            }
+        )
+        self.assertEqual(row.socials, [("gitlab", "https://gitlab.com/ana")])
+
+    def test_all_errors_are_reported_with_row_numbers(self):
+        with self.assertRaises(ValueError) as cm:
+            parse_rows(
+                [
+                    {"name": "Ana", "email": "ana@example.com"},
+                    {"name": "Beto"},
+                    {"name": "Carla", "email": "c@x.com", "socials": "foo=u"},
+                    ["not", "an", "object"],
+                ]
+            )
+        lines = str(cm.exception).splitlines()
+        self.assertEqual(len(lines), 3)
+        self.assertTrue(lines[0].startswith("Row 2"))
+        self.assertIn("email", lines[0])
+        self.assertTrue(lines[1].startswith("Row 3"))
+        self.assertIn("foo", lines[1])
+        self.assertTrue(lines[2].startswith("Row 4"))
+
+
+class TestImportMembers(unittest.TestCase):
+    def setUp(self):
+        from helpers import make_remote
+
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        remote = make_remote(
+            os.path.join(self.tmp.name, "remote.git"),
+            {
+                "AUTHORS": "Ana Diaz(ana) <ana@example.com>",
+                "blog/members/old.md": "# Old\n",
+                "README.md": "readme",
+            },
+        )
+        self.repo_path = os.path.join(self.tmp.name, "clone")
+        pygit2.clone_repository(remote, self.repo_path)
+        self.remote = pygit2.Repository(remote)
+        self.forked_repo = MagicMock()
+        self.forked_repo.owner.login = "pe-bot"
+        self.original_repo = MagicMock()
+
+    def test_single_commit_and_pull_request(self):
+        rows = [
+            ImportRow(f"Member {i}", f"m{i}@example.com", [f"m{i}"])
+            for i in range(200)
+        ]
+        rows.append(ImportRow("Ana Diaz", "ana@example.com", ["ana"]))
+        before = self.remote.head.target
+        name_files = import_members(
+            rows,
+            self.repo_path,
+            self.original_repo,
+            self.forked_repo,
+            "token",
+        )
+
+        # main is left alone, the import has a branch of its own
+        self.assertEqual(self.remote.head.target, before)
+        local = pygit2.Repository(self.repo_path)
+        self.assertEqual(local.head.target, before)
+        (branch,) = [
+            name for name in self.remote.branches if name.startswith("import/")
+        ]
+        commit = self.remote.branches[branch].peel(pygit2.Commit)
+        self.assertEqual(commit.parents[0].id, before)
+        self.assertEqual(commit.message, "Added 201 members")
+        self.assertEqual(
+            commit.author.email, "pe-bot@users.noreply.github.com"
+        )
+        members = commit.tree / "blog" / "members"
+        self.assertEqual(len(members), 202)
+        profile = parse_member((members / name_files[7]).data.decode())
+        self.assertEqual(profile.name, "Member 7")
+        self.assertEqual(profile.email, "m7@example.com")
+        authors = (commit.tree / "AUTHORS").data.decode().splitlines()
+        self.assertEqual(len(authors), 201)
+        self.assertEqual(authors[1], "Member 0(m0) <m0@example.com>")
+
+        self.original_repo.create_pull.assert_called_once()
+        kwargs = self.original_repo.create_pull.call_args.kwargs
+        self.assertEqual(kwargs["title"], "Added 201 members")
+        self.assertEqual(kwargs["head"], f"pe-bot:{branch}")
+        self.assertIn(name_files[0], kwargs["body"])
+
+
+class TestRunImport(unittest.TestCase):
+    def test_invalid_file_exits_before_connecting(self):
+        from edit_python_pe.importer import run_import
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "m.json")
+            with open(path, "w") as fd:
+                fd.write('[{"name": "Ana"}]')
+            with (
+                patch("edit_python_pe.importer.get_repo") as mock_get_repo,
+                patch("builtins.print") as mock_print,
+                self.assertRaises(SystemExit),
+            ):
+                run_import(path)
+        mock_get_repo.assert_not_called()
+        self.assertIn("Row 1", str(mock_print.call_args.args[0]))
+
+    def test_run_import(self):
+        from edit_python_pe.importer import run_import
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "m.csv")
+            with open(path, "w") as fd:
+                fd.write(CSV_ROWS)
+            with (
+                patch(
+                    "edit_python_pe.importer.get_repo",
+                    return_value=("token", "original"),
+                ),
+                patch(
+                    "edit_python_pe.importer.fork_repo",
+                    return_value=("/repo", "forked"),
+                ),
+                patch("edit_python_pe.importer.import_members") as mock_import,
+                patch("builtins.print"),
+            ):
+                run_import(path)
+        rows = mock_import.call_args.args[0]
+        self.assertEqual([row.name for row in rows], ["Ana Diaz", "Beto"])
+        mock_import.assert_called_once_with(
+            rows, "/repo", "original", "forked", "token", per_profile=False
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
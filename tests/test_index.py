@@ -0,0 +1,163 @@
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src"))
+)
+import pygit2
+
+from edit_python_pe.index import MemberIndex
+from edit_python_pe.parser import parse_member
+from edit_python_pe.utils import build_md_content
+
+
+def _member(name: str, city: str) -> str:
+    return build_md_content(
+        name,
+        f"{name.lower()}@example.com",
+        [name.lower()],
+        [("github", f"https://github.com/{name.lower()}")],
+        city,
+        "",
+        "Who",
+        "",
+        "",
+        "",
+    )
+
+
+def _commit(repo, files: dict[str, str]) -> None:
+    members = repo.TreeBuilder()
+    for name, content in files.items():
+        members.insert(
+            name, repo.create_blob(content), pygit2.GIT_FILEMODE_BLOB
+        )
+    blog = repo.TreeBuilder()
+    blog.insert("members", members.write(), pygit2.GIT_FILEMODE_TREE)
+    root = repo.TreeBuilder()
+    root.insert("blog", blog.write(), pygit2.GIT_FILEMODE_TREE)
+    sig = pygit2.Signature("Test", "test@email.com")
+    parents = [] if repo.head_is_unborn else [repo.head.target]
+    repo.create_commit("HEAD", sig, sig, "commit", root.write(), parents)
+
+
+class TestMemberIndex(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.repo_path = os.path.join(self.tmp.name, "repo")
+        self.repo = pygit2.init_repository(self.repo_path)
+        self.index_path = os.path.join(self.tmp.name, "cache", "index.json")
+        _commit(
+            self.repo,
+            {"ana.md": _member("Ana", "Lima"), "beto.md": _member("Beto", "")},
+        )
+
+    def test_update_parses_only_changed_blobs(self):
+        index = MemberIndex.load(self.index_path)
+        self.assertTrue(index.update(self.repo_path))
+        index.save()
+        self.assertEqual(index.get("ana.md")["name"], "Ana")
+        self.assertEqual(index.get("ana.md")["filename"], "ana.md")
+        self.assertEqual(len(index.get("beto.md")["email_hash"]), 64)
+
+        _commit(
+            self.repo,
+            {
+                "ana.md": _member("Ana", "Lima"),
+                "carla.md": _member("Carla", ""),
+            },
+        )
+        index = MemberIndex.load(self.index_path)
+        with patch(
+            "edit_python_pe.index.parse_member", side_effect=parse_member
+        ) as mock_parse:
+            self.assertTrue(index.update(self.repo_path))
+        mock_parse.assert_called_once()
+        self.assertEqual(sorted(index.files), ["ana.md", "carla.md"])
+        self.assertIsNone(index.get("beto.md"))
+
+    def test_unchanged_tree_is_not_walked(self):
+        index = MemberIndex.load(self.index_path)
+        index.update(self.repo_path)
+        index.save()
+        index = MemberIndex.load(self.index_path)
+        with patch("edit_python_pe.index.parse_member") as mock_parse:
+            self.assertFalse(index.update(self.repo_path))
+        mock_parse.assert_not_called()
+
+    def test_lookup_rejects_modified_content(self):
+        index = MemberIndex(self.index_path)
+        index.update(self.repo_path)
+        content = _member("Ana", "Lima")
+        profile = index.lookup("ana.md", content)
+        self.assertEqual(profile.city, "Lima")
+        self.assertEqual(profile, parse_member(content))
+        self.assertIsNone(index.lookup("ana.md", content + "\nedited"))
+        self.assertIsNone(index.lookup("nobody.md", content))
+
+    def test_saved_index_keeps_no_raw_email(self):
+        index = MemberIndex(self.index_path)
+        index.update(self.repo_path)
+        index.save()
+        with open(self.index_path, encoding="utf-8") as fd:
+            saved = fd.read()
+        self.assertNotIn("ana@example.com", saved)
+        self.assertIn("email_hash", saved)
+
+    def test_labels(self):
+        index = MemberIndex(self.index_path)
+        index.update(self.repo_path)
+        self.assertEqual(
+            index.labels(),
+            {"ana.md": "ana.md  Ana (Lima)", "beto.md": "beto.md  Beto"},
+        )
+
+    def test_corrupt_index_file_starts_empty(self):
+        os.makedirs(os.path.dirname(self.index_path))
+        with open(self.index_path, "w") as fd:
+            fd.write("{not json")
+        index = MemberIndex.load(self.index_path)
+        self.assertEqual(index.files, {})
+
+
+class TestLoadFileFromIndex(unittest.TestCase):
+    def test_load_file_into_form_uses_index(self):
+        from edit_python_pe.main import MemberApp
+        from edit_python_pe.utils import load_file_into_form
+
+        content = _member("Ana", "Lima")
+        app = MemberApp(MagicMock(), MagicMock(), "token", "repo")
+        app.member_index = MagicMock()
+        profile = parse_member(content)
+        profile.socials = [("github", "https://github.com/ana")]
+        app.member_index.lookup.return_value = profile
+        app.clear_form = MagicMock()
+        app.social_entries = MagicMock()
+        app.alias_entries = MagicMock()
+        social_row = MagicMock()
+        app.social_entries.acquire_many.return_value = [social_row]
+        app.alias_entries.acquire_many.return_value = []
+        for field in ("name_input", "email_input", "city_input"):
+            setattr(app, field, MagicMock())
+        for field in ("homepage_input", "who_area", "python_area"):
+            setattr(app, field, MagicMock())
+        app.contributions_area = MagicMock()
+        app.availability_area = MagicMock()
+        with (
+            patch("edit_python_pe.utils.os.path.exists", return_value=True),
+            patch("edit_python_pe.utils._read_file", return_value=content),
+            patch("edit_python_pe.utils.parse_member") as mock_parse,
+        ):
+            load_file_into_form(app, "ana.md")
+        mock_parse.assert_not_called()
+        app.member_index.lookup.assert_called_once_with("ana.md", content)
+        self.assertEqual(app.name_input.value, "Ana")
+        self.assertEqual(app.city_input.value, "Lima")
+        app.social_entries.acquire_many.assert_called_once_with(1)
+        social_row.reset.assert_called_once_with(
+            "github", "https://github.com/ana"
+        )
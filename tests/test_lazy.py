@@ -0,0 +1,94 @@
+import os
+import subprocess
+import sys
+import unittest
+from unittest.mock import patch
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src"))
+)
+from edit_python_pe.lazy import LazyModule
+
+SRC_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "../src"))
+
+# Cumulative import time allowed for edit_python_pe.main, in milliseconds;
+# most of it is Textual, which the first screen needs anyway. Timings vary
+# too much between machines for a default, so the check is opt-in
+IMPORT_TIME_BUDGET_MS = os.environ.get("EDIT_PYTHON_PE_IMPORT_BUDGET_MS")
+
+# Loaded at first use only, never by the import of the entry point
+DEFERRED_MODULES = ("pygit2", "github", "yaml", "textual.widgets._text_area")
+
+
+def _import_times(module: str) -> dict[str, int]:
+    """Cumulative microseconds per module, from ``-X importtime``."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        # Without pytest-cov's variables, coverage would trace the imports
+        env={
+            **{
+                key: value
+                for key, value in os.environ.items()
+                if not key.startswith("COV_CORE_")
+            },
+            "PYTHONPATH": SRC_PATH,
+        },
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+class TestLazyModule(unittest.TestCase):
+    def test_imports_on_first_attribute(self):
+        sys.modules.pop("colorsys", None)
+        module = LazyModule("colorsys")
+        self.assertNotIn("colorsys", sys.modules)
+        self.assertIn("not loaded", repr(module))
+        self.assertEqual(module.rgb_to_hsv(0, 0, 0), (0.0, 0.0, 0.0))
+        self.assertIn("colorsys", sys.modules)
+
+    def test_patches_reach_the_real_module(self):
+        import colorsys
+
+        module = LazyModule("colorsys")
+        with patch("colorsys.ONE_THIRD", 0.5):
+            self.assertEqual(module.ONE_THIRD, 0.5)
+        with patch.object(module, "ONE_THIRD", 0.25):
+            self.assertEqual(colorsys.ONE_THIRD, 0.25)
+        self.assertEqual(colorsys.ONE_THIRD, 1.0 / 3.0)
+
+
+class TestImportTime(unittest.TestCase):
+    def test_entry_point_defers_heavy_dependencies(self):
+        times = _import_times("edit_python_pe.main")
+        self.assertIn("edit_python_pe.main", times)
+        for name in DEFERRED_MODULES:
+            self.assertNotIn(name, times)
+
+    @unittest.skipUnless(
+        IMPORT_TIME_BUDGET_MS, "set EDIT_PYTHON_PE_IMPORT_BUDGET_MS to time it"
+    )
+    def test_entry_point_within_budget(self):
+        # Best of three, the first run also pays for a cold disk cache
+        best = min(
+            _import_times("edit_python_pe.main")["edit_python_pe.main"]
+            for _ in range(3)
+        )
+        self.assertLessEqual(
+            best / 1000,
+            float(IMPORT_TIME_BUDGET_MS),
+            f"importing edit_python_pe.main took {best / 1000:.0f} ms",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
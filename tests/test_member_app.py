@@ -6,7 +6,10 @@ from unittest.mock import MagicMock, patch
 sys.path.insert(
     0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src"))
 )
-from edit_python_pe.main import MemberApp, main
+from textual.widgets import Select
+
+from edit_python_pe.main import MemberApp, MemberList, RowPool, main
+from edit_python_pe.session import SessionCache
 
 
 class TestMemberApp(unittest.TestCase):
@@ -26,11 +29,9 @@ class TestMemberApp(unittest.TestCase):
         self.app.alias_container = MagicMock()
         self.app.list_container = MagicMock()
         self.app.form_container = MagicMock()
-        # Manually initialize attributes normally set in on_mount
-        self.app.social_entries = []
-        self.app.alias_entries = []
-        self.app.social_index = 0
-        self.app.alias_index = 0
+        self.app.status_bar = MagicMock()
+        self.app.status_label = MagicMock()
+        self.app.status_progress = MagicMock()
 
         # Mock UI elements
         # Use simple stub classes for input widgets and text areas
@@ -51,46 +52,43 @@ class TestMemberApp(unittest.TestCase):
         self.app.contributions_area = StubTextArea()
         self.app.availability_area = StubTextArea()
 
-        # Patch remove method for entries to avoid Textual lifecycle errors
-        # Use stub classes for entries with .remove() method
+        # Stub rows, real widgets need a running app to set their values
         class StubSocialEntry:
-            def __init__(self):
-                self.index = 0
+            def __init__(self, index):
+                self.index = index
+                self.display = True
                 self.select = StubInput()
                 self.url_input = StubInput()
 
-            def remove(self):
-                pass
+            def reset(self, value="", url=""):
+                self.select.value = value
+                self.url_input.value = url
 
         class StubAliasEntry:
-            def __init__(self):
-                self.index = 0
+            def __init__(self, index):
+                self.index = index
+                self.display = True
                 self.alias_input = StubInput()
 
-            def remove(self):
-                pass
+            def reset(self, alias=""):
+                self.alias_input.value = alias
 
-        self.StubSocialEntry = StubSocialEntry
-        self.StubAliasEntry = StubAliasEntry
+        # Manually initialize attributes normally set in build_form
+        self.app.form_built = True
+        self.app.social_entries = RowPool(
+            self.app.social_container, StubSocialEntry
+        )
+        self.app.alias_entries = RowPool(
+            self.app.alias_container, StubAliasEntry
+        )
 
     def test_add_social_entry(self):
-        # Patch add_social_entry to use stub
-        self.app.social_entries = []
-        self.app.social_container.mount = MagicMock()
-        # Patch mount to accept any object
-        self.app.social_container.mount = lambda x: None  # type: ignore
-
-        def stub_add_social_entry(value):
-            entry = self.StubSocialEntry()
-            entry.index = self.app.social_index
-            self.app.social_index += 1
-            self.app.social_entries.append(entry)
-            self.app.social_container.mount(entry)
-
-        self.app.add_social_entry = stub_add_social_entry
         initial_count = len(self.app.social_entries)
-        self.app.add_social_entry("")
+        self.app.add_social_entry("github")
         self.assertEqual(len(self.app.social_entries), initial_count + 1)
+        (row,) = self.app.social_entries
+        self.assertEqual(row.select.value, "github")
+        self.app.social_container.mount.assert_called_once_with(row)
 
     def test_add_list_button_clears_form(self):
         """Test that clicking the 'Añadir' button on the list screen clears the form and prepares for a new entry."""
@@ -104,8 +102,8 @@ class TestMemberApp(unittest.TestCase):
         self.app.contributions_area.text = "Filled Contributions"
         self.app.availability_area.text = "Filled Available"
         # Add social and alias entries
-        self.app.social_entries = [self.StubSocialEntry()]
-        self.app.alias_entries = [self.StubAliasEntry()]
+        self.app.add_social_entry()
+        self.app.add_alias_entry()
 
         # Simulate pressing the 'Añadir' button on the list screen
         class DummyButton:
@@ -135,24 +133,24 @@ class TestMemberApp(unittest.TestCase):
         self.assertIsNone(self.app.current_file)
 
     def test_add_alias_entry(self):
-        # Patch add_alias_entry to use stub
-        self.app.alias_entries = []
-        self.app.alias_container.mount = MagicMock()
-        # Patch mount to accept any object
-        self.app.alias_container.mount = lambda x: None  # type: ignore
-
-        def stub_add_alias_entry():
-            entry = self.StubAliasEntry()
-            entry.index = self.app.alias_index
-            self.app.alias_index += 1
-            self.app.alias_entries.append(entry)
-            self.app.alias_container.mount(entry)
-
-        self.app.add_alias_entry = stub_add_alias_entry
         initial_count = len(self.app.alias_entries)
         self.app.add_alias_entry()
         self.assertEqual(len(self.app.alias_entries), initial_count + 1)
 
+    def test_remove_entry_by_id(self):
+        for _ in range(3):
+            self.app.add_alias_entry()
+        self.app.remove_alias_entry(1)
+        self.assertEqual([row.index for row in self.app.alias_entries], [0, 2])
+        self.app.remove_alias_entry(1)
+        self.assertEqual(len(self.app.alias_entries), 2)
+
+    def _save(self) -> str:
+        # The pipeline runs on a worker; run it here, in the test's thread
+        with patch.object(self.app, "save_profile") as save_profile:
+            self.app.save_member()
+        return self.app.run_save(*save_profile.call_args.args)
+
     def test_save_member_edit_no_pr(self):
         """Test editing an existing member without a matching PR in save_member."""
         app = self.app
@@ -198,9 +196,11 @@ class TestMemberApp(unittest.TestCase):
             social_entry.select.value = "github"
             social_entry.url_input.value = "https://github.com/test"
             app.social_entries.append(social_entry)
-            app.save_member()
-            makedirs.assert_called()
-            repo_instance.index.add_all.assert_called()
+            self._save()
+            # Profile branches stay out of the checkout main syncs to
+            makedirs.assert_not_called()
+            repo_instance.index.add_all.assert_not_called()
+            repo_instance.TreeBuilder.assert_called()
             repo_instance.create_commit.assert_called()
             repo_instance.remotes["origin"].push.assert_called()
             app.original_repo.create_pull.assert_called()
@@ -255,9 +255,11 @@ class TestMemberApp(unittest.TestCase):
             social_entry.select.value = "github"
             social_entry.url_input.value = "https://github.com/test"
             app.social_entries.append(social_entry)
-            app.save_member()
-            makedirs.assert_called()
-            repo_instance.index.add_all.assert_called()
+            self._save()
+            # Profile branches stay out of the checkout main syncs to
+            makedirs.assert_not_called()
+            repo_instance.index.add_all.assert_not_called()
+            repo_instance.TreeBuilder.assert_called()
             repo_instance.create_commit.assert_called()
             repo_instance.remotes["origin"].push.assert_called()
             # Instead of asserting create_pull is not called, check that get_pulls was called and the PR was handled.
@@ -306,15 +308,21 @@ class TestMemberApp(unittest.TestCase):
             social_entry.select.value = "github"
             social_entry.url_input.value = "https://github.com/test"
             app.social_entries.append(social_entry)
-            app.save_member()
-            makedirs.assert_called()
-            repo_instance.index.add_all.assert_called()
+            self._save()
+            # Profile branches stay out of the checkout main syncs to
+            makedirs.assert_not_called()
+            repo_instance.index.add_all.assert_not_called()
+            repo_instance.TreeBuilder.assert_called()
             repo_instance.create_commit.assert_called()
             repo_instance.remotes["origin"].push.assert_called()
             app.original_repo.create_pull.assert_called()
 
     def test_save_member_error_handling(self):
-        """Test error handling in save_member when required fields are missing."""
+        """A failing save is reported and the app stays open.
+
+        Blank fields do not stop the save, which goes to the background;
+        an error raised there is shown and the save still finishes.
+        """
         app = self.app
         app.current_file = None
         app.token = "fake-token"
@@ -340,37 +348,69 @@ class TestMemberApp(unittest.TestCase):
             app.availability_area.text = ""
             app.alias_entries = []
             app.social_entries = []
-            app.save_member()
-            exit_mock.assert_called()
+            with patch.object(app, "save_profile") as save_profile:
+                app.save_member()
+            # Saving goes on in the background, the app stays open
+            save_profile.assert_called_once()
+            exit_mock.assert_not_called()
+            self.assertFalse(app.form_container.display)
+            self.assertEqual(app.pending_saves, 1)
+
+            # Run the worker's body here, with the commit step failing
+            with (
+                patch.object(
+                    app,
+                    "call_from_thread",
+                    side_effect=lambda func, *args: func(*args),
+                ),
+                patch(
+                    "edit_python_pe.main.create_pr",
+                    side_effect=OSError("disk full"),
+                ),
+                patch.object(app, "hide_status") as hide_status,
+                patch.object(app, "notify") as notify_mock,
+                patch.object(app, "load_member_list"),
+            ):
+                MemberApp.save_profile.__wrapped__(
+                    app, *save_profile.call_args.args
+                )
+            exit_mock.assert_not_called()
+            self.assertEqual(app.pending_saves, 0)
+            hide_status.assert_called_once()
+            message = notify_mock.call_args.args[0]
+            self.assertIn("disk full", message)
+            self.assertEqual(notify_mock.call_args.kwargs["severity"], "error")
+
+    def test_save_member_revoked_token_drops_session(self):
+        from github.GithubException import BadCredentialsException
+
+        from edit_python_pe.strings import MESSAGE_UNAUTHORIZED
+
+        self.app.session = MagicMock()
+        with patch(
+            "edit_python_pe.main.create_pr",
+            side_effect=BadCredentialsException(401, "Bad", None),
+        ):
+            message = self.app.run_save("# B", None, [], "B", "b@email.com")
+        self.app.session.discard.assert_called_once_with(self.token)
+        self.assertEqual(message, MESSAGE_UNAUTHORIZED)
 
     def test_clear_form(self):
-        # Patch add_social_entry and add_alias_entry to use stub
-        self.app.social_entries = []
-        self.app.alias_entries = []
-        self.app.social_container.remove_children = lambda: None  # type: ignore
-        self.app.alias_container.remove_children = lambda: None  # type: ignore
-
-        def stub_add_social_entry(value):
-            entry = self.StubSocialEntry()
-            entry.index = self.app.social_index
-            self.app.social_index += 1
-            self.app.social_entries.append(entry)
-            self.app.social_container.mount(entry)
-
-        def stub_add_alias_entry():
-            entry = self.StubAliasEntry()
-            entry.index = self.app.alias_index
-            self.app.alias_index += 1
-            self.app.alias_entries.append(entry)
-            self.app.alias_container.mount(entry)
-
-        self.app.add_social_entry = stub_add_social_entry
-        self.app.add_alias_entry = stub_add_alias_entry
-        self.app.add_social_entry("")
+        self.app.add_social_entry("github")
         self.app.add_alias_entry()
+        (social,) = self.app.social_entries
         self.app.clear_form()
         self.assertEqual(len(self.app.social_entries), 0)
         self.assertEqual(len(self.app.alias_entries), 0)
+        self.assertFalse(social.display)
+        self.app.social_container.remove_children.assert_not_called()
+
+        # The next member gets the hidden row back, emptied
+        self.app.add_social_entry()
+        self.assertEqual(list(self.app.social_entries), [social])
+        self.assertTrue(social.display)
+        self.assertEqual(social.select.value, Select.BLANK)
+        self.app.social_container.mount.assert_called_once()
 
     @patch("edit_python_pe.utils.open", create=True)
     @patch("edit_python_pe.utils.os.path.exists", return_value=True)
@@ -403,26 +443,6 @@ class: "member-gravatar"
 :Ciudad: Lima
 :Homepage: https://joe-doe.org
 """
-        # Patch add_social_entry and add_alias_entry to use stub
-        self.app.social_entries = []
-        self.app.alias_entries = []
-
-        def stub_add_social_entry(value):
-            entry = self.StubSocialEntry()
-            entry.index = self.app.social_index
-            self.app.social_index += 1
-            self.app.social_entries.append(entry)
-            self.app.social_container.mount(entry)
-
-        def stub_add_alias_entry():
-            entry = self.StubAliasEntry()
-            entry.index = self.app.alias_index
-            self.app.alias_index += 1
-            self.app.alias_entries.append(entry)
-            self.app.alias_container.mount(entry)
-
-        self.app.add_social_entry = stub_add_social_entry
-        self.app.add_alias_entry = stub_add_alias_entry
         # Patch clear_form to avoid resetting stubs
         self.app.clear_form = lambda: None  # type: ignore
         load_file_into_form(self.app, "fake.md")
@@ -450,27 +470,449 @@ class: "member-gravatar"
         self.assertEqual(self.app.email_input.value, "joe@example.com")
         self.assertEqual(self.app.city_input.value, "Lima")
         self.assertEqual(self.app.homepage_input.value, "https://joe-doe.org")
-        self.assertGreaterEqual(len(self.app.social_entries), 1)
+        (social,) = self.app.social_entries
+        self.assertEqual(social.select.value, "github")
+        self.assertEqual(social.url_input.value, "https://github.com/joe.doe")
+        (alias,) = self.app.alias_entries
+        self.assertEqual(alias.alias_input.value, "joe")
 
 
 class TestMainFunction(unittest.TestCase):
-    @patch("edit_python_pe.main.get_repo")
-    @patch("edit_python_pe.main.fork_repo")
+    def setUp(self):
+        import tempfile
+
+        # main() leaves the session's stats behind; other tests' transfers
+        # are in the process-wide STATS, so keep them off the user's cache
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.stats_path = os.path.join(tmp.name, "api-usage.json")
+        patcher = patch(
+            "edit_python_pe.api.get_stats_path", return_value=self.stats_path
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @patch("edit_python_pe.main.get_token", return_value="token")
+    @patch("edit_python_pe.main.get_repo_path", return_value="/tmp/testrepo")
+    @patch("edit_python_pe.main.open_fork")
     @patch("edit_python_pe.main.MemberApp")
     def test_main_runs_app(
-        self, mock_member_app, mock_fork_repo, mock_get_repo
+        self,
+        mock_member_app,
+        mock_open_fork,
+        mock_get_repo_path,
+        mock_get_token,
     ):
-        mock_get_repo.return_value = ("token", MagicMock())
-        mock_fork_repo.return_value = ("/tmp/testrepo", MagicMock())
         mock_app_instance = MagicMock()
         mock_member_app.return_value = mock_app_instance
-        main()
-        mock_get_repo.assert_called_once()
-        mock_fork_repo.assert_called_once()
+        main([])
+        mock_get_token.assert_called_once()
+        # GitHub and git work is left to the app's background worker
+        mock_open_fork.assert_not_called()
         mock_member_app.assert_called_once_with(
-            unittest.mock.ANY,
-            unittest.mock.ANY,
-            unittest.mock.ANY,
-            unittest.mock.ANY,
+            None, None, "token", "/tmp/testrepo", offline=False
         )
         mock_app_instance.run.assert_called_once()
+
+    @patch("edit_python_pe.main.get_token", return_value="token")
+    @patch("edit_python_pe.main.get_repo_path", return_value="/tmp/testrepo")
+    @patch("edit_python_pe.main.MemberApp")
+    def test_main_writes_stats_to_stats_path(
+        self, mock_member_app, mock_get_repo_path, mock_get_token
+    ):
+        from edit_python_pe.api import RequestStats
+
+        stats = RequestStats()
+        stats.record_transfer("fetch", 1, 10, 0.1)
+        with patch("edit_python_pe.api.STATS", stats):
+            main([])
+        self.assertTrue(os.path.exists(self.stats_path))
+
+    @patch("edit_python_pe.main.get_token")
+    @patch("edit_python_pe.main.get_repo_path", return_value="/tmp/testrepo")
+    @patch("edit_python_pe.main.MemberApp")
+    def test_main_offline_does_not_ask_for_token(
+        self, mock_member_app, mock_get_repo_path, mock_get_token
+    ):
+        main(["--offline"])
+        mock_get_token.assert_not_called()
+        mock_member_app.assert_called_once_with(
+            None, None, "", "/tmp/testrepo", offline=True
+        )
+
+    @patch("edit_python_pe.main.run_sync")
+    def test_main_sync_command(self, mock_run_sync):
+        main(["sync"])
+        mock_run_sync.assert_called_once_with()
+
+    @patch("edit_python_pe.importer.run_import")
+    @patch("edit_python_pe.main.get_token")
+    def test_main_import_command(self, mock_get_token, mock_run_import):
+        main(["import", "members.csv"])
+        mock_run_import.assert_called_once_with(
+            "members.csv", per_profile=False
+        )
+        main(["import", "--per-profile", "members.csv"])
+        mock_run_import.assert_called_with("members.csv", per_profile=True)
+        mock_get_token.assert_not_called()
+
+
+async def _wait_for(pilot, predicate, attempts=100):
+    for _ in range(attempts):
+        if predicate():
+            return
+        await pilot.pause(0.01)
+    raise AssertionError("condition not reached")
+
+
+class TestMemberAppStartup(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        import tempfile
+
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        members = os.path.join(self.tmp.name, "blog", "members")
+        os.makedirs(members)
+        for name in ("ana.md", "beto.md"):
+            with open(os.path.join(members, name), "w") as fd:
+                fd.write(f"# {name}")
+        self.session_path = os.path.join(self.tmp.name, "session.json")
+        patcher = patch(
+            "edit_python_pe.main.get_session_path",
+            return_value=self.session_path,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def test_cached_copy_listed_before_sync_finishes(self):
+        import threading
+
+        release = threading.Event()
+        original_repo = MagicMock()
+        forked_repo = MagicMock()
+        forked_repo.owner.login = "me"
+        forked_repo.full_name = "me/python.pe"
+        forked_repo.clone_url = "https://github.com/me/python.pe.git"
+
+        def slow_fork_repo(token, repo, sparse):
+            release.wait(5)
+            return self.tmp.name, forked_repo
+
+        app = MemberApp(None, None, "token", self.tmp.name)
+        with (
+            patch(
+                "edit_python_pe.utils.connect_repo", return_value=original_repo
+            ),
+            patch(
+                "edit_python_pe.utils.fork_repo", side_effect=slow_fork_repo
+            ),
+        ):
+            async with app.run_test() as pilot:
+                await _wait_for(pilot, lambda: app.member_list.member_count)
+                self.assertEqual(
+                    app.member_list.filenames, ["ana.md", "beto.md"]
+                )
+                self.assertTrue(app.status_bar.display)
+                await _wait_for(pilot, lambda: app.form_built)
+                self.assertTrue(app.save_button.disabled)
+
+                release.set()
+                await app.workers.wait_for_complete()
+                await pilot.pause()
+                self.assertIs(app.original_repo, original_repo)
+                self.assertIs(app.forked_repo, forked_repo)
+                self.assertFalse(app.status_bar.display)
+                self.assertFalse(app.save_button.disabled)
+        # The next launch knows the fork without asking GitHub
+        session = SessionCache.load(self.session_path).get("token")
+        self.assertEqual(session["login"], "me")
+        self.assertEqual(session["clone_url"], forked_repo.clone_url)
+
+    async def test_remembered_session_skips_validation(self):
+        session = SessionCache(self.session_path)
+        session.remember(
+            "token",
+            "me",
+            "me/python.pe",
+            "https://github.com/me/python.pe.git",
+        )
+        session.save()
+
+        app = MemberApp(None, None, "token", self.tmp.name)
+        with (
+            patch("github.Github"),
+            patch("edit_python_pe.utils.connect_repo") as connect_mock,
+            patch("edit_python_pe.utils.fork_repo") as fork_mock,
+            patch(
+                "edit_python_pe.utils._checkout_fork",
+                return_value=self.tmp.name,
+            ) as checkout_mock,
+        ):
+            async with app.run_test() as pilot:
+                await app.workers.wait_for_complete()
+                await pilot.pause()
+                self.assertFalse(app.save_button.disabled)
+        connect_mock.assert_not_called()
+        fork_mock.assert_not_called()
+        checkout_mock.assert_called_once()
+        self.assertEqual(app.forked_repo.owner.login, "me")
+        self.assertEqual(
+            app.forked_repo.clone_url, "https://github.com/me/python.pe.git"
+        )
+
+    async def test_save_runs_in_the_background_with_stages(self):
+        import threading
+
+        from edit_python_pe.constants import SAVE_STAGES
+
+        release = threading.Event()
+
+        def slow_create_pr(*args, on_stage, **kwargs):
+            for stage in SAVE_STAGES[:3]:
+                on_stage(stage)
+            release.wait(5)
+            on_stage(SAVE_STAGES[3])
+            return "sent"
+
+        app = MemberApp(MagicMock(), MagicMock(), "token", self.tmp.name)
+        with (
+            patch("edit_python_pe.main.create_pr", side_effect=slow_create_pr),
+            patch.object(app, "notify") as notify_mock,
+            patch.object(app, "exit") as exit_mock,
+        ):
+            async with app.run_test() as pilot:
+                app.current_file = None
+                app.show_form()
+                app.name_input.value = "Ana"
+                app.save_member()
+                await _wait_for(
+                    pilot, lambda: "Pushing" in str(app.status_label.content)
+                )
+                self.assertTrue(app.list_container.display)
+                self.assertTrue(app.status_bar.display)
+                # Another member can be edited meanwhile
+                app.on_member_list_selected(
+                    MemberList.Selected(app.member_list, "ana.md")
+                )
+                self.assertTrue(app.form_container.display)
+
+                release.set()
+                await app.workers.wait_for_complete()
+                await pilot.pause()
+                self.assertFalse(app.status_bar.display)
+        notify_mock.assert_called_with("sent", severity="information")
+        exit_mock.assert_not_called()
+
+    async def test_form_built_after_list_paints(self):
+        from edit_python_pe.api import STATS
+
+        app = MemberApp(MagicMock(), MagicMock(), "token", self.tmp.name)
+        with patch.object(app, "build_form", wraps=app.build_form) as build:
+            async with app.run_test() as pilot:
+                await _wait_for(pilot, lambda: app.form_built)
+                await pilot.pause()
+                self.assertTrue(app.list_container.display)
+                self.assertFalse(app.form_container.display)
+                self.assertFalse(app.save_button.disabled)
+                app.show_form()
+                self.assertTrue(app.form_container.display)
+        build.assert_called()
+        self.assertIn("mount_list", STATS.operations)
+        self.assertIn("mount_form", STATS.operations)
+
+    async def test_show_form_builds_form_when_needed(self):
+        app = MemberApp(MagicMock(), MagicMock(), "token", self.tmp.name)
+        with patch.object(app, "list_painted"):
+            async with app.run_test() as pilot:
+                await pilot.pause()
+                self.assertFalse(app.form_built)
+                app.on_member_list_selected(
+                    MemberList.Selected(app.member_list, "ana.md")
+                )
+                await pilot.pause()
+                self.assertTrue(app.form_container.display)
+                self.assertEqual(app.name_input.value, "ana.md")
+
+    async def test_language_switches_without_restart(self):
+        from edit_python_pe.strings import (get_catalog, get_language,
+                                            set_language)
+
+        self.addCleanup(set_language, get_language())
+        set_language("en")
+        spanish = get_catalog("es").gettext
+        app = MemberApp(MagicMock(), MagicMock(), "token", self.tmp.name)
+        async with app.run_test() as pilot:
+            await _wait_for(pilot, lambda: hasattr(app, "language_select"))
+            app.add_social_entry()
+            await pilot.pause()
+            self.assertEqual(str(app.quit_list_button.label), "Quit")
+
+            app.language_select.value = "es"
+            await pilot.pause()
+            self.assertEqual(get_language(), "es")
+            self.assertEqual(str(app.quit_list_button.label), spanish("Quit"))
+            self.assertEqual(str(app.save_button.label), spanish("Save"))
+            self.assertEqual(app.name_input.placeholder, spanish("Name"))
+            (row,) = app.social_entries
+            self.assertEqual(str(row.delete_btn.label), spanish("Delete"))
+            self.assertEqual(row.select.prompt, spanish("Social Network"))
+
+    async def test_switching_members_reuses_rows(self):
+        members = os.path.join(self.tmp.name, "blog", "members")
+        socials = {
+            "ana.md": [
+                ("github", "https://github.com/ana"),
+                ("gitlab", "https://gitlab.com/ana"),
+            ],
+            "beto.md": [("x", "https://x.com/beto")],
+        }
+        for filename, entries in socials.items():
+            links = "".join(
+                f'<li><a class="external reference" href="{url}">'
+                f'<iconify-icon icon="simple-icons:{platform}">'
+                "</iconify-icon></a></li>\n"
+                for platform, url in entries
+            )
+            with open(os.path.join(members, filename), "w") as fd:
+                fd.write(
+                    f"# {filename}\n```{{raw}} html\n"
+                    f'<ul class="social-media profile">\n{links}</ul>\n```\n'
+                )
+
+        app = MemberApp(MagicMock(), MagicMock(), "token", self.tmp.name)
+        async with app.run_test() as pilot:
+
+            def select(filename):
+                app.on_member_list_selected(
+                    MemberList.Selected(app.member_list, filename)
+                )
+
+            select("ana.md")
+            await pilot.pause()
+            rows = list(app.social_entries)
+            select("beto.md")
+            await pilot.pause()
+            self.assertEqual(list(app.social_entries), rows[:1])
+            self.assertEqual(rows[0].url_input.value, "https://x.com/beto")
+            self.assertFalse(rows[1].display)
+
+            select("ana.md")
+            await pilot.pause()
+            self.assertEqual(list(app.social_entries), rows)
+            self.assertEqual(list(app.social_container.children), rows)
+            self.assertEqual(
+                [row.url_input.value for row in rows],
+                [url for _, url in socials["ana.md"]],
+            )
+
+            # Removing a row by its id hides it behind the active ones
+            app.remove_social_entry(rows[0].index)
+            app.add_social_entry("x")
+            await pilot.pause()
+            self.assertEqual(list(app.social_entries), [rows[1], rows[0]])
+            self.assertEqual(list(app.social_container.children), rows[::-1])
+
+    async def test_bad_token_exits_with_message(self):
+        from github.GithubException import BadCredentialsException
+
+        from edit_python_pe.strings import MESSAGE_UNAUTHORIZED
+
+        app = MemberApp(None, None, "token", self.tmp.name)
+        with (
+            patch(
+                "edit_python_pe.utils.connect_repo",
+                side_effect=BadCredentialsException(401, "Bad", None),
+            ),
+            patch.object(app, "exit") as exit_mock,
+        ):
+            async with app.run_test() as pilot:
+                await app.workers.wait_for_complete()
+                await pilot.pause()
+        exit_mock.assert_called_once_with(message=MESSAGE_UNAUTHORIZED)
+
+    async def test_no_network_keeps_the_local_list(self):
+        import requests
+
+        app = MemberApp(None, None, "token", self.tmp.name)
+        with (
+            patch(
+                "edit_python_pe.utils.connect_repo",
+                side_effect=requests.ConnectionError("no route to host"),
+            ),
+            patch.object(app, "exit") as exit_mock,
+        ):
+            async with app.run_test() as pilot:
+                await app.workers.wait_for_complete()
+                await pilot.pause()
+                self.assertEqual(
+                    app.member_list.filenames, ["ana.md", "beto.md"]
+                )
+                self.assertTrue(app.status_bar.display)
+                status = str(app.status_label.render())
+                self.assertIn("no route to host", status)
+                self.assertIn("--offline", status)
+        exit_mock.assert_not_called()
+
+
+class TestMemberList(unittest.IsolatedAsyncioTestCase):
+    async def test_batches_stay_sorted_and_keep_cursor(self):
+        from textual.app import App
+
+        from edit_python_pe.main import MemberList
+
+        class ListApp(App):
+            def compose(self):
+                yield MemberList()
+
+        app = ListApp()
+        async with app.run_test(size=(40, 5)) as pilot:
+            member_list = app.query_one(MemberList)
+            member_list.add_members(["m.md", "c.md"])
+            member_list.highlighted = 1
+            member_list.add_members(["a.md", "z.md", "b.md"])
+            await pilot.pause()
+            self.assertEqual(
+                member_list.filenames,
+                ["a.md", "b.md", "c.md", "m.md", "z.md"],
+            )
+            self.assertEqual(
+                member_list.filenames[member_list.highlighted], "m.md"
+            )
+
+    async def test_only_visible_rows_are_rendered(self):
+        from textual.app import App
+
+        from edit_python_pe.main import MemberList
+
+        class ListApp(App):
+            def compose(self):
+                yield MemberList()
+
+        app = ListApp()
+        async with app.run_test(size=(40, 10)) as pilot:
+            member_list = app.query_one(MemberList)
+            member_list.add_members(f"m{i:05}.md" for i in range(10000))
+            await pilot.pause()
+            self.assertEqual(len(member_list.children), 0)
+            self.assertEqual(member_list.virtual_size.height, 10000)
+            member_list.focus()
+            await pilot.press("end")
+            self.assertEqual(member_list.highlighted, 9999)
+            self.assertGreater(member_list.scroll_offset.y, 9000)
+
+    async def test_enter_and_click_select_member(self):
+        from edit_python_pe.main import MemberList
+
+        app = MemberApp(MagicMock(), MagicMock(), "token", "missing_repo")
+        async with app.run_test() as pilot:
+            member_list = app.query_one(MemberList)
+            member_list.add_members(["ana.md", "beto.md"])
+            member_list.focus()
+            await pilot.press("down", "down", "enter")
+            await pilot.pause()
+            self.assertEqual(app.current_file, "beto.md")
+            app.show_list()
+            await pilot.pause()
+            await pilot.click(MemberList, offset=(2, 0))
+            await pilot.pause()
+            self.assertEqual(app.current_file, "ana.md")
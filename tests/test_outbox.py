@@ -0,0 +1,199 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src"))
+)
+import pygit2
+import requests
+from helpers import make_remote
+
+from edit_python_pe.outbox import Outbox
+from edit_python_pe.utils import create_pr, drain_outbox, queue_pr
+
+
+class TestOutbox(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.outbox = Outbox(os.path.join(self.tmp.name, "outbox"))
+
+    def test_jobs_survive_and_are_replaced_per_file(self):
+        self.assertEqual(self.outbox.jobs(), [])
+        self.outbox.put("a.md", {"file_content": "# A"})
+        self.outbox.put("b.md", {"file_content": "# B"})
+        self.outbox.put("a.md", {"file_content": "# A2"})
+
+        jobs = Outbox(self.outbox.path).jobs()
+        self.assertEqual([job.id for job in jobs], ["b.md", "a.md"])
+        self.assertEqual(jobs[1].change["file_content"], "# A2")
+
+    def test_failed_job_is_retried_later_with_backoff(self):
+        job = self.outbox.put("a.md", {})
+        with patch("edit_python_pe.outbox.time", return_value=job.queued_at):
+            self.outbox.retry_later(job, "timed out")
+            self.outbox.retry_later(job, "timed out")
+        job = self.outbox.get("a.md")
+        self.assertEqual(job.attempts, 2)
+        self.assertEqual(job.error, "timed out")
+        # OUTBOX_RETRY_DELAY, doubled by the second failure
+        self.assertEqual(job.next_attempt_at, job.queued_at + 60.0)
+        self.assertEqual(self.outbox.due(), [])
+        self.assertEqual(len(self.outbox.jobs()), 1)
+
+    def test_job_saved_again_while_sent_is_kept(self):
+        job = self.outbox.put("a.md", {"file_content": "# A"})
+        with patch(
+            "edit_python_pe.outbox.time", return_value=job.queued_at + 1
+        ):
+            self.outbox.put("a.md", {"file_content": "# A2"})
+        self.outbox.remove(job)
+        self.outbox.retry_later(job, "error")
+        job = self.outbox.get("a.md")
+        self.assertEqual(job.change["file_content"], "# A2")
+        self.assertEqual(job.attempts, 0)
+
+    def test_corrupt_job_is_skipped(self):
+        self.outbox.put("a.md", {})
+        with open(os.path.join(self.outbox.path, "b.md.json"), "w") as fd:
+            fd.write("{")
+        self.assertEqual([job.id for job in self.outbox.jobs()], ["a.md"])
+
+
+class TestDrainOutbox(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.remote_path = make_remote(
+            os.path.join(self.tmp.name, "fork.git"),
+            {"AUTHORS": "A(a) <a@x>", "blog/members/a.md": "# A"},
+        )
+        self.remote = pygit2.Repository(self.remote_path)
+        self.repo_path = os.path.join(self.tmp.name, "checkout")
+        pygit2.clone_repository(self.remote_path, self.repo_path)
+        self.outbox = Outbox(os.path.join(self.tmp.name, "outbox"))
+        self.forked_repo = MagicMock()
+        self.forked_repo.owner.login = "me"
+        self.original_repo = MagicMock()
+        self.original_repo.get_pulls.return_value = []
+
+    def _queue(self, content: str, current_file: str | None) -> str:
+        return queue_pr(
+            content,
+            current_file,
+            self.repo_path,
+            ["b"],
+            "B",
+            "b@email.com",
+            self.outbox,
+        )
+
+    def _drain(self, **kwargs) -> list[str]:
+        return drain_outbox(
+            self.outbox,
+            self.repo_path,
+            self.original_repo,
+            self.forked_repo,
+            "fake-token",
+            **kwargs,
+        )
+
+    def test_queued_profile_is_committed_but_not_sent(self):
+        message = self._queue("# B", None)
+        name_file = self.outbox.jobs()[0].id
+        self.assertIn(name_file, message)
+        branch = f"refs/heads/profile/{name_file[:-3]}"
+        local = pygit2.Repository(self.repo_path)
+        self.assertIsNotNone(local.references.get(branch))
+        self.assertIsNone(self.remote.references.get(branch))
+        self.original_repo.create_pull.assert_not_called()
+
+        # Edited again before going online: still one new profile
+        self._queue("# B2", name_file)
+        messages = self._drain()
+        self.assertEqual(len(messages), 1)
+        commit = self.remote.references[branch].peel(pygit2.Commit)
+        self.assertEqual(
+            commit.tree[f"blog/members/{name_file}"].data, b"# B2"
+        )
+        kwargs = self.original_repo.create_pull.call_args.kwargs
+        self.assertEqual(kwargs["title"], f"Added {name_file}")
+        self.assertEqual(self.outbox.jobs(), [])
+
+    def test_unreachable_remote_keeps_job_for_retry(self):
+        self._queue("# B", None)
+        shutil.rmtree(self.remote_path)
+        self.assertEqual(self._drain(), [])
+        (job,) = self.outbox.jobs()
+        self.assertEqual(job.attempts, 1)
+        self.assertIsNotNone(job.error)
+        # Not due yet, but sync tries anyway
+        self.assertEqual(self._drain(), [])
+        self.assertEqual(self._drain(force=True), [])
+        self.assertEqual(self.outbox.jobs()[0].attempts, 2)
+
+    def test_lost_branch_is_committed_again(self):
+        self._queue("# B", None)
+        name_file = self.outbox.jobs()[0].id
+        branch = f"refs/heads/profile/{name_file[:-3]}"
+        pygit2.Repository(self.repo_path).references.delete(branch)
+        self.assertEqual(len(self._drain()), 1)
+        commit = self.remote.references[branch].peel(pygit2.Commit)
+        self.assertEqual(commit.tree[f"blog/members/{name_file}"].data, b"# B")
+
+    def test_failed_push_is_queued_instead_of_lost(self):
+        shutil.rmtree(self.remote_path)
+        message = create_pr(
+            "# B",
+            None,
+            self.repo_path,
+            self.original_repo,
+            self.forked_repo,
+            "fake-token",
+            ["b"],
+            "B",
+            "b@email.com",
+            outbox=self.outbox,
+        )
+        (job,) = self.outbox.jobs()
+        self.assertIn(job.id, message)
+        self.assertEqual(job.change["file_content"], "# B")
+
+    def test_network_error_opening_the_pr_is_queued_and_retried(self):
+        self.original_repo.create_pull.side_effect = requests.ConnectionError(
+            "connection refused"
+        )
+        message = create_pr(
+            "# B",
+            None,
+            self.repo_path,
+            self.original_repo,
+            self.forked_repo,
+            "fake-token",
+            ["b"],
+            "B",
+            "b@email.com",
+            outbox=self.outbox,
+        )
+        (job,) = self.outbox.jobs()
+        self.assertIn(job.id, message)
+        # The branch was pushed, only the PR is missing
+        branch = f"refs/heads/profile/{job.id[:-3]}"
+        self.assertIsNotNone(self.remote.references.get(branch))
+
+        self.assertEqual(self._drain(force=True), [])
+        (job,) = self.outbox.jobs()
+        self.assertEqual(job.attempts, 1)
+        self.assertIn("connection refused", job.error)
+
+        self.original_repo.create_pull.side_effect = None
+        self.assertEqual(len(self._drain(force=True)), 1)
+        self.assertEqual(self.outbox.jobs(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
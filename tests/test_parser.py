@@ -0,0 +1,169 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src"))
+)
+from edit_python_pe.parser import MemberProfile, parse_email, parse_member
+
+MEMBER_MD = """---
+blogpost: true
+date: 01 Jan, 2025
+author: joe
+location: Cusco
+category: members
+---
+
+# Joe Doe
+
+```{gravatar} joe@example.com
+---
+width: 200
+class: "member-gravatar"
+---
+```
+
+```{raw} html
+<ul class="social-media profile">
+    <li>
+        <a class="external reference" href="https://github.com/joe.doe">
+            <iconify-icon icon="simple-icons:github" style="font-size:2em"></iconify-icon>
+        </a>
+    </li>
+    <li>
+        <a class="external reference" href="https://x.com/joe">
+            <iconify-icon icon="simple-icons:x" style="font-size:2em"></iconify-icon>
+        </a>
+    </li>
+</ul>
+```
+
+:Aliases: joe, jd
+:Ciudad: Lima
+:Homepage: https://joe-doe.org
+
+## Sobre mí
+
+### ¿Quién eres y a qué te dedicas?
+
+Developer.
+
+Also a teacher.
+
+### ¿Cómo programas en Python?
+
+With tests.
+
+### Otra sección
+
+Ignored.
+
+### ¿Estás disponible para hacer mentoring, consultorías, charlas?
+
+Yes
+"""
+
+
+class TestParseMember(unittest.TestCase):
+    def test_full_profile(self):
+        profile = parse_member(MEMBER_MD)
+        self.assertEqual(
+            profile,
+            MemberProfile(
+                name="Joe Doe",
+                email="joe@example.com",
+                city="Lima",
+                homepage="https://joe-doe.org",
+                aliases=["joe", "jd"],
+                socials=[
+                    ("github", "https://github.com/joe.doe"),
+                    ("x", "https://x.com/joe"),
+                ],
+                who="Developer.\n\nAlso a teacher.",
+                python="With tests.",
+                contributions="",
+                availability="Yes",
+            ),
+        )
+
+    def test_frontmatter_is_the_fallback(self):
+        content = "---\nauthor: joe\nlocation: Cusco\n---\n\nNo header\n"
+        profile = parse_member(content)
+        self.assertEqual(profile.name, "joe")
+        self.assertEqual(profile.city, "Cusco")
+
+    def test_invalid_or_unclosed_frontmatter(self):
+        profile = parse_member("---\n@author: joe\n---\n# Joe\n")
+        self.assertEqual(profile.name, "Joe")
+        profile = parse_member("---\n# Joe\n:Ciudad: Lima\n")
+        self.assertEqual(profile.name, "Joe")
+        self.assertEqual(profile.city, "Lima")
+
+    def test_first_occurrence_wins(self):
+        content = "# First\n# Second\n:Ciudad: Lima\n:Ciudad: Cusco\n"
+        profile = parse_member(content)
+        self.assertEqual(profile.name, "First")
+        self.assertEqual(profile.city, "Lima")
+
+    def test_empty_content(self):
+        self.assertEqual(parse_member(""), MemberProfile())
+
+    def test_dict_round_trip(self):
+        profile = parse_member(MEMBER_MD)
+        self.assertEqual(MemberProfile.from_dict(profile.to_dict()), profile)
+
+    def test_parse_email_matches_parse_member(self):
+        self.assertEqual(parse_email(MEMBER_MD), parse_member(MEMBER_MD).email)
+        self.assertEqual(parse_email("# Joe\n"), "")
+
+    def test_profile_has_slots(self):
+        self.assertFalse(hasattr(MemberProfile(), "__dict__"))
+
+
+class TestParseMemberFiles(unittest.TestCase):
+    def setUp(self):
+        import tempfile
+
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.paths = []
+        for i in range(9):
+            path = os.path.join(self.tmp.name, f"m{i}.md")
+            with open(path, "w", encoding="utf-8") as fd:
+                fd.write(MEMBER_MD.replace("Joe Doe", f"Member {i}"))
+            self.paths.append(path)
+        self.bad_path = os.path.join(self.tmp.name, "bad.md")
+        with open(self.bad_path, "wb") as fd:
+            fd.write(b"# \xff\xfe")
+        self.missing_path = os.path.join(self.tmp.name, "missing.md")
+
+    def _check(self, results):
+        by_path = {result.path: result for result in results}
+        self.assertEqual(
+            set(by_path), {*self.paths, self.bad_path, self.missing_path}
+        )
+        for i, path in enumerate(self.paths):
+            self.assertIsNone(by_path[path].error)
+            self.assertEqual(by_path[path].profile.name, f"Member {i}")
+        self.assertIn("UnicodeDecodeError", by_path[self.bad_path].error)
+        self.assertIn("FileNotFoundError", by_path[self.missing_path].error)
+        self.assertIsNone(by_path[self.missing_path].profile)
+
+    def test_process_pool_streams_results_and_errors(self):
+        from edit_python_pe.parser import parse_member_files
+
+        paths = [self.bad_path, *self.paths, self.missing_path]
+        self._check(parse_member_files(paths, max_workers=2, chunk_size=3))
+
+    def test_single_chunk_is_parsed_in_process(self):
+        from unittest.mock import patch
+
+        from edit_python_pe.parser import parse_member_files
+
+        paths = [self.bad_path, *self.paths, self.missing_path]
+        with patch(
+            "edit_python_pe.parser.ProcessPoolExecutor"
+        ) as mock_executor:
+            self._check(parse_member_files(paths, chunk_size=len(paths)))
+        mock_executor.assert_not_called()
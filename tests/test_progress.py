@@ -0,0 +1,106 @@
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src"))
+)
+import pygit2
+from helpers import make_remote
+
+from edit_python_pe.api import RequestStats
+from edit_python_pe.progress import (ProgressCallbacks, TransferProgress,
+                                     reporting_to)
+
+
+class TestTransferProgress(unittest.TestCase):
+    def test_throughput_and_eta(self):
+        with patch("edit_python_pe.progress.monotonic", return_value=100.0):
+            progress = TransferProgress("fetch")
+        with patch("edit_python_pe.progress.monotonic", return_value=102.0):
+            progress.update(50, 200, 4096)
+        self.assertEqual(progress.throughput, 2048.0)
+        # 50 objects in 2s, 150 to go
+        self.assertEqual(progress.eta, 6.0)
+        self.assertEqual(
+            progress.describe(),
+            "Receiving objects: 50/200, 4.0 KiB at 2.0 KiB/s, 6s left",
+        )
+
+        with patch("edit_python_pe.progress.monotonic", return_value=104.0):
+            progress.update(200, 200, 16384)
+        self.assertTrue(progress.done)
+        self.assertIsNone(progress.eta)
+        self.assertEqual(progress.describe(), "200 objects, 16.0 KiB in 4.0s")
+
+
+class TestProgressCallbacks(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.remote_path = make_remote(
+            os.path.join(self.tmp.name, "fork.git"),
+            {"AUTHORS": "A(a) <a@x>", "blog/members/a.md": "# A"},
+        )
+        self.stats = RequestStats()
+        patcher = patch("edit_python_pe.progress.STATS", self.stats)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.seen = []
+
+    def _listen(self, progress: TransferProgress) -> None:
+        self.seen.append(
+            (progress.kind, progress.objects, progress.total_objects)
+        )
+
+    def test_clone_is_reported_logged_and_accounted(self):
+        repo_path = os.path.join(self.tmp.name, "checkout")
+        with (
+            reporting_to(self._listen),
+            self.assertLogs("edit_python_pe.progress", "INFO") as logs,
+        ):
+            callbacks = ProgressCallbacks(None)
+            # file:// goes through the smart protocol, unlike a bare path
+            pygit2.clone_repository(
+                f"file://{self.remote_path}", repo_path, callbacks=callbacks
+            )
+            callbacks.finish()
+        kind, objects, total = self.seen[-1]
+        self.assertEqual(kind, "fetch")
+        self.assertEqual(objects, total)
+        self.assertIn(f"{total} objects", logs.output[-1])
+        transfer = self.stats.summary()["transfers"]["fetch"]
+        self.assertEqual(transfer["objects"], total)
+        self.assertGreater(transfer["bytes"], 0)
+
+    def test_push_is_reported(self):
+        from edit_python_pe.utils import _commit_files, _push
+
+        repo_path = os.path.join(self.tmp.name, "checkout")
+        pygit2.clone_repository(self.remote_path, repo_path)
+        _commit_files(
+            repo_path,
+            {"blog/members/b.md": "# B"},
+            "B",
+            "b@email.com",
+            "Added b.md",
+            branch="profile/b",
+        )
+        with reporting_to(self._listen):
+            _push(repo_path, "fake-token", ["+refs/heads/profile/b"])
+        self.assertEqual(self.seen[-1][0], "push")
+        self.assertEqual(self.seen[-1][1], self.seen[-1][2])
+        self.assertEqual(self.stats.summary()["transfers"]["push"]["count"], 1)
+
+    def test_nothing_is_reported_without_a_listener(self):
+        callbacks = ProgressCallbacks(None, "push")
+        callbacks.push_transfer_progress(1, 2, 10)
+        callbacks.finish()
+        self.assertEqual(self.seen, [])
+        self.assertEqual(self.stats.summary()["transfers"]["push"]["count"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src"))
+)
+from github.GithubException import UnknownObjectException
+
+from edit_python_pe.pulls import PullRequestCache, find_open_pull
+
+
+def _pull(number: int, title: str, head: str, state: str = "open"):
+    pr = MagicMock()
+    pr.number = number
+    pr.title = title
+    pr.state = state
+    pr.head.label = head
+    return pr
+
+
+class TestFindOpenPull(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.cache = PullRequestCache(
+            os.path.join(self.tmp.name, "cache", "pulls.json")
+        )
+        self.repo = MagicMock()
+
+    def test_listing_is_filtered_by_head_and_cached(self):
+        pr = _pull(7, "Changed ana.md", "me:main")
+        self.repo.get_pulls.return_value = [pr]
+        self.assertIs(
+            find_open_pull(self.repo, "ana.md", "me:main", "main", self.cache),
+            pr,
+        )
+        self.repo.get_pulls.assert_called_once_with(
+            state="open", head="me:main", base="main"
+        )
+        self.cache.save()
+        cache = PullRequestCache.load(self.cache.path)
+        self.assertEqual(cache.get("ana.md", "me:main"), 7)
+        self.assertIsNone(cache.get("ana.md", "other:main"))
+
+    def test_cached_number_is_revalidated_with_one_request(self):
+        pr = _pull(7, "Changed ana.md", "me:main")
+        self.repo.get_pull.return_value = pr
+        self.cache.set("ana.md", "me:main", 7)
+        self.assertIs(
+            find_open_pull(self.repo, "ana.md", "me:main", "main", self.cache),
+            pr,
+        )
+        self.repo.get_pull.assert_called_once_with(7)
+        self.repo.get_pulls.assert_not_called()
+
+    def test_closed_or_missing_cached_pull_falls_back_to_listing(self):
+        self.repo.get_pulls.return_value = []
+        for closed in (
+            _pull(7, "Changed ana.md", "me:main", state="closed"),
+            UnknownObjectException(404),
+        ):
+            self.cache.set("ana.md", "me:main", 7)
+            if isinstance(closed, Exception):
+                self.repo.get_pull.side_effect = closed
+            else:
+                self.repo.get_pull.return_value = closed
+            self.assertIsNone(
+                find_open_pull(
+                    self.repo, "ana.md", "me:main", "main", self.cache
+                )
+            )
+            self.assertIsNone(self.cache.get("ana.md", "me:main"))
+        self.assertEqual(self.repo.get_pulls.call_count, 2)
+
+    def test_other_file_pull_is_not_matched(self):
+        self.repo.get_pulls.return_value = [
+            _pull(3, "Changed beto.md", "me:main")
+        ]
+        self.assertIsNone(
+            find_open_pull(self.repo, "ana.md", "me:main", "main")
+        )
+
+    def test_corrupt_cache_file_starts_empty(self):
+        os.makedirs(os.path.dirname(self.cache.path))
+        with open(self.cache.path, "w") as fd:
+            fd.write("[1, 2")
+        self.assertEqual(PullRequestCache.load(self.cache.path).pulls, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src"))
+)
+import pygit2
+from github.GithubException import (BadCredentialsException,
+                                    UnknownObjectException)
+
+from edit_python_pe.session import SessionCache, is_auth_error
+from edit_python_pe.utils import open_fork
+
+CLONE_URL = "https://github.com/me/python.pe.git"
+
+
+class TestSessionCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = os.path.join(self.tmp.name, "cache", "session.json")
+
+    def test_entry_is_kept_by_token_hash(self):
+        session = SessionCache(self.path)
+        session.remember("secret-token", "me", "me/python.pe", CLONE_URL)
+        session.save()
+
+        with open(self.path, encoding="utf-8") as fd:
+            self.assertNotIn("secret-token", fd.read())
+        self.assertEqual(os.stat(self.path).st_mode & 0o777, 0o600)
+        session = SessionCache.load(self.path)
+        self.assertEqual(session.get("secret-token")["fork"], "me/python.pe")
+        self.assertIsNone(session.get("other-token"))
+        session.discard("secret-token")
+        self.assertIsNone(session.get("secret-token"))
+
+    def test_old_entry_is_ignored(self):
+        session = SessionCache(self.path)
+        with patch("edit_python_pe.session.time", return_value=0):
+            session.remember("token", "me", "me/python.pe", CLONE_URL)
+        self.assertIsNone(session.get("token"))
+
+    def test_corrupt_file_starts_empty(self):
+        os.makedirs(os.path.dirname(self.path))
+        with open(self.path, "w") as fd:
+            fd.write("{")
+        self.assertEqual(SessionCache.load(self.path).sessions, {})
+
+    def test_auth_errors(self):
+        self.assertTrue(
+            is_auth_error(BadCredentialsException(401, "Bad", None))
+        )
+        self.assertTrue(
+            is_auth_error(pygit2.GitError("remote authentication required"))
+        )
+        self.assertFalse(is_auth_error(pygit2.GitError("connection reset")))
+        self.assertFalse(is_auth_error(UnknownObjectException(404)))
+
+
+class TestOpenFork(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.session = SessionCache(os.path.join(self.tmp.name, "s.json"))
+        self.forked_repo = MagicMock()
+        self.forked_repo.owner.login = "me"
+        self.forked_repo.full_name = "me/python.pe"
+        self.forked_repo.clone_url = CLONE_URL
+        for name, target, kwargs in (
+            ("Github", "github.Github", {}),
+            ("connect_repo", "edit_python_pe.utils.connect_repo", {}),
+            (
+                "fork_repo",
+                "edit_python_pe.utils.fork_repo",
+                {"return_value": (self.tmp.name, self.forked_repo)},
+            ),
+        ):
+            patcher = patch(target, **kwargs)
+            setattr(self, name, patcher.start())
+            self.addCleanup(patcher.stop)
+
+    def test_first_launch_validates_and_remembers(self):
+        on_sync = MagicMock()
+        original_repo, repo_path, forked_repo = open_fork(
+            "token", self.session, on_sync
+        )
+        self.assertIs(original_repo, self.connect_repo.return_value)
+        self.assertIs(forked_repo, self.forked_repo)
+        on_sync.assert_called_once()
+        self.assertEqual(self.session.get("token")["login"], "me")
+        self.assertTrue(os.path.exists(self.session.path))
+
+    def test_failed_resume_falls_back_to_full_round(self):
+        self.session.remember("token", "me", "me/gone", CLONE_URL)
+        with patch(
+            "edit_python_pe.utils._checkout_fork",
+            side_effect=pygit2.GitError("unexpected http status code: 404"),
+        ):
+            _, _, forked_repo = open_fork("token", self.session)
+        self.connect_repo.assert_called_once_with("token")
+        self.assertIs(forked_repo, self.forked_repo)
+        self.assertEqual(self.session.get("token")["fork"], "me/python.pe")
+
+    def test_failed_resume_is_saved_before_the_full_round(self):
+        self.session.remember("token", "me", "me/gone", CLONE_URL)
+        self.session.save()
+        self.connect_repo.side_effect = BadCredentialsException(401)
+        with (
+            patch(
+                "edit_python_pe.utils._checkout_fork",
+                side_effect=pygit2.GitError(
+                    "unexpected http status code: 404"
+                ),
+            ),
+            self.assertRaises(BadCredentialsException),
+        ):
+            open_fork("token", self.session)
+        self.assertIsNone(SessionCache.load(self.session.path).get("token"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src"))
+)
+from edit_python_pe import strings
+from edit_python_pe.strings import (BUTTON_QUIT, MESSAGE_SAVE_STAGES,
+                                    LazyString, available_languages,
+                                    get_catalog, get_language,
+                                    language_candidates, set_language)
+
+
+class TestCatalogs(unittest.TestCase):
+    def setUp(self):
+        language = get_language()
+        self.addCleanup(set_language, language)
+        patcher = patch.dict(strings._catalogs, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_catalogs_are_package_resources(self):
+        languages = available_languages()
+        self.assertEqual(languages[0], "en")
+        self.assertIn("es", languages)
+        self.assertEqual(get_catalog("es").gettext("Quit"), "Abandonar")
+
+    def test_catalog_read_once_per_language(self):
+        with patch(
+            "edit_python_pe.strings.gettext.GNUTranslations",
+            wraps=strings.gettext.GNUTranslations,
+        ) as load:
+            first = get_catalog("es")
+            set_language("en")
+            set_language("es")
+            self.assertIs(get_catalog("es"), first)
+        load.assert_called_once()
+
+    def test_regional_locale_falls_back_to_language(self):
+        self.assertEqual(language_candidates("es_PE.UTF-8"), ["es_PE", "es"])
+        self.assertEqual(get_catalog("es_PE").gettext("Quit"), "Abandonar")
+        # Unknown languages show the original text
+        self.assertEqual(get_catalog("xx").gettext("Quit"), "Quit")
+
+
+class TestLazyString(unittest.TestCase):
+    def setUp(self):
+        language = get_language()
+        self.addCleanup(set_language, language)
+
+    def test_follows_the_current_language(self):
+        set_language("en")
+        self.assertEqual(str(BUTTON_QUIT), "Quit")
+        set_language("es")
+        self.assertEqual(str(BUTTON_QUIT), "Abandonar")
+        self.assertEqual(BUTTON_QUIT + "!", "Abandonar!")
+
+    def test_identity_survives_a_language_change(self):
+        set_language("en")
+        labels = {BUTTON_QUIT: "quit"}
+        self.assertEqual(BUTTON_QUIT, "Quit")
+        set_language("es")
+        self.assertEqual(labels[BUTTON_QUIT], "quit")
+        self.assertIn(LazyString("Quit"), labels)
+        self.assertEqual(BUTTON_QUIT, "Quit")
+        self.assertNotEqual(BUTTON_QUIT, "Abandonar")
+
+    def test_formatting_gives_plain_strings(self):
+        set_language("en")
+        message = MESSAGE_SAVE_STAGES["writing"].format(name="Ana")
+        self.assertIs(type(message), str)
+        self.assertEqual(message, "Writing the profile of Ana...")
+        self.assertEqual(LazyString("%(prog)s") % {"prog": "x"}, "x")
+        self.assertEqual(BUTTON_QUIT, LazyString("Quit"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,80 +6,27 @@ from unittest.mock import MagicMock, patch
 sys.path.insert(
     0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src"))
 )
+from helpers import commit_files, make_remote
+
 from edit_python_pe.utils import fork_repo, get_repo
 
 
 class TestUtilityFunctions(unittest.TestCase):
-    def test_create_member_file(self):
-        from unittest.mock import patch
-
-        from edit_python_pe.utils import _create_member_file
-
-        file_content = "Sample member content"
-        current_file = None
-        repo_path = "/fake/repo"
-        aliases = ["alias1"]
-        name = "Test Name"
-        email = "test@email.com"
-        expected_filename_prefix = "alias1-"
-        with patch("edit_python_pe.utils._write_file") as mock_write_file:
-            name_file, file_path = _create_member_file(
-                file_content, current_file, repo_path, aliases, name, email
-            )
-            mock_write_file.assert_called_once_with(file_content, file_path)
-            self.assertTrue(name_file.startswith(expected_filename_prefix))
-            self.assertTrue(name_file.endswith(".md"))
-            self.assertIn("blog/members/", file_path)
-            self.assertTrue(file_path.endswith(name_file))
-
-        # Test with current_file provided
-        current_file = "existing.md"
-        with patch("edit_python_pe.utils._write_file") as mock_write_file:
-            name_file, file_path = _create_member_file(
-                file_content, current_file, repo_path, aliases, name, email
-            )
-            self.assertEqual(name_file, current_file)
-            self.assertTrue(file_path.endswith(current_file))
-            mock_write_file.assert_called_once_with(file_content, file_path)
+    def test_add_authors(self):
+        from edit_python_pe.utils import _add_authors
 
-        name = "Test Name"
-        email = "test@email.com"
-
-    def test_write_authors_file(self):
-        from unittest.mock import patch
-
-        from edit_python_pe.utils import _write_authors_file
-
-        repo_path = "/fake/repo"
         aliases = ["alias1"]
         name = "Test Name"
         email = "test@email.com"
-        file_path = f"{repo_path}/AUTHORS"
-        # Case: author not present, should append
-        with (
-            patch(
-                "edit_python_pe.utils._read_file", return_value=""
-            ) as mock_read_file,
-            patch("edit_python_pe.utils._append_file") as mock_append_file,
-        ):
-            _write_authors_file(repo_path, aliases, name, email)
-            mock_read_file.assert_called_once_with(file_path)
-            mock_append_file.assert_called_once()
-            args, _ = mock_append_file.call_args
-            self.assertIn(name, args[0])
-            self.assertIn(email, args[0])
-
-        # Case: author already present, should not append
-        existing_line = f"\n{name}(alias1) <{email}>"
-        with (
-            patch(
-                "edit_python_pe.utils._read_file", return_value=existing_line
-            ) as mock_read_file,
-            patch("edit_python_pe.utils._append_file") as mock_append_file,
-        ):
-            _write_authors_file(repo_path, aliases, name, email)
-            mock_read_file.assert_called_once_with(file_path)
-            mock_append_file.assert_not_called()
+        # Case: author not present, should be added
+        contents = _add_authors("", [(aliases, name, email)])
+        self.assertIn(name, contents)
+        self.assertIn(email, contents)
+
+        # Case: author already present, contents unchanged
+        self.assertEqual(
+            _add_authors(contents, [(aliases, name, email)]), contents
+        )
 
     def test_get_alias(self):
         from edit_python_pe.utils import _get_alias
@@ -107,21 +54,6 @@ class TestUtilityFunctions(unittest.TestCase):
             mock_open.assert_called_with(file_path, "r", encoding="utf-8")
             self.assertEqual(result, expected_content)
 
-    def test_append_file(self):
-        from edit_python_pe.utils import _append_file
-
-        file_content = "Append this!"
-        file_path = "/tmp/testdir/testfile.txt"
-        with (
-            patch("os.makedirs") as makedirs,
-            patch("builtins.open", MagicMock()) as mock_open,
-        ):
-            _append_file(file_content, file_path)
-            makedirs.assert_called_with("/tmp/testdir", exist_ok=True)
-            mock_open.assert_called_with(file_path, "a", encoding="utf-8")
-            handle = mock_open.return_value.__enter__.return_value
-            handle.write.assert_called_with(file_content)
-
     def test_compute_file_name_alias_used(self):
         from edit_python_pe.utils import _compute_file_name
 
@@ -171,52 +103,34 @@ class TestUtilityFunctions(unittest.TestCase):
             handle = mock_open.return_value.__enter__.return_value
             handle.write.assert_called_with(file_content)
 
-    def test_commit_and_push(self):
-        from edit_python_pe.utils import _commit_and_push
-
-        repo_path = "/fake/repo"
-        token = "fake-token"
-        was_changed = True
-        name_file = "test.md"
-        name = "Test Name"
-        email = "test@email.com"
-        with patch("pygit2.repository.Repository") as RepoMock:
-            repo_instance = RepoMock.return_value
-            repo_instance.index.add = MagicMock()
-            repo_instance.index.write = MagicMock()
-            repo_instance.index.write_tree = MagicMock(return_value="treeid")
-            repo_instance.head_is_unborn = False
-            repo_instance.head = MagicMock()
-            repo_instance.head.target = "commitid"
-            repo_instance.create_commit = MagicMock()
-            repo_instance.remotes = {"origin": MagicMock()}
-            repo_instance.remotes["origin"].push = MagicMock()
-            with (
-                patch("pygit2.Signature") as SignatureMock,
-                patch(
-                    "pygit2.callbacks.RemoteCallbacks"
-                ) as RemoteCallbacksMock,
-            ):
-                SignatureMock.return_value = MagicMock()
-                RemoteCallbacksMock.return_value = MagicMock()
-                commit_msg, repo, remote, callbacks = _commit_and_push(
-                    repo_path,
-                    token,
-                    was_changed,
-                    name_file,
-                    name,
-                    email,
-                )
-                repo_instance.index.add_all.assert_called()
-                repo_instance.index.write.assert_called()
-                repo_instance.create_commit.assert_called()
-                repo_instance.remotes["origin"].push.assert_called()
-                self.assertEqual(commit_msg, f"Changed {name_file}")
+    def test_scan_member_files(self):
+        import tempfile
+
+        from edit_python_pe.utils import scan_member_files
+
+        with tempfile.TemporaryDirectory() as repo_path:
+            members = os.path.join(repo_path, "blog", "members")
+            os.makedirs(os.path.join(members, "nested.md"))
+            for name in [f"m{i}.md" for i in range(7)] + [
+                ".hidden.md",
+                "x.txt",
+            ]:
+                open(os.path.join(members, name), "w").close()
+            batches = list(scan_member_files(repo_path, 2))
+            self.assertEqual([len(b) for b in batches], [2, 4, 1])
+            self.assertEqual(
+                sorted(n for b in batches for n in b),
+                [f"m{i}.md" for i in range(7)],
+            )
+            self.assertEqual(
+                list(scan_member_files(os.path.join(repo_path, "nope"), 2)),
+                [],
+            )
 
 
 class TestGetRepo(unittest.TestCase):
     @patch("edit_python_pe.utils.getpass.getpass", return_value="valid-token")
-    @patch("edit_python_pe.utils.Github")
+    @patch("github.Github")
     def test_get_repo_success(self, mock_github, mock_getpass):
         mock_repo = MagicMock()
         mock_github.return_value.get_repo.return_value = mock_repo
@@ -227,7 +141,7 @@ class TestGetRepo(unittest.TestCase):
     @patch(
         "edit_python_pe.utils.getpass.getpass", return_value="invalid-token"
     )
-    @patch("edit_python_pe.utils.Github")
+    @patch("github.Github")
     def test_get_repo_bad_credentials(self, mock_github, mock_getpass):
         from github.GithubException import BadCredentialsException
 
@@ -238,7 +152,7 @@ class TestGetRepo(unittest.TestCase):
             get_repo()
 
     @patch("edit_python_pe.utils.getpass.getpass", return_value="valid-token")
-    @patch("edit_python_pe.utils.Github")
+    @patch("github.Github")
     def test_get_repo_github_exception(self, mock_github, mock_getpass):
         from github.GithubException import GithubException
 
@@ -268,10 +182,11 @@ class TestForkRepo(unittest.TestCase):
         mock_original_repo = MagicMock()
         mock_original_repo.create_fork.return_value = mock_forked_repo
         token = "fake-token"
-        repo_path = fork_repo(token, mock_original_repo)[0]
+        repo_path = fork_repo(token, mock_original_repo, sparse=False)[0]
         mock_original_repo.create_fork.assert_called_once()
         mock_clone.assert_called_once()
         mock_rmtree.assert_not_called()
+        mock_sleep.assert_not_called()
         call_args = mock_clone.call_args
         self.assertEqual(call_args[0][0], mock_forked_repo.clone_url)
         self.assertEqual(call_args[0][1], repo_path)
@@ -295,8 +210,478 @@ class TestForkRepo(unittest.TestCase):
         mock_original_repo = MagicMock()
         mock_original_repo.create_fork.return_value = mock_forked_repo
         token = "fake-token"
-        repo_path = fork_repo(token, mock_original_repo)[0]
+        repo_path = fork_repo(token, mock_original_repo, sparse=False)[0]
         mock_original_repo.create_fork.assert_called_once()
         mock_rmtree.assert_called_once()
         mock_clone.assert_called_once()
         self.assertEqual(repo_path, "/tmp/testrepo")
+
+
+class TestWaitForFork(unittest.TestCase):
+    def test_existing_fork_returns_immediately(self):
+        from edit_python_pe.utils import _wait_for_fork
+
+        forked_repo = MagicMock()
+        with patch("edit_python_pe.utils.sleep") as mock_sleep:
+            self.assertTrue(_wait_for_fork(forked_repo))
+        forked_repo.get_branch.assert_called_once_with("main")
+        mock_sleep.assert_not_called()
+
+    def test_new_fork_is_polled_with_backoff(self):
+        from github.GithubException import UnknownObjectException
+
+        from edit_python_pe.utils import _wait_for_fork
+
+        forked_repo = MagicMock()
+        forked_repo.get_branch.side_effect = [
+            UnknownObjectException(404, "Not found", None),
+            UnknownObjectException(404, "Not found", None),
+            MagicMock(),
+        ]
+        with patch("edit_python_pe.utils.sleep") as mock_sleep:
+            self.assertTrue(_wait_for_fork(forked_repo, timeout=60))
+        delays = [c.args[0] for c in mock_sleep.call_args_list]
+        self.assertEqual(len(delays), 2)
+        self.assertEqual(delays[1], delays[0] * 2)
+
+    def test_deadline_gives_up(self):
+        from github.GithubException import UnknownObjectException
+
+        from edit_python_pe.utils import _wait_for_fork
+
+        forked_repo = MagicMock()
+        forked_repo.get_branch.side_effect = UnknownObjectException(
+            404, "Not found", None
+        )
+        clock = iter([0.0, 1.0, 3.0, 10.0])
+        with (
+            patch("edit_python_pe.utils.sleep") as mock_sleep,
+            patch(
+                "edit_python_pe.utils.monotonic",
+                side_effect=lambda: next(clock),
+            ),
+        ):
+            self.assertFalse(_wait_for_fork(forked_repo, timeout=5))
+        self.assertEqual(mock_sleep.call_count, 2)
+        self.assertLessEqual(mock_sleep.call_args_list[-1].args[0], 2.0)
+
+    def test_other_errors_are_raised_without_waiting(self):
+        from github.GithubException import (BadCredentialsException,
+                                            RateLimitExceededException)
+
+        from edit_python_pe.utils import _wait_for_fork
+
+        for error in (
+            BadCredentialsException(401, "Bad credentials", None),
+            RateLimitExceededException(403, "Rate limit", None),
+        ):
+            forked_repo = MagicMock()
+            forked_repo.get_branch.side_effect = error
+            with (
+                patch("edit_python_pe.utils.sleep") as mock_sleep,
+                self.assertRaises(type(error)),
+            ):
+                _wait_for_fork(forked_repo, timeout=60)
+            mock_sleep.assert_not_called()
+
+    @patch("edit_python_pe.utils.user_data_dir", return_value="/tmp/testrepo")
+    @patch("edit_python_pe.utils.os.path.exists", return_value=True)
+    @patch("edit_python_pe.utils._open_cached_repo", return_value=None)
+    @patch("edit_python_pe.utils._wait_for_fork", return_value=False)
+    @patch("edit_python_pe.utils.shutil.rmtree")
+    @patch("edit_python_pe.utils.pygit2.clone_repository")
+    def test_fork_repo_exits_when_fork_never_ready(
+        self,
+        mock_clone,
+        mock_rmtree,
+        mock_wait,
+        mock_cached,
+        mock_exists,
+        mock_user_data_dir,
+    ):
+        mock_original_repo = MagicMock()
+        with self.assertRaises(TimeoutError):
+            fork_repo("fake-token", mock_original_repo, sparse=False)
+        # The existing checkout is kept when there is nothing to clone
+        mock_rmtree.assert_not_called()
+        mock_clone.assert_not_called()
+
+
+class TestForkRepoCache(unittest.TestCase):
+    def setUp(self):
+        import tempfile
+
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.remote_path = make_remote(
+            os.path.join(self.tmp.name, "fork.git"),
+            {
+                "AUTHORS": "A(a) <a@x>",
+                "blog/members/a.md": "# A",
+                "docs/index.md": "# Docs",
+            },
+        )
+        self.repo_path = os.path.join(self.tmp.name, "checkout")
+        self.forked_repo = MagicMock()
+        self.forked_repo.clone_url = self.remote_path
+        self.original_repo = MagicMock()
+        self.original_repo.create_fork.return_value = self.forked_repo
+
+    def _fork_repo(self, sparse=False):
+        # The local transport cannot do shallow fetches
+        with (
+            patch(
+                "edit_python_pe.utils.user_data_dir",
+                return_value=self.repo_path,
+            ),
+            patch("edit_python_pe.utils.sleep", return_value=None),
+            patch("edit_python_pe.utils.CLONE_DEPTH", 0),
+        ):
+            return fork_repo("fake-token", self.original_repo, sparse)[0]
+
+    def test_cached_repo_is_fetched_not_recloned(self):
+        import pygit2
+
+        self._fork_repo()
+        commit_files(
+            pygit2.Repository(self.remote_path),
+            {"AUTHORS": "A(a) <a@x>", "blog/members/b.md": "# B"},
+        )
+        stray = os.path.join(self.repo_path, "blog", "members", "stray.md")
+        with open(stray, "w", encoding="utf-8") as fd:
+            fd.write("# Stray")
+
+        with patch(
+            "edit_python_pe.utils.pygit2.clone_repository"
+        ) as mock_clone:
+            repo_path = self._fork_repo()
+            mock_clone.assert_not_called()
+
+        members = sorted(
+            os.listdir(os.path.join(repo_path, "blog", "members"))
+        )
+        self.assertEqual(members, ["b.md"])
+        repo = pygit2.Repository(repo_path)
+        self.assertEqual(repo.head.name, "refs/heads/main")
+        self.assertEqual(
+            repo.head.target,
+            pygit2.Repository(self.remote_path).head.target,
+        )
+
+    def test_cache_for_other_fork_is_recloned(self):
+        import pygit2
+
+        self._fork_repo()
+        other_remote = make_remote(
+            os.path.join(self.tmp.name, "other.git"),
+            {"AUTHORS": "", "blog/members/other.md": "# Other"},
+        )
+        self.forked_repo.clone_url = other_remote
+        repo_path = self._fork_repo()
+        self.assertEqual(
+            pygit2.Repository(repo_path).remotes["origin"].url, other_remote
+        )
+        self.assertEqual(
+            os.listdir(os.path.join(repo_path, "blog", "members")),
+            ["other.md"],
+        )
+
+    def test_failed_fetch_keeps_the_cache(self):
+        import shutil
+
+        import pygit2
+
+        repo_path = self._fork_repo()
+        # A profile saved but never pushed
+        repo = pygit2.Repository(repo_path)
+        repo.branches.local.create("profile/b", repo.head.peel(pygit2.Commit))
+        shutil.rmtree(self.remote_path)
+        with (
+            patch(
+                "edit_python_pe.utils.pygit2.clone_repository"
+            ) as mock_clone,
+            self.assertRaises(pygit2.GitError),
+        ):
+            self._fork_repo()
+        mock_clone.assert_not_called()
+        repo = pygit2.Repository(repo_path)
+        self.assertIn("profile/b", repo.branches.local)
+        self.assertTrue(
+            os.path.exists(os.path.join(repo_path, "blog", "members", "a.md"))
+        )
+
+    def test_corrupt_cache_is_recloned(self):
+        os.makedirs(os.path.join(self.repo_path, ".git"))
+        repo_path = self._fork_repo()
+        self.assertEqual(
+            os.listdir(os.path.join(repo_path, "blog", "members")),
+            ["a.md"],
+        )
+
+    def test_saved_profile_listed_after_sync(self):
+        from edit_python_pe.utils import (create_pr, load_file_into_form,
+                                          pending_member_files,
+                                          scan_member_files)
+
+        repo_path = self._fork_repo()
+        self.forked_repo.owner.login = "me"
+        self.original_repo.get_pulls.return_value = []
+        create_pr(
+            "# B",
+            None,
+            repo_path,
+            self.original_repo,
+            self.forked_repo,
+            "fake-token",
+            ["b"],
+            "B",
+            "b@email.com",
+        )
+        # Reopening checks main out again, removing untracked files
+        repo_path = self._fork_repo()
+
+        listed = [
+            name
+            for batch in scan_member_files(repo_path, 10)
+            for name in batch
+        ]
+        self.assertEqual(listed, ["a.md"])
+        pending = pending_member_files(repo_path)
+        self.assertEqual(len(pending), 1)
+        self.assertTrue(pending[0].startswith("b-"))
+
+        app = MagicMock()
+        app.repo_path = repo_path
+        app.member_index = None
+        app.social_entries.acquire_many.return_value = []
+        app.alias_entries.acquire_many.return_value = []
+        load_file_into_form(app, pending[0])
+        self.assertEqual(app.name_input.value, "B")
+
+    def test_file_names_git_refuses_in_refs_can_be_saved(self):
+        import pygit2
+
+        from edit_python_pe.utils import (_profile_branch, create_pr,
+                                          load_file_into_form,
+                                          pending_member_files)
+
+        repo_path = self._fork_repo()
+        self.forked_repo.owner.login = "me"
+        self.original_repo.get_pulls.return_value = []
+        for current_file, aliases, name in (
+            (None, ["jp: dev"], "JP"),
+            ("Juan Perez.md", [], "Juan"),
+        ):
+            create_pr(
+                f"# {name}",
+                current_file,
+                repo_path,
+                self.original_repo,
+                self.forked_repo,
+                "fake-token",
+                aliases,
+                name,
+                f"{name.lower()}@email.com",
+            )
+        repo_path = self._fork_repo()
+
+        pending = sorted(pending_member_files(repo_path))
+        self.assertEqual(len(pending), 2)
+        self.assertEqual(pending[0], "Juan Perez.md")
+        self.assertTrue(pending[1].startswith("jp:_dev-"))
+        for name_file in pending:
+            self.assertTrue(
+                pygit2.reference_is_valid_name(
+                    f"refs/heads/{_profile_branch(name_file)}"
+                )
+            )
+        app = MagicMock()
+        app.repo_path = repo_path
+        app.member_index = None
+        app.social_entries.acquire_many.return_value = []
+        app.alias_entries.acquire_many.return_value = []
+        load_file_into_form(app, pending[1])
+        self.assertEqual(app.name_input.value, "JP")
+
+    def test_sparse_clone_checks_out_member_paths_only(self):
+        repo_path = self._fork_repo(sparse=True)
+        self.assertEqual(
+            sorted(os.listdir(repo_path)), [".git", "AUTHORS", "blog"]
+        )
+        self.assertEqual(
+            os.listdir(os.path.join(repo_path, "blog", "members")),
+            ["a.md"],
+        )
+
+    def test_sparse_commit_keeps_full_tree(self):
+        import pygit2
+
+        from edit_python_pe.utils import _commit_files, _push
+
+        repo_path = self._fork_repo(sparse=True)
+        ref_name = _commit_files(
+            repo_path,
+            {"blog/members/b.md": "# B"},
+            "B",
+            "b@email.com",
+            "Added b.md",
+        )
+        _push(repo_path, "fake-token", [ref_name])
+
+        remote = pygit2.Repository(self.remote_path)
+        tree = remote.head.peel(pygit2.Commit).tree
+        self.assertIn("docs/index.md", tree)
+        self.assertIn("blog/members/a.md", tree)
+        self.assertIn("blog/members/b.md", tree)
+
+    def test_commit_is_built_from_head_tree(self):
+        import pygit2
+
+        from edit_python_pe.utils import _commit_files, _push
+
+        repo_path = self._fork_repo()
+        repo = pygit2.Repository(repo_path)
+        old_tree = repo.head.peel(pygit2.Commit).tree
+        members = os.path.join(repo_path, "blog", "members")
+        with open(os.path.join(members, "stray.md"), "w") as fd:
+            fd.write("# Stray")
+        with open(os.path.join(repo_path, "AUTHORS"), "w") as fd:
+            fd.write("edited on disk")
+
+        ref_name = _commit_files(
+            repo_path,
+            {"blog/members/b.md": "# B"},
+            "B",
+            "b@email.com",
+            "Added b.md",
+            authors=[(["b"], "B", "b@email.com"), (["a"], "A", "a@x")],
+        )
+        _push(repo_path, "fake-token", [ref_name])
+
+        tree = (
+            pygit2.Repository(self.remote_path).head.peel(pygit2.Commit).tree
+        )
+        self.assertNotIn("blog/members/stray.md", tree)
+        self.assertEqual(tree["docs"].id, old_tree["docs"].id)
+        self.assertEqual(
+            tree["blog/members/a.md"].id, old_tree["blog/members/a.md"].id
+        )
+        self.assertEqual(
+            tree["AUTHORS"].data.decode(), "A(a) <a@x>\nB(b) <b@email.com>"
+        )
+        # The checkout and index follow the commit for the changed paths
+        with open(os.path.join(members, "b.md")) as fd:
+            self.assertEqual(fd.read(), "# B")
+        status = repo.status()
+        self.assertEqual(
+            status, {"blog/members/stray.md": pygit2.GIT_STATUS_WT_NEW}
+        )
+
+
+class TestProfileBranches(unittest.TestCase):
+    def setUp(self):
+        import tempfile
+
+        import pygit2
+
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        remote_path = make_remote(
+            os.path.join(self.tmp.name, "fork.git"),
+            {"AUTHORS": "A(a) <a@x>", "blog/members/a.md": "# A"},
+        )
+        self.remote = pygit2.Repository(remote_path)
+        self.main_id = self.remote.head.target
+        self.repo_path = os.path.join(self.tmp.name, "checkout")
+        pygit2.clone_repository(remote_path, self.repo_path)
+        self.forked_repo = MagicMock()
+        self.forked_repo.owner.login = "me"
+        self.original_repo = MagicMock()
+        self.original_repo.get_pulls.return_value = []
+
+    def _branch_commit(self, branch: str):
+        import pygit2
+
+        return self.remote.references[f"refs/heads/{branch}"].peel(
+            pygit2.Commit
+        )
+
+    def test_create_pr_commits_on_a_profile_branch(self):
+        from edit_python_pe.utils import create_pr
+
+        message = create_pr(
+            "# B",
+            "b-1234.md",
+            self.repo_path,
+            self.original_repo,
+            self.forked_repo,
+            "fake-token",
+            ["b"],
+            "B",
+            "b@email.com",
+        )
+        self.assertIn("b-1234.md", message)
+        commit = self._branch_commit("profile/b-1234")
+        self.assertEqual(commit.parents[0].id, self.main_id)
+        self.assertEqual(commit.tree["blog/members/b-1234.md"].data, b"# B")
+        self.assertEqual(
+            commit.tree["AUTHORS"].data, b"A(a) <a@x>\nB(b) <b@email.com>"
+        )
+        # The fork's main is left alone for other profiles to branch from
+        self.assertEqual(self.remote.head.target, self.main_id)
+        self.original_repo.get_pulls.assert_called_once_with(
+            state="open", head="me:profile/b-1234", base="main"
+        )
+        kwargs = self.original_repo.create_pull.call_args.kwargs
+        self.assertEqual(kwargs["head"], "me:profile/b-1234")
+        self.assertEqual(kwargs["title"], "Changed b-1234.md")
+
+        # A second edit stacks on the branch and reuses the open PR
+        pr = MagicMock()
+        pr.title = "Changed b-1234.md"
+        self.original_repo.get_pulls.return_value = [pr]
+        first = commit.id
+        create_pr(
+            "# B2",
+            "b-1234.md",
+            self.repo_path,
+            self.original_repo,
+            self.forked_repo,
+            "fake-token",
+            ["b"],
+            "B",
+            "b@email.com",
+        )
+        commit = self._branch_commit("profile/b-1234")
+        self.assertEqual(commit.parents[0].id, first)
+        self.assertEqual(commit.tree["blog/members/b-1234.md"].data, b"# B2")
+        self.original_repo.create_pull.assert_called_once()
+
+    def test_create_prs_pushes_each_profile_branch(self):
+        from edit_python_pe.utils import ProfileChange, create_prs
+
+        changes = [
+            ProfileChange(f"m{i}-0000.md", f"# M{i}", False, [], f"M{i}", "")
+            for i in range(5)
+        ]
+        messages = create_prs(
+            changes,
+            self.repo_path,
+            self.original_repo,
+            self.forked_repo,
+            "fake-token",
+            max_workers=3,
+        )
+        self.assertEqual(len(messages), 5)
+        for i, message in enumerate(messages):
+            self.assertIn(f"m{i}-0000.md", message)
+            commit = self._branch_commit(f"profile/m{i}-0000")
+            self.assertEqual(commit.parents[0].id, self.main_id)
+            members = [entry.name for entry in commit.tree / "blog/members"]
+            self.assertEqual(sorted(members), ["a.md", f"m{i}-0000.md"])
+        heads = sorted(
+            call.kwargs["head"]
+            for call in self.original_repo.create_pull.call_args_list
+        )
+        self.assertEqual(heads, [f"me:profile/m{i}-0000" for i in range(5)])
+        self.assertEqual(self.remote.head.target, self.main_id)